@@ -0,0 +1,111 @@
+-- conversation_state delta writes
+-- Applies set / unset / append_unique / ensure_object ops to conversation_data in place, so the
+-- agent sends only what changed instead of the whole accumulated document.
+-- Called from equity_connect/services/conversation_state.py (apply_conversation_delta)
+--
+-- p_ops example:
+--   [{"op": "set", "path": ["verified"], "value": true},
+--    {"op": "unset", "path": ["wrong_person"]},
+--    {"op": "append_unique", "path": ["topics"], "value": ["spouse"]},
+--    {"op": "ensure_object", "path": ["quote"]}]
+-- p_fields: top-level column overwrites, e.g. {"lead_id": "...", "qualified": true}. Every
+-- key must name a column other than id / conversation_data; anything else raises rather
+-- than being dropped (the LocalClient mirror applies the same rule)
+
+CREATE OR REPLACE FUNCTION public.apply_conversation_delta(
+	p_phone_candidates text[],
+	p_ops jsonb DEFAULT '[]'::jsonb,
+	p_fields jsonb DEFAULT '{}'::jsonb
+)
+RETURNS SETOF public.conversation_state AS $$
+DECLARE
+	v_row public.conversation_state;
+	v_data jsonb;
+	v_op jsonb;
+	v_path text[];
+	v_current jsonb;
+	v_value jsonb;
+	v_set text;
+	i int;
+BEGIN
+	SELECT * INTO v_row
+	FROM public.conversation_state
+	WHERE phone_number = ANY(p_phone_candidates)
+	ORDER BY updated_at DESC
+	LIMIT 1
+	FOR UPDATE;
+
+	IF NOT FOUND THEN
+		RETURN;
+	END IF;
+
+	v_data := COALESCE(v_row.conversation_data, '{}'::jsonb);
+
+	FOR v_op IN SELECT * FROM jsonb_array_elements(COALESCE(p_ops, '[]'::jsonb)) LOOP
+		v_path := ARRAY(SELECT jsonb_array_elements_text(v_op->'path'));
+		IF COALESCE(array_length(v_path, 1), 0) = 0 THEN
+			RAISE EXCEPTION 'apply_conversation_delta: op without path: %', v_op;
+		END IF;
+
+		IF v_op->>'op' = 'unset' THEN
+			-- Nothing to remove when the parent is missing or not an object
+			IF array_length(v_path, 1) = 1
+				OR jsonb_typeof(v_data #> v_path[1:array_length(v_path, 1) - 1]) = 'object' THEN
+				v_data := v_data #- v_path;
+			END IF;
+			CONTINUE;
+		ELSIF v_op->>'op' NOT IN ('set', 'append_unique', 'ensure_object') THEN
+			RAISE EXCEPTION 'apply_conversation_delta: unknown op %', v_op->>'op';
+		END IF;
+
+		-- jsonb_set only creates the last path element; make every parent an object
+		-- (ensure_object applies the same rule to the target itself)
+		FOR i IN 1 .. array_length(v_path, 1) - CASE WHEN v_op->>'op' = 'ensure_object' THEN 0 ELSE 1 END LOOP
+			IF jsonb_typeof(v_data #> v_path[1:i]) IS DISTINCT FROM 'object' THEN
+				v_data := jsonb_set(v_data, v_path[1:i], '{}'::jsonb, true);
+			END IF;
+		END LOOP;
+
+		IF v_op->>'op' = 'ensure_object' THEN
+			CONTINUE;
+		END IF;
+
+		v_value := v_op->'value';
+		v_current := v_data #> v_path;
+
+		IF v_op->>'op' = 'append_unique'
+			AND jsonb_typeof(v_current) = 'array'
+			AND jsonb_typeof(v_value) = 'array' THEN
+			-- First occurrence wins across existing + incoming (exact jsonb equality), so
+			-- duplicates already in the stored array collapse too - same as _append_unique
+			SELECT COALESCE(jsonb_agg(elem ORDER BY ord), '[]'::jsonb)
+			INTO v_value
+			FROM (
+				SELECT DISTINCT ON (elem) elem, ord
+				FROM jsonb_array_elements(v_current || v_value) WITH ORDINALITY AS combined(elem, ord)
+				ORDER BY elem, ord
+			) AS unique_values;
+		END IF;
+
+		v_data := jsonb_set(v_data, v_path, COALESCE(v_value, 'null'::jsonb), true);
+	END LOOP;
+
+	-- Top-level overwrites: every column named in p_fields, nothing else. A key that is
+	-- not a column fails in the EXECUTE below ("column ... not found in data type")
+	IF COALESCE(p_fields, '{}'::jsonb) ?| ARRAY['id', 'conversation_data'] THEN
+		RAISE EXCEPTION 'apply_conversation_delta: p_fields cannot set id or conversation_data';
+	END IF;
+	v_row := jsonb_populate_record(v_row, COALESCE(p_fields, '{}'::jsonb));
+	SELECT string_agg(format('%I = ($1).%I', key, key), ', ')
+	INTO v_set
+	FROM jsonb_object_keys(COALESCE(p_fields, '{}'::jsonb)) AS key;
+
+	RETURN QUERY EXECUTE format(
+		'UPDATE public.conversation_state SET %s conversation_data = $2 WHERE id = $3 RETURNING *',
+		COALESCE(v_set || ',', '')
+	) USING v_row, v_data, v_row.id;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION public.apply_conversation_delta(text[], jsonb, jsonb) IS
+	'Apply set/unset/append_unique/ensure_object ops to conversation_data (plus top-level overwrites) for the row matching any phone candidate';
@@ -0,0 +1,4 @@
+-- Rollback: Remove apply_conversation_delta function
+-- The agent falls back to fetch + merge + full conversation_data writes when it is missing
+
+DROP FUNCTION IF EXISTS public.apply_conversation_delta(text[], jsonb, jsonb);
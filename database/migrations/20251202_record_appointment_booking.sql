@@ -0,0 +1,56 @@
+-- Appointment booking records in one transaction
+-- After the Nylas event exists, book_appointment_core writes the appointment interaction,
+-- moves the lead to appointment_set, adds the billing event and flags conversation_state
+-- in a single round trip. Either everything is recorded or nothing is.
+-- Called from equity_connect/services/calendar_service.py (_record_booking)
+--
+-- Idempotent on p_interaction_id: a retry after a timeout finds the interaction already
+-- written and returns without touching the other tables.
+-- Requires public.apply_conversation_delta (20251201_conversation_state_delta.sql).
+
+CREATE OR REPLACE FUNCTION public.record_appointment_booking(
+	p_interaction_id uuid,
+	p_lead_id uuid,
+	p_broker_id uuid,
+	p_scheduled_for timestamptz,
+	p_content text,
+	p_metadata jsonb DEFAULT '{}'::jsonb,
+	p_billing_amount numeric DEFAULT 50,
+	p_billing_metadata jsonb DEFAULT '{}'::jsonb,
+	p_phone_candidates text[] DEFAULT '{}'::text[],
+	p_conversation_ops jsonb DEFAULT '[]'::jsonb
+)
+RETURNS uuid AS $$
+BEGIN
+	INSERT INTO public.interactions (
+		id, lead_id, broker_id, type, direction, content, outcome, scheduled_for, metadata
+	) VALUES (
+		p_interaction_id, p_lead_id, p_broker_id, 'appointment', 'outbound', p_content,
+		'appointment_booked', p_scheduled_for, COALESCE(p_metadata, '{}'::jsonb)
+	)
+	ON CONFLICT (id) DO NOTHING;
+
+	IF NOT FOUND THEN
+		-- Already recorded by an earlier attempt
+		RETURN p_interaction_id;
+	END IF;
+
+	UPDATE public.leads SET
+		status = 'appointment_set',
+		last_engagement = NOW()
+	WHERE id = p_lead_id;
+
+	INSERT INTO public.billing_events (broker_id, lead_id, event_type, amount, status, metadata)
+	VALUES (p_broker_id, p_lead_id, 'appointment_set', p_billing_amount, 'pending', COALESCE(p_billing_metadata, '{}'::jsonb));
+
+	IF COALESCE(array_length(p_phone_candidates, 1), 0) > 0
+		AND jsonb_array_length(COALESCE(p_conversation_ops, '[]'::jsonb)) > 0 THEN
+		PERFORM 1 FROM public.apply_conversation_delta(p_phone_candidates, p_conversation_ops, '{}'::jsonb);
+	END IF;
+
+	RETURN p_interaction_id;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION public.record_appointment_booking(uuid, uuid, uuid, timestamptz, text, jsonb, numeric, jsonb, text[], jsonb) IS
+	'Record a booked appointment (interaction, lead status, billing event, conversation_state flags) atomically; idempotent on p_interaction_id';
@@ -0,0 +1,4 @@
+-- Rollback: Remove record_appointment_booking function
+-- The agent falls back to queueing the interaction, lead and billing writes separately when it is missing
+
+DROP FUNCTION IF EXISTS public.record_appointment_booking(uuid, uuid, uuid, timestamptz, text, jsonb, numeric, jsonb, text[], jsonb);
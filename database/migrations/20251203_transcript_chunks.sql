@@ -0,0 +1,25 @@
+-- transcript_chunks: transcript checkpoints written while a call is in progress
+-- The agent appends new messages in chunks (equity_connect/services/transcripts.py,
+-- TranscriptBuffer) so a partial transcript survives a crash mid-call. Chunks are upserted
+-- on (call_id, seq), so a process that restarts mid-call rewrites them from position 0.
+-- When the call ends, on_summary stitches the chunks into interactions.transcript and
+-- deletes them.
+-- Rows left behind belong to calls that never finished cleanly.
+-- Idempotent: uses IF NOT EXISTS
+
+CREATE TABLE IF NOT EXISTS public.transcript_chunks (
+	id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+	call_id text NOT NULL,
+	seq int NOT NULL,          -- position of the chunk's first message in the call log
+	messages jsonb NOT NULL,   -- columnar transcript document (format columnar-v1)
+	created_at timestamptz DEFAULT now(),
+	UNIQUE (call_id, seq)
+);
+
+CREATE INDEX IF NOT EXISTS idx_transcript_chunks_created_at ON public.transcript_chunks(created_at);
+
+-- Service role only (the agent); no portal access
+ALTER TABLE public.transcript_chunks ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE public.transcript_chunks IS
+	'In-progress call transcript chunks; stitched into interactions.transcript and deleted when the call is summarized';
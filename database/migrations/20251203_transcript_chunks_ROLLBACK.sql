@@ -0,0 +1,4 @@
+-- Rollback: Remove transcript_chunks table
+-- Chunks still pending in the agent outbox will fail and be marked dead
+
+DROP TABLE IF EXISTS public.transcript_chunks;
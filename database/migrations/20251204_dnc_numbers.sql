@@ -0,0 +1,40 @@
+-- dnc_numbers: Do-Not-Call and known-litigator phone numbers
+-- Filled from SwarmTrace dnc_litigator_scrub flags (lead import) and uploaded lists
+-- (scripts/upload_dnc_list.py). The agent keeps the whole table in memory
+-- (equity_connect/services/dnc_index.py), so check_consent_dnc and the lead import
+-- screen numbers without a query per call. It loads through dnc_numbers_export
+-- (one row per list type, numbers packed into one string) and afterwards only
+-- fetches rows with a higher id than it has seen, hence the identity id.
+-- Idempotent: uses IF NOT EXISTS / CREATE OR REPLACE
+
+CREATE TABLE IF NOT EXISTS public.dnc_numbers (
+	id bigint GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+	phone_number text NOT NULL CHECK (phone_number ~ '^[0-9]{10}$'),   -- last 10 digits
+	list_type text NOT NULL CHECK (list_type IN ('dnc', 'litigator')),
+	source text,                                                         -- e.g. swarmtrace, federal_dnc, internal
+	created_at timestamptz DEFAULT now(),
+	UNIQUE (phone_number, list_type)
+);
+
+-- Service role only (agent, import scripts); no portal access
+ALTER TABLE public.dnc_numbers ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE public.dnc_numbers IS
+	'Do-Not-Call / litigator numbers (10 digits) loaded into the agent''s in-memory DNC index';
+
+CREATE OR REPLACE FUNCTION public.dnc_numbers_export(p_after_id bigint DEFAULT 0)
+RETURNS TABLE(list_type text, numbers text, max_id bigint)
+LANGUAGE sql
+STABLE
+AS $$
+	SELECT
+		d.list_type,
+		string_agg(d.phone_number, '' ORDER BY d.phone_number COLLATE "C"),
+		max(d.id)
+	FROM public.dnc_numbers d
+	WHERE d.id > p_after_id
+	GROUP BY d.list_type;
+$$;
+
+COMMENT ON FUNCTION public.dnc_numbers_export(bigint) IS
+	'DNC index load: per list type, the sorted 10-digit numbers with id > p_after_id concatenated, and the highest id';
@@ -0,0 +1,5 @@
+-- Rollback: Remove dnc_numbers table and its export function
+-- check_consent_dnc then fails closed (can_call false) until the agent is rolled back too
+
+DROP FUNCTION IF EXISTS public.dnc_numbers_export(bigint);
+DROP TABLE IF EXISTS public.dnc_numbers;
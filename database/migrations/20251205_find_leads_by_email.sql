@@ -0,0 +1,26 @@
+-- Case-insensitive lead lookup by email for the SwarmTrace lead import
+-- import_skip_trace_results (equity_connect/services/lead_import.py) normalizes emails to
+-- trimmed lower case; PostgREST's `in` filter is case-sensitive, so a lead stored as
+-- John@Example.com would not match and would be inserted again. This compares on
+-- lower(btrim(primary_email)) instead, backed by an expression index.
+-- Idempotent: uses IF NOT EXISTS / CREATE OR REPLACE
+
+CREATE INDEX IF NOT EXISTS idx_leads_primary_email_lower ON public.leads (lower(btrim(primary_email)));
+
+CREATE OR REPLACE FUNCTION public.find_leads_by_email(p_emails text[])
+RETURNS TABLE (
+	id uuid,
+	first_name text,
+	last_name text,
+	primary_email text,
+	primary_phone text,
+	primary_phone_e164 text
+) AS $$
+	SELECT l.id, l.first_name::text, l.last_name::text, l.primary_email::text,
+		l.primary_phone::text, l.primary_phone_e164::text
+	FROM public.leads l
+	WHERE lower(btrim(l.primary_email)) = ANY (p_emails);
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION public.find_leads_by_email(text[]) IS
+	'Leads whose primary_email matches one of p_emails (already trimmed + lower-cased), ignoring case';
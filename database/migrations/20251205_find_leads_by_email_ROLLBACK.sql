@@ -0,0 +1,5 @@
+-- Rollback: Remove find_leads_by_email function and its index
+-- The lead import's email matching fails until the agent is rolled back too
+
+DROP FUNCTION IF EXISTS public.find_leads_by_email(text[]);
+DROP INDEX IF EXISTS public.idx_leads_primary_email_lower;
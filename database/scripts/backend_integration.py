@@ -298,25 +298,19 @@ class StepCriteriaGenerator:
 from fastapi import APIRouter, Depends
 from openai import OpenAI
 from database.scripts.backend_integration import StepCriteriaGenerator
+from equity_connect.services.supabase import get_supabase_client
 
 router = APIRouter()
 
 def get_openai_client():
     return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-def get_supabase_client():
-    from supabase import create_client
-    return create_client(
-        os.getenv("SUPABASE_URL"),
-        os.getenv("SUPABASE_KEY")
-    )
-
 @router.post("/api/verticals/{vertical}")
 async def save_vertical(
     vertical: str,
     data: dict,
     openai_client: OpenAI = Depends(get_openai_client),
-    supabase_client = Depends(get_supabase_client)
+    supabase_client = Depends(lambda: get_supabase_client("background"))
 ):
     '''
     Save vertical configuration with automatic step_criteria generation.
@@ -360,6 +354,7 @@ async def save_vertical(
 from flask import Blueprint, request, jsonify
 from openai import OpenAI
 from database.scripts.backend_integration import StepCriteriaGenerator
+from equity_connect.services.supabase import get_supabase_client
 
 verticals_bp = Blueprint('verticals', __name__)
 
@@ -373,7 +368,7 @@ async def save_vertical(vertical):
         
         # Initialize clients
         openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        supabase_client = get_supabase_client()
+        supabase_client = get_supabase_client("background")
         
         # Initialize generator
         generator = StepCriteriaGenerator(openai_client, supabase_client)
@@ -2,24 +2,30 @@
 import os
 import logging
 import json
+import threading
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Callable
 from contextvars import ContextVar
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from signalwire_agents import AgentBase, ContextBuilder  # type: ignore
 from signalwire_agents.core.function_result import SwaigFunctionResult  # type: ignore
-from equity_connect.services.agent_config import get_agent_params
+from equity_connect.services.agent_config import get_agent_params, get_voice_config
 from equity_connect.services import (
 	lead_service,
 	calendar_service,
 	knowledge_service,
 	interaction_service,
 )
+from equity_connect.services import startup, verticals
 from equity_connect.services.contexts_builder import build_contexts_object
 from equity_connect.services.conversation_state import get_conversation_state
+from equity_connect.services.transcripts import call_log_messages, encode_transcript, get_transcript_buffer
 
 logger = logging.getLogger(__name__)
 
+# global_data keys on_swml_request sets for the caller (kept when serving another vertical)
+CALL_GLOBAL_DATA_KEYS = ("lead", "broker", "status", "is_new_caller")
+
 
 class BarbaraAgent(AgentBase):
 	"""Barbara - Conversational AI agent for reverse mortgage lead qualification
@@ -39,24 +45,19 @@ class BarbaraAgent(AgentBase):
 			logger.error(error_msg)
 			raise ValueError(error_msg)
 		
-		# Apply agent parameters (timeouts, etc.)
-		agent_params = get_agent_params(vertical="reverse_mortgage", language="en-US")
+		# Fetch agent params, contexts and voice config concurrently (independent DB reads)
+		# for the default vertical; other verticals are applied per call (see _render_swml)
+		initial_context = verticals.INITIAL_CONTEXT
+		vertical, language = verticals.DEFAULT_VERTICAL, verticals.DEFAULT_LANGUAGE
+		startup_config = startup.fetch_parallel({
+			"agent_params": lambda: get_agent_params(vertical=vertical, language=language),
+			"contexts": lambda: build_contexts_object(vertical=vertical, initial_context=initial_context),
+			"voice_config": lambda: self._get_voice_config(vertical=vertical, language_code=language),
+		})
 		
-		# Build options dictionary for AgentBase
+		# Apply agent parameters (timeouts, etc.)
 		# These are passed to the underlying SWML configuration
-		agent_options = {
-			"attention_timeout": agent_params.get("attention_timeout", 8000),
-			"end_of_speech_timeout": agent_params.get("end_of_speech_timeout", 800),
-		}
-		
-		if agent_params.get("attention_timeout_prompt"):
-			agent_options["attention_timeout_prompt"] = agent_params["attention_timeout_prompt"]
-			
-		if agent_params.get("hard_stop_time"):
-			agent_options["hard_stop_time"] = agent_params["hard_stop_time"]
-			
-		if agent_params.get("hard_stop_prompt"):
-			agent_options["hard_stop_prompt"] = agent_params["hard_stop_prompt"]
+		agent_options = self._agent_options(startup_config["agent_params"])
 		
 		super().__init__(
 			name="barbara-agent",
@@ -82,35 +83,18 @@ class BarbaraAgent(AgentBase):
 		self.set_web_hook_url("https://barbara-agent.fly.dev/swaig")
 		self.set_post_prompt_url("https://barbara-agent.fly.dev/post_prompt")
 		
-		# DYNAMIC CONFIG: DISABLED to prevent recursion loop
-		# self.set_dynamic_config_callback(self.configure_per_call)
-		logger.info("✅ Dynamic config callback DISABLED - loading contexts statically from DB")
+		# DYNAMIC CONFIG: still DISABLED - the SDK would build an ephemeral copy of the
+		# agent for every SWAIG call too. Only the SWML render for another vertical's
+		# number goes through a copy (see _render_swml); the default vertical stays static
+		self._compiled_verticals: Dict[str, Dict[str, Any]] = {}
+		self._vertical_lock = threading.Lock()
+		logger.info(f"✅ Contexts loaded statically for {vertical}; other verticals routed per call")
 		
 		# Static configuration (applied once at initialization)
 		
-		# Global data defaults (company info)
-		self.set_global_data({
-			"company_name": "Barbara AI",
-			"service_type": "Reverse Mortgage Assistance",
-			"service_vertical": "Reverse Mortgage / HECM",
-			"business_hours": "9 AM - 5 PM Pacific Time",
-			"coverage_area": "California",
-			"conversation_system": "BarbGraph 8-node routing"
-		})
-		
-		# Speech recognition hints for domain-specific terms
-		self.add_hints([
-			"reverse mortgage",
-			"HECM",
-			"home equity conversion",
-			"FHA",
-			"equity",
-			"lien",
-			"borrower",
-			"non-borrowing spouse",
-			"Barbara",
-			"EquityConnect"
-		])
+		# Global data defaults (company info) and speech recognition hints for domain-specific terms
+		self.set_global_data(verticals.vertical_global_data(vertical))
+		self.add_hints(verticals.vertical_hints(vertical))
 		
 		# Pronunciation rules for acronyms
 		self.add_pronunciation("HECM", "H E C M", ignore_case=False)
@@ -124,22 +108,13 @@ class BarbaraAgent(AgentBase):
 		
 		try:
 			logger.info("🏗️  Building contexts from database...")
-			# Build contexts object for default vertical
-			initial_context = "greet"
+			# Contexts object for default vertical (fetched above)
 			logger.info(f"📍 [INITIAL CONTEXT] {initial_context}")
-			contexts_obj = build_contexts_object(vertical="reverse_mortgage", initial_context=initial_context)
+			contexts_obj = startup_config["contexts"]
+			if isinstance(contexts_obj, Exception):
+				raise contexts_obj
 			self._current_context = initial_context
-			
-			# TRAP STRATEGY: Force 'answer' context to NOT route to exit/goodbye automatically.
-			# This forces the agent to wait for user input and use a Tool to transition.
-			if "answer" in contexts_obj:
-				# Remove exit paths from valid_contexts
-				current_valid = contexts_obj["answer"].get("valid_contexts", [])
-				contexts_obj["answer"]["valid_contexts"] = [
-					ctx for ctx in current_valid 
-					if ctx not in ["goodbye", "end", "exit"]
-				]
-				logger.info(f"🔒 TRAP APPLIED: Restricted 'answer' context routing to: {contexts_obj['answer']['valid_contexts']}")
+			contexts_obj = self._prepare_contexts(contexts_obj)
 			
 			# Apply contexts using builder API
 			self._apply_contexts_via_builder(self, contexts_obj)
@@ -157,16 +132,9 @@ class BarbaraAgent(AgentBase):
 		# Voice configuration (Default fallback)
 		# We use defaults here; per-call voice customization would require dynamic config
 		# or handling in on_swml_request if possible.
-		voice_config = self._get_voice_config(vertical="reverse_mortgage", language_code="en-US")
-		voice_string = self._build_voice_string(voice_config["engine"], voice_config["voice_name"])
-		
-		self.add_language(
-			name=voice_config.get("language_name", "English"),
-			code=voice_config.get("language_code", "en-US"),
-			voice=voice_string,
-			engine=voice_config["engine"]
-		)
-		logger.info(f"✅ Voice set to {voice_string}")
+		language_config = self._language_config(startup_config["voice_config"])
+		self.add_language(**language_config)
+		logger.info(f"✅ Voice set to {language_config['voice']}")
 		
 		# Pattern hints
 		self.add_pattern_hint(
@@ -208,6 +176,20 @@ List specific actions needed based on conversation outcome.
 		self._reset_test_state()
 		
 		logger.info("[OK] BarbaraAgent initialized in STABLE mode (Static Contexts + Dynamic Data)")
+		
+		# Open Supabase/Nylas/Vertex connections; /healthz reports ready once done
+		startup.warm_up_in_background()
+	
+	@property
+	def _app(self):
+		return self.__dict__.get("_fastapi_app")
+	
+	@_app.setter
+	def _app(self, app):
+		# The SDK builds its FastAPI app lazily inside serve()/get_app(); hook in /healthz
+		if app is not None:
+			startup.install_health_routes(app)
+		self.__dict__["_fastapi_app"] = app
 	
 	def _execute_with_timeout(self, func: Callable, timeout_seconds: float, *args, **kwargs):
 		"""Execute a blocking function with timeout protection to prevent call hangups."""
@@ -235,8 +217,10 @@ List specific actions needed based on conversation outcome.
 		
 		CRITICAL: Uses builder API exclusively - no custom dict returns
 		"""
-		contexts_builder = agent_instance.define_contexts()
-		
+		self._fill_contexts(agent_instance.define_contexts(), contexts_data)
+	
+	def _fill_contexts(self, contexts_builder: ContextBuilder, contexts_data: Dict[str, Any]) -> None:
+		"""Add every context/step from build_contexts_object() output to a ContextBuilder"""
 		for ctx_name, ctx_config in contexts_data.items():
 			if not ctx_config:
 				continue
@@ -291,25 +275,114 @@ List specific actions needed based on conversation outcome.
 				# NOTE: 'skip_user_turn' and 'on_step_change' are not supported in the public Step API
 				# Removing them to prevent AttributeError.
 
-	def _get_voice_config(self, vertical: str = "reverse_mortgage", language_code: str = "en-US") -> Dict[str, Any]:
-		"""Load voice configuration from database"""
-		from equity_connect.services.supabase import get_supabase_client
+	@staticmethod
+	def _prepare_contexts(contexts_obj: Dict[str, Any]) -> Dict[str, Any]:
+		"""Apply agent-side context tweaks without mutating the (cached) input"""
+		# TRAP STRATEGY: Force 'answer' context to NOT route to exit/goodbye automatically.
+		# This forces the agent to wait for user input and use a Tool to transition.
+		if "answer" in contexts_obj:
+			# Remove exit paths from valid_contexts
+			current_valid = contexts_obj["answer"].get("valid_contexts", [])
+			contexts_obj = dict(contexts_obj)
+			contexts_obj["answer"] = dict(contexts_obj["answer"], valid_contexts=[
+				ctx for ctx in current_valid
+				if ctx not in ["goodbye", "end", "exit"]
+			])
+			logger.info(f"🔒 TRAP APPLIED: Restricted 'answer' context routing to: {contexts_obj['answer']['valid_contexts']}")
+		return contexts_obj
+	
+	@staticmethod
+	def _agent_options(agent_params: Dict[str, Any]) -> Dict[str, Any]:
+		"""AI params (timeouts, prompts) from an agent_params row"""
+		agent_options = {
+			"attention_timeout": agent_params.get("attention_timeout", 8000),
+			"end_of_speech_timeout": agent_params.get("end_of_speech_timeout", 800),
+		}
+		for key in ("attention_timeout_prompt", "hard_stop_time", "hard_stop_prompt"):
+			if agent_params.get(key):
+				agent_options[key] = agent_params[key]
+		# Include the conversation so far in every SWAIG request so the transcript
+		# can be checkpointed during the call (see services/transcripts.py)
+		agent_options["swaig_post_conversation"] = True
+		return agent_options
+	
+	def _language_config(self, voice_config: Dict[str, Any]) -> Dict[str, Any]:
+		"""add_language() kwargs for a voice config"""
+		return {
+			"name": voice_config.get("language_name", "English"),
+			"code": voice_config.get("language_code", "en-US"),
+			"voice": self._build_voice_string(voice_config["engine"], voice_config["voice_name"]),
+			"engine": voice_config["engine"],
+		}
+	
+	def _compiled_vertical(self, vertical: str) -> Optional[Dict[str, Any]]:
+		"""Contexts builder, params and language for a routed vertical (compiled once per profile load)"""
+		profile = verticals.get_vertical_profile(vertical)
+		if profile is None:
+			return None
+		with self._vertical_lock:
+			compiled = self._compiled_verticals.get(vertical)
+			if compiled is None or compiled["profile"] is not profile:
+				contexts_builder = ContextBuilder(self)
+				self._fill_contexts(contexts_builder, self._prepare_contexts(profile.contexts))
+				compiled = self._compiled_verticals[vertical] = {
+					"profile": profile,
+					"contexts": contexts_builder,
+					"params": self._agent_options(profile.params),
+					"language": self._language_config(self._get_voice_config(vertical, profile.language)),
+					"global_data": verticals.vertical_global_data(vertical),
+					"hints": verticals.vertical_hints(vertical),
+				}
+		return compiled
+	
+	def _render_swml(self, call_id: Optional[str] = None, modifications: Optional[Dict[str, Any]] = None) -> str:
+		"""Render another vertical's call through an ephemeral copy; everything else renders this agent"""
+		vertical = (modifications or {}).get("__vertical")
+		compiled = self._compiled_vertical(vertical) if vertical else None
+		if compiled is None:
+			return super()._render_swml(call_id, None if vertical else modifications)
+		# Everything vertical-specific comes from the vertical alone, nothing from the
+		# default one; only the caller data on_swml_request just set is carried over
+		agent = self._create_ephemeral_copy()
+		agent._contexts_builder = compiled["contexts"]
+		agent._contexts_defined = True
+		agent._params = dict(compiled["params"])
+		agent._global_data = dict(compiled["global_data"])
+		agent.set_global_data({key: self._global_data[key] for key in CALL_GLOBAL_DATA_KEYS if key in self._global_data})
+		agent._hints = list(compiled["hints"])
+		agent._languages = []
+		agent.add_language(**compiled["language"])
+		logger.info(f"[SWML] Serving vertical {vertical}")
+		# Straight to the SDK renderer: the copy must not come back through this override
+		return AgentBase._render_swml(agent, call_id, None)
+	
+	@staticmethod
+	def _called_number(request_data: Optional[Dict[str, Any]]) -> Optional[str]:
+		request_data = request_data or {}
+		call_data = request_data.get('call') or {}
+		if isinstance(call_data, str):
+			call_data = json.loads(call_data)
+		return call_data.get('to') or request_data.get('To')
+	
+	def _swml_modifications(self, request_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+		"""Marker telling _render_swml to serve another vertical (None for the default one)
 		
+		request_data is the POST body, which on_swml_request receives as `query_params`.
+		"""
+		vertical = verticals.vertical_for_number(self._called_number(request_data))
+		if vertical == verticals.DEFAULT_VERTICAL or self._compiled_vertical(vertical) is None:
+			return None
+		return {"__vertical": vertical}
+	
+	def _get_voice_config(self, vertical: str = "reverse_mortgage", language_code: str = "en-US") -> Dict[str, Any]:
+		"""Voice configuration from the agent config cache, falling back to env vars"""
 		try:
-			sb = get_supabase_client()
-			result = sb.table('agent_voice_config') \
-				.select('tts_engine, voice_name, model') \
-				.eq('vertical', vertical) \
-				.eq('language_code', language_code) \
-				.eq('is_active', True) \
-				.single() \
-				.execute()
-			
-			if result.data:
+			row = get_voice_config(vertical, language_code)
+			if row:
 				return {
-					"engine": result.data['tts_engine'],
-					"voice_name": result.data['voice_name'],
-					"model": result.data.get('model')
+					"engine": row['tts_engine'],
+					"voice_name": row['voice_name'],
+					"model": row.get('model')
 				}
 		except Exception as e:
 			logger.warning(f"Failed to load voice config from DB: {e}, using env fallback")
@@ -774,7 +847,10 @@ List specific actions needed based on conversation outcome.
 		"""Override to inject caller info into prompts BEFORE call starts
 		
 		This runs once per call. We use it to load caller info and inject it into the personality prompt.
-		This works nicely with the static context structure loaded in __init__.
+		This works nicely with the static context structure loaded in __init__; calls to another
+		vertical's number get that vertical's contexts via _render_swml.
+		
+		NOTE: the SDK calls this as (request_data, callback_path, request).
 		"""
 		try:
 			# Extract phone number from request
@@ -795,7 +871,7 @@ List specific actions needed based on conversation outcome.
 			
 			if not phone:
 				logger.warning("[SWML] No phone number found in request, using generic greeting")
-				return super().on_swml_request(query_params, body_params, headers)
+				return self._swml_modifications(query_params)
 			
 			# Normalize phone
 			normalized_phone = phone.lstrip('+1') if phone.startswith('+1') else phone.lstrip('+')
@@ -861,11 +937,13 @@ Status: {'✅ QUALIFIED' if lead_data.get('qualified') else '❌ Not Qualified'
 		except Exception as e:
 			logger.error(f"[SWML] Error loading caller info: {e}")
 		
-		return super().on_swml_request(query_params, body_params, headers)
+		return self._swml_modifications(query_params)
 
 	def on_function_call(self, name: str, args: Dict[str, Any], raw_data: Optional[Dict[str, Any]] = None):
 		"""Override to log all tool/function calls"""
 		logger.info(f"🔧 [TOOL CALL] {name} | Args: {json.dumps(args, default=str)}")
+		if raw_data and raw_data.get("call_id"):
+			get_transcript_buffer().observe(raw_data["call_id"], call_log_messages(raw_data))
 		try:
 			result = super().on_function_call(name, args, raw_data)
 			logger.info(f"✅ [TOOL RESULT] {name} | Success")
@@ -878,6 +956,7 @@ Status: {'✅ QUALIFIED' if lead_data.get('qualified') else '❌ Not Qualified'
 		"""Handle conversation summary after call ends"""
 		try:
 			logger.info(f"[STATS] Conversation completed: {summary}")
+			call_id = (raw_data or {}).get("call_id")
 			if not summary:
 				return
 			
@@ -888,17 +967,21 @@ Status: {'✅ QUALIFIED' if lead_data.get('qualified') else '❌ Not Qualified'
 			if phone:
 				state_row = get_conversation_state(phone)
 				if state_row and state_row.get("lead_id"):
-					from equity_connect.services.supabase import get_supabase_client
-					supabase = get_supabase_client()
-					supabase.table("interactions").insert({
+					from equity_connect.services.outbox import get_outbox
+					# Chunks are only dropped once the interaction holding the transcript is queued
+					transcript = get_transcript_buffer().finalize(call_id, call_log_messages(raw_data))
+					interaction_id = get_outbox().insert("interactions", {
 						"lead_id": state_row["lead_id"],
 						"broker_id": state_row.get("broker_id"),
-						"interaction_type": "call",
+						"type": "ai_call",
 						"outcome": "completed",
 						"content": f"Call Summary:\n{summary}",
-						"metadata": {"summary": summary}
-					}).execute()
-					logger.info(f"[OK] Call summary saved for lead {state_row['lead_id']}")
+						"transcript": encode_transcript(transcript) if transcript else None,
+						"metadata": {"summary": summary, "call_id": call_id, "message_count": len(transcript)}
+					})
+					if call_id:
+						get_transcript_buffer().purge(call_id)
+					logger.info(f"[OK] Call summary queued for lead {state_row['lead_id']} ({interaction_id}, {len(transcript)} messages)")
 		except Exception as e:
 			logger.error(f"[ERROR] Failed to save call summary: {e}", exc_info=True)
 
@@ -17,6 +17,6 @@ if __name__ == "__main__":
 	# SignalWire's agent.run() automatically:
 	# - Sets up HTTP server on port 8080
 	# - Handles /agent endpoint for SIP routing  
-	# - Provides /healthz endpoint for Fly.io health checks
+	# - Serves /healthz (readiness, see services/startup.py) for Fly.io health checks
 	# - Auto-detects environment (server/lambda/cloud function)
 	agent.run()
@@ -1,58 +1,83 @@
-"""Agent configuration loading from Supabase."""
+"""Agent configuration loading from Supabase.
+
+Every active agent_params and agent_voice_config row (all verticals and
+languages) is preloaded in one pass and kept in memory; lookups for any
+(vertical, language) are dictionary reads. The snapshot reloads in the
+background every AGENT_CONFIG_CACHE_TTL_S seconds (default 60).
+"""
 import logging
 import os
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, Optional, Tuple
 
-from supabase import Client, create_client
+from equity_connect.services.cache import RefreshingCache
+from equity_connect.services.supabase import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
-_supabase_client: Optional[Client] = None
+ConfigKey = Tuple[str, str]
+
+_config_cache: Optional[RefreshingCache[Dict[str, Dict[ConfigKey, Dict[str, Any]]]]] = None
+_config_cache_lock = threading.Lock()
+
+
+def load_agent_config() -> Dict[str, Dict[ConfigKey, Dict[str, Any]]]:
+	"""Fetch all active agent_params / agent_voice_config rows keyed by (vertical, language)."""
+	supabase = get_supabase_client("read")
+	params = supabase.table("agent_params").select("*").eq("is_active", True).execute().data or []
+	voices = supabase.table("agent_voice_config")\
+		.select("vertical, language_code, tts_engine, voice_name, model")\
+		.eq("is_active", True)\
+		.execute().data or []
+	snapshot = {
+		"params": {(row.get("vertical"), row.get("language")): row for row in params},
+		"voice": {(row.get("vertical"), row.get("language_code")): row for row in voices},
+	}
+	logger.info(
+		f"✅ Agent config loaded: {len(snapshot['params'])} agent_params, "
+		f"{len(snapshot['voice'])} voice configs"
+	)
+	return snapshot
 
 
-def get_supabase_client() -> Client:
-	"""Return cached Supabase client or create one."""
-	global _supabase_client
-	if _supabase_client is None:
-		url = os.getenv("SUPABASE_URL")
-		key = os.getenv("SUPABASE_SERVICE_KEY")
-		if not url or not key:
-			raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set")
-		_supabase_client = create_client(url, key)
-	return _supabase_client
+def get_config_cache() -> RefreshingCache[Dict[str, Dict[ConfigKey, Dict[str, Any]]]]:
+	"""Get or create the process-wide agent config cache."""
+	global _config_cache
+	if _config_cache is None:
+		with _config_cache_lock:
+			if _config_cache is None:
+				_config_cache = RefreshingCache(
+					"agent_config",
+					load_agent_config,
+					ttl=float(os.getenv("AGENT_CONFIG_CACHE_TTL_S", "60")),
+				)
+	return _config_cache
 
 
 def get_agent_params(vertical: str = "reverse_mortgage", language: str = "en-US") -> Dict[str, Any]:
 	"""
-	Load the agent parameter record for a given vertical/language combination.
+	Agent parameter record for a given vertical/language combination.
 
-	Returns defaults if no row is found or the query fails.
+	Returns defaults if no row is found or the config could not be loaded.
 	"""
 	defaults = _get_default_params()
 	try:
-		supabase = get_supabase_client()
-		result = supabase.table("agent_params")\
-			.select("*")\
-			.eq("vertical", vertical)\
-			.eq("language", language)\
-			.eq("is_active", True)\
-			.single()\
-			.execute()
-
-		if result.data:
-			logger.info(
-				f"✅ Loaded agent params for {vertical}/{language}: "
-				f"attention_timeout={result.data.get('attention_timeout')}ms"
-			)
-			merged = {**defaults, **result.data}
-			return merged
-
-		logger.warning(f"⚠️ No agent params row found for {vertical}/{language}, using defaults.")
-		return defaults
+		row = get_config_cache().get()["params"].get((vertical, language))
 	except Exception as exc:
 		logger.error(f"Error loading agent params for {vertical}/{language}: {exc}")
 		return defaults
 
+	if row:
+		return {**defaults, **row}
+
+	logger.warning(f"⚠️ No agent params row found for {vertical}/{language}, using defaults.")
+	return defaults
+
+
+def get_voice_config(vertical: str = "reverse_mortgage", language_code: str = "en-US") -> Optional[Dict[str, Any]]:
+	"""Active agent_voice_config row (tts_engine, voice_name, model) or None; raises if config can't load."""
+	return get_config_cache().get()["voice"].get((vertical, language_code))
+
 
 def _get_default_params() -> Dict[str, Any]:
 	"""Fallback defaults mirroring database seed values."""
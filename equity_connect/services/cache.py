@@ -0,0 +1,76 @@
+"""In-process caches for slow-changing reference data.
+
+RefreshingCache holds one value built by a loader (e.g. a whole Supabase
+table turned into a lookup index). The first get() loads synchronously; after
+that, reads never touch the network: once the value is older than `ttl` the
+next get() returns it as-is and starts a background reload. A failed reload
+keeps serving the previous value and is retried after another `ttl`.
+"""
+import logging
+import threading
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RefreshingCache(Generic[T]):
+	"""A single value served from memory and reloaded in the background every `ttl` seconds."""
+
+	def __init__(self, name: str, loader: Callable[[], T], ttl: float):
+		self.name = name
+		self.ttl = ttl
+		self._loader = loader
+		self._value: Optional[T] = None
+		self._loaded = False
+		self._loaded_at = 0.0
+		self._refreshing = False
+		self._lock = threading.Lock()
+
+	def get(self) -> T:
+		if not self._loaded:
+			with self._lock:
+				if not self._loaded:
+					self._store(self._loader())
+			return self._value
+		if time.monotonic() - self._loaded_at >= self.ttl:
+			self._refresh_in_background()
+		return self._value
+
+	def refresh(self) -> T:
+		"""Reload now (blocking) and return the new value."""
+		value = self._loader()
+		with self._lock:
+			self._store(value)
+		return value
+
+	def invalidate(self) -> None:
+		"""Serve the current value once more, then reload (e.g. after a write to the source)."""
+		self._loaded_at = 0.0
+
+	@property
+	def age(self) -> Optional[float]:
+		return time.monotonic() - self._loaded_at if self._loaded else None
+
+	def _store(self, value: T) -> None:
+		self._value = value
+		self._loaded = True
+		self._loaded_at = time.monotonic()
+
+	def _refresh_in_background(self) -> None:
+		with self._lock:
+			if self._refreshing:
+				return
+			self._refreshing = True
+		threading.Thread(target=self._background_refresh, name=f"cache-{self.name}", daemon=True).start()
+
+	def _background_refresh(self) -> None:
+		try:
+			self.refresh()
+		except Exception as e:
+			logger.warning(f"⚠️ Refreshing {self.name} cache failed, serving previous copy: {e}")
+			self._loaded_at = time.monotonic()
+		finally:
+			self._refreshing = False
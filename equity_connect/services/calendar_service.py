@@ -4,10 +4,17 @@ from typing import Optional, Dict, Any
 import logging
 import json
 import time
+import uuid
 from datetime import datetime
 
 from equity_connect.services.supabase import get_supabase_client
-from equity_connect.services.conversation_state import update_conversation_state
+from equity_connect.services.conversation_state import (
+	update_conversation_state,
+	updates_to_delta,
+	is_missing_function,
+	phone_candidates,
+)
+from equity_connect.services.outbox import get_outbox
 from equity_connect.services.nylas import (
 	get_broker_events,
 	find_free_slots,
@@ -29,7 +36,7 @@ def check_broker_availability_core(
 	Returns up to 10 best-matching slots to save tokens.
 	If preferred_day or preferred_time provided, filters to those constraints.
 	"""
-	sb = get_supabase_client()
+	sb = get_supabase_client("read")
 	start_time = time.time()
 	
 	try:
@@ -155,6 +162,111 @@ def check_broker_availability_core(
 		)
 
 
+BOOKING_RPC = "record_appointment_booking"
+BILLING_AMOUNT_APPOINTMENT_SET = 50
+
+_booking_rpc_available = True
+
+
+def _record_booking(
+	lead_id: str,
+	broker_id: str,
+	scheduled_for: str,
+	appointment_date: datetime,
+	nylas_event_id: str,
+	notes: Optional[str],
+	calendar_invite_sent: bool,
+	phone_number: Optional[str],
+) -> str:
+	"""Record a booked appointment; returns the interaction id.
+	
+	One transactional round trip via record_appointment_booking() (interaction,
+	lead status, billing event, conversation_state flags). If the call fails in
+	transit it is queued in the outbox under the same interaction id, which the
+	function treats as already-recorded on replay. Without the function installed
+	the writes are queued individually as before.
+	"""
+	global _booking_rpc_available
+	interaction_id = str(uuid.uuid4())
+	content = f"Appointment scheduled for {appointment_date.strftime('%Y-%m-%d %H:%M:%S')}"
+	metadata = {
+		"nylas_event_id": nylas_event_id,
+		"scheduled_for": scheduled_for,
+		"notes": notes,
+		"calendar_invite_sent": calendar_invite_sent,
+	}
+	billing_metadata = {"nylas_event_id": nylas_event_id, "scheduled_for": scheduled_for}
+	conversation_updates = {"appointment_booked": True, "appointment_id": nylas_event_id}
+	
+	if _booking_rpc_available:
+		params = {
+			"p_interaction_id": interaction_id,
+			"p_lead_id": lead_id,
+			"p_broker_id": broker_id,
+			"p_scheduled_for": scheduled_for,
+			"p_content": content,
+			"p_metadata": metadata,
+			"p_billing_amount": BILLING_AMOUNT_APPOINTMENT_SET,
+			"p_billing_metadata": billing_metadata,
+			"p_phone_candidates": phone_candidates(phone_number) if phone_number else [],
+			"p_conversation_ops": updates_to_delta(conversation_updates),
+		}
+		try:
+			get_supabase_client().rpc(BOOKING_RPC, params).execute()
+			return interaction_id
+		except Exception as e:
+			if not is_missing_function(e):
+				logger.warning(f"⚠️ {BOOKING_RPC}() failed ({e}); queued for retry")
+				get_outbox().rpc(BOOKING_RPC, params, key=f"{BOOKING_RPC}:{nylas_event_id}")
+				return interaction_id
+			_booking_rpc_available = False
+			logger.warning(
+				f"⚠️ {BOOKING_RPC}() not installed - queueing booking writes separately "
+				"(apply database/migrations/20251202_record_appointment_booking.sql)"
+			)
+	
+	outbox = get_outbox()
+	outbox.insert(
+		"interactions",
+		{
+			"id": interaction_id,
+			"lead_id": lead_id,
+			"broker_id": broker_id,
+			"type": "appointment",
+			"direction": "outbound",
+			"content": content,
+			"outcome": "appointment_booked",
+			"scheduled_for": scheduled_for,
+			"metadata": metadata,
+		},
+		key=f"interactions:appointment:{nylas_event_id}",
+	)
+	outbox.update(
+		"leads",
+		{
+			"status": "appointment_set",
+			"last_engagement": datetime.utcnow().isoformat(),
+		},
+		{"id": lead_id},
+		key=f"leads:appointment_set:{nylas_event_id}",
+	)
+	outbox.insert(
+		"billing_events",
+		{
+			"broker_id": broker_id,
+			"lead_id": lead_id,
+			"event_type": "appointment_set",
+			"amount": BILLING_AMOUNT_APPOINTMENT_SET,
+			"status": "pending",
+			"metadata": billing_metadata,
+		},
+		key=f"billing_events:appointment_set:{nylas_event_id}",
+	)
+	if phone_number:
+		update_conversation_state(phone_number, {"conversation_data": conversation_updates})
+	return interaction_id
+
+
 def book_appointment_core(
 	lead_id: str,
 	broker_id: str,
@@ -283,62 +395,16 @@ def book_appointment_core(
 		
 		logger.info(f"Nylas event created: {nylas_event_id}")
 		
-		interaction_response = (
-			sb.table("interactions")
-			.insert(
-				{
-					"lead_id": lead_id,
-					"broker_id": broker_id,
-					"type": "appointment",
-					"direction": "outbound",
-					"content": f"Appointment scheduled for {appointment_date.strftime('%Y-%m-%d %H:%M:%S')}",
-					"outcome": "appointment_booked",
-					"scheduled_for": scheduled_for,
-					"metadata": {
-						"nylas_event_id": nylas_event_id,
-						"scheduled_for": scheduled_for,
-						"notes": notes,
-						"calendar_invite_sent": bool(lead_email),
-					},
-				}
-			)
-			.execute()
+		interaction_id = _record_booking(
+			lead_id=lead_id,
+			broker_id=broker_id,
+			scheduled_for=scheduled_for,
+			appointment_date=appointment_date,
+			nylas_event_id=nylas_event_id,
+			notes=notes,
+			calendar_invite_sent=bool(lead_email),
+			phone_number=lead.get("primary_phone"),
 		)
-		if getattr(interaction_response, "error", None):
-			raise Exception(f"Failed to save appointment: {interaction_response.error}")
-		
-		sb.table("leads").update(
-			{
-				"status": "appointment_set",
-				"last_engagement": datetime.utcnow().isoformat(),
-			}
-		).eq("id", lead_id).execute()
-		
-		sb.table("billing_events").insert(
-			{
-				"broker_id": broker_id,
-				"lead_id": lead_id,
-				"event_type": "appointment_set",
-				"amount": 50,
-				"status": "pending",
-				"metadata": {
-					"nylas_event_id": nylas_event_id,
-					"scheduled_for": scheduled_for,
-				},
-			}
-		).execute()
-		
-		phone_number = lead.get("primary_phone")
-		if phone_number:
-			update_conversation_state(
-				phone_number,
-				{
-					"conversation_data": {
-						"appointment_booked": True,
-						"appointment_id": nylas_event_id,
-					}
-				},
-			)
 		
 		appointment_display = appointment_date.strftime("%B %d, %Y at %I:%M %p")
 		duration_ms = int((time.time() - start_time) * 1000)
@@ -348,6 +414,7 @@ def book_appointment_core(
 			{
 				"success": True,
 				"event_id": nylas_event_id,
+				"interaction_id": interaction_id,
 				"scheduled_for": scheduled_for,
 				"calendar_invite_sent": bool(lead_email),
 				"message": f"Appointment booked for {appointment_display}.",
@@ -143,7 +143,7 @@ def _query_contexts_from_db(vertical: str, use_draft: bool = False, lead_context
     """
     
     # Query prompts table for this vertical
-    supabase = get_supabase_client()
+    supabase = get_supabase_client("read")
     response = supabase.table('prompts') \
         .select('*, prompt_versions!inner(*)') \
         .eq('vertical', vertical) \
@@ -368,7 +368,7 @@ def load_theme(vertical: str, use_draft: bool = False, lead_context: Optional[di
         Theme text content (with variables substituted if lead_context provided)
     """
     
-    supabase = get_supabase_client()
+    supabase = get_supabase_client("read")
     
     # Load theme content (draft or active)
     # PREFER: content_structured JSONB (new format)
@@ -8,6 +8,9 @@ Responsibilities:
   - Nested dicts merge recursively
   - Arrays append-unique by value
   - Passing None removes the key
+- Persist changes as deltas (set / unset / append_unique ops) applied
+  server-side by apply_conversation_delta(), so write size tracks the change,
+  not the accumulated document
 """
 from __future__ import annotations
 
@@ -22,28 +25,79 @@ from .supabase import get_supabase_client, normalize_phone
 logger = logging.getLogger(__name__)
 
 TABLE_NAME = "conversation_state"
+DELTA_RPC = "apply_conversation_delta"
+DELTA_OPS = ("set", "unset", "append_unique", "ensure_object")
+# Columns returned after a delta write; conversation_data is left out on purpose
+DELTA_RETURN_COLUMNS = "id, phone_number, lead_id, qualified, current_node, call_status, updated_at"
+
+_delta_rpc_available = True
 
 # -----------------------------
 # Deep merge for JSON semantics
 # -----------------------------
 
-def _append_unique(existing: List[Any], incoming: List[Any]) -> List[Any]:
-	"""Append-unique merge for list values, preserving order of first appearance."""
-	seen = set()
-	result: List[Any] = []
-	for value in existing + incoming:
+class _UniqueList(list):
+	"""List produced by _append_unique, carrying the hash keys of its items.
+
+	Lets the next merge into the same list skip re-hashing every existing
+	element. Treat it as immutable: `_keys` is only trusted while its length
+	matches the list (a guard against in-place edits), otherwise the keys are
+	rebuilt. Each list owns its key set; merges never share or mutate one.
+	"""
+
+	__slots__ = ("_keys",)
+
+	def __init__(self, values: List[Any] = (), keys: Optional[set] = None):
+		super().__init__(values)
+		self._keys = keys if keys is not None else {_to_hashable(v) for v in self}
+
+	def __reduce_ex__(self, protocol):
+		# Copy/pickle as a plain list; keys are rebuilt on the next merge
+		return (list, (list(self),))
+
+
+def _existing_keys(existing: List[Any]) -> Tuple[List[Any], set]:
+	"""Return (deduplicated existing values, their hash keys), reusing cached keys."""
+	if isinstance(existing, _UniqueList) and len(existing._keys) == len(existing):
+		return existing, existing._keys
+	seen: set = set()
+	values: List[Any] = []
+	for value in existing:
 		key = _to_hashable(value)
 		if key not in seen:
 			seen.add(key)
-			result.append(value)
-	return result
+			values.append(value)
+	return values, seen
+
+
+def _append_unique(existing: List[Any], incoming: List[Any]) -> List[Any]:
+	"""Append-unique merge for list values, preserving order of first appearance.
+
+	Only the incoming values are hashed when `existing` came from a previous
+	merge; if nothing new arrives the existing list is returned unchanged.
+	"""
+	values, keys = _existing_keys(existing)
+	added: List[Any] = []
+	added_keys: set = set()
+	for value in incoming:
+		key = _to_hashable(value)
+		if key not in keys and key not in added_keys:
+			added_keys.add(key)
+			added.append(value)
+	if not added and isinstance(values, _UniqueList):
+		return values
+	# A fresh set: `keys` may belong to `existing`, which must stay untouched
+	return _UniqueList(values + added, keys | added_keys)
+
+
+_DICT_KEY_TAG = object()
 
 
 def _to_hashable(value: Any) -> Any:
 	"""Turn JSON-like values into hashable keys for set membership checks."""
 	if isinstance(value, dict):
-		# Sort keys for deterministic hashing
-		return tuple(sorted((k, _to_hashable(v)) for k, v in value.items()))
+		# Sort keys for deterministic hashing; tagged so {} and [] stay distinct
+		return (_DICT_KEY_TAG, tuple(sorted((k, _to_hashable(v)) for k, v in value.items())))
 	if isinstance(value, list):
 		return tuple(_to_hashable(v) for v in value)
 	return value
@@ -56,13 +110,16 @@ def deep_merge_json(base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str,
 	- Dicts merge recursively
 	- Lists append-unique
 	- None deletes the key
+
+	Copy-on-write: only dicts along the paths touched by `updates` are copied;
+	untouched subtrees are shared with `base`. Neither input is mutated, so
+	treat the result as read-only (or deepcopy it) before editing in place.
 	"""
-	merged = copy.deepcopy(base) if base else {}
+	merged = dict(base) if base else {}
 	for key, new_value in (updates or {}).items():
 		if new_value is None:
 			# Delete key if present
-			if key in merged:
-				del merged[key]
+			merged.pop(key, None)
 			continue
 		old_value = merged.get(key)
 		if isinstance(old_value, dict) and isinstance(new_value, dict):
@@ -74,22 +131,118 @@ def deep_merge_json(base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str,
 	return merged
 
 
+# -----------------------------
+# Delta protocol
+# -----------------------------
+# A delta is a list of ops against conversation_data, JSON-Patch style:
+#   {"op": "set", "path": ["quote", "low"], "value": 180000}
+#   {"op": "unset", "path": ["verified"]}
+#   {"op": "append_unique", "path": ["topics"], "value": ["spouse"]}
+#   {"op": "ensure_object", "path": ["quote"]}
+# Missing parents along `path` are created as objects. append_unique on a
+# non-list behaves like set; ensure_object replaces a non-object with {}.
+# The SQL twin is apply_conversation_delta()
+# (database/migrations/20251201_conversation_state_delta.sql).
+
+def delta_set(path: List[str], value: Any) -> Dict[str, Any]:
+	return {"op": "set", "path": list(path), "value": value}
+
+
+def delta_unset(path: List[str]) -> Dict[str, Any]:
+	return {"op": "unset", "path": list(path)}
+
+
+def delta_append_unique(path: List[str], values: List[Any]) -> Dict[str, Any]:
+	return {"op": "append_unique", "path": list(path), "value": list(values)}
+
+
+def updates_to_delta(updates: Dict[str, Any], prefix: Tuple[str, ...] = ()) -> List[Dict[str, Any]]:
+	"""Translate a deep_merge_json-style update dict into delta ops (same semantics)."""
+	ops: List[Dict[str, Any]] = []
+	for key, value in (updates or {}).items():
+		path = [*prefix, key]
+		if value is None:
+			ops.append(delta_unset(path))
+		elif isinstance(value, dict):
+			# An empty dict still replaces a non-dict value (deep_merge_json semantics)
+			ops.extend(updates_to_delta(value, tuple(path)) or [{"op": "ensure_object", "path": path}])
+		elif isinstance(value, list):
+			ops.append(delta_append_unique(path, value))
+		else:
+			ops.append(delta_set(path, value))
+	return ops
+
+
+def _apply_op(doc: Dict[str, Any], path: List[str], op: str, value: Any) -> Dict[str, Any]:
+	"""Apply one op, copying only the dicts along `path`."""
+	head, rest = path[0], path[1:]
+	if not rest:
+		if op == "unset":
+			if head not in doc:
+				return doc
+			result = dict(doc)
+			del result[head]
+			return result
+		current = doc.get(head)
+		if op == "ensure_object" and isinstance(current, dict):
+			return doc
+		result = dict(doc)
+		if op == "ensure_object":
+			result[head] = {}
+		elif op == "append_unique" and isinstance(current, list) and isinstance(value, list):
+			result[head] = _append_unique(current, value)
+		else:
+			result[head] = copy.deepcopy(value)
+		return result
+	child = doc.get(head)
+	if not isinstance(child, dict):
+		if op == "unset":
+			return doc
+		child = {}
+	result = dict(doc)
+	result[head] = _apply_op(child, rest, op, value)
+	return result
+
+
+def apply_delta(doc: Dict[str, Any], ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+	"""Apply delta ops to a conversation_data dict (copy-on-write, inputs untouched)."""
+	result = doc or {}
+	for op in ops or []:
+		kind = op.get("op")
+		if kind not in DELTA_OPS:
+			raise ValueError(f"Unknown conversation delta op: {kind!r}")
+		if not op.get("path"):
+			raise ValueError("Conversation delta op requires a non-empty path")
+		result = _apply_op(result, list(op["path"]), kind, op.get("value"))
+	return result
+
+
+def is_missing_function(error: Exception) -> bool:
+	"""True when PostgREST reports the RPC is not installed (migration not applied yet)."""
+	return getattr(error, "code", None) in ("PGRST202", "42883")
+
+
 # -----------------------------
 # Core CRUD helpers
 # -----------------------------
 
+def phone_candidates(phone: str) -> List[str]:
+	"""Stored phone_number formats that may match this phone (raw, +1XXXXXXXXXX, last 10)."""
+	normalized = normalize_phone(phone)
+	candidates = [phone]
+	if normalized and len(normalized) == 10:
+		candidates.append(f"+1{normalized}")
+		candidates.append(normalized)
+	return candidates
+
+
 def _fetch_by_phone(phone: str) -> Optional[Dict[str, Any]]:
 	"""Fetch the single conversation_state row for a phone number (various normalizations)."""
 	if not phone:
 		logger.debug("🛈 _fetch_by_phone called with empty phone; skipping lookup")
 		return None
 	supabase = get_supabase_client()
-	normalized = normalize_phone(phone)
-	candidates = [phone]
-	if normalized and len(normalized) == 10:
-		candidates.append(f"+1{normalized}")
-		candidates.append(normalized)
-	or_filter = ",".join([f"phone_number.eq.{c}" for c in candidates])
+	or_filter = ",".join([f"phone_number.eq.{c}" for c in phone_candidates(phone)])
 	# Fix: Call .select() first, THEN chain .or_() and .limit()
 	resp = (supabase.table(TABLE_NAME)
 	        .select("*")
@@ -226,21 +379,58 @@ def update_conversation_state(phone: str, updates: Dict[str, Any]) -> Optional[D
 	Deep-merge update for conversation_state.
 	- conversation_data is deep-merged with append-unique arrays and None deletions
 	- top-level fields are overwritten as given
+
+	Sent as a delta (see updates_to_delta); returns the DELTA_RETURN_COLUMNS
+	summary of the row, or None if no row exists for the phone.
 	"""
-	row = _fetch_by_phone(phone)
-	if not row:
+	updates = updates or {}
+	delta = updates_to_delta(updates.get("conversation_data") or {})
+	fields = {k: v for k, v in updates.items() if k != "conversation_data"}
+	return apply_conversation_delta(phone, delta, fields)
+
+
+def apply_conversation_delta(
+	phone: str,
+	delta: List[Dict[str, Any]],
+	fields: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+	"""
+	Apply delta ops to conversation_data plus top-level field overwrites.
+
+	Runs server-side in one statement via the apply_conversation_delta() RPC.
+	Falls back to fetch + merge + full write while that function is not
+	installed.
+	"""
+	global _delta_rpc_available
+	if not phone:
 		return None
 	supabase = get_supabase_client()
 
-	current_cd = row.get("conversation_data") or {}
-	incoming_cd = (updates or {}).get("conversation_data") or {}
-	merged_cd = deep_merge_json(current_cd, incoming_cd) if incoming_cd else current_cd
-
-	# Build payload with top-level overwrites + merged conversation_data
-	payload = {k: v for k, v in (updates or {}).items() if k != "conversation_data"}
-	if incoming_cd or current_cd:
-		payload["conversation_data"] = merged_cd
+	if _delta_rpc_available:
+		try:
+			resp = supabase.rpc(DELTA_RPC, {
+				"p_phone_candidates": phone_candidates(phone),
+				"p_ops": delta or [],
+				"p_fields": fields or {},
+			}).select(DELTA_RETURN_COLUMNS).execute()
+			return resp.data[0] if resp.data else None
+		except Exception as e:
+			if not is_missing_function(e):
+				raise
+			_delta_rpc_available = False
+			logger.warning(
+				f"⚠️ {DELTA_RPC}() not installed - falling back to full conversation_data writes "
+				"(apply database/migrations/20251201_conversation_state_delta.sql)"
+			)
 
+	row = _fetch_by_phone(phone)
+	if not row:
+		return None
+	payload = dict(fields or {})
+	if delta:
+		payload["conversation_data"] = apply_delta(row.get("conversation_data") or {}, delta)
+	if not payload:
+		return row
 	resp = supabase.table(TABLE_NAME).update(payload).eq("id", row["id"]).execute()
 	return resp.data[0] if resp.data else None
 
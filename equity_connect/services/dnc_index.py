@@ -0,0 +1,200 @@
+"""In-memory Do-Not-Call / litigator index.
+
+dnc_numbers holds 10-digit numbers flagged by SwarmTrace's dnc_litigator_scrub
+(recorded by the lead import) or uploaded from a DNC list
+(scripts/upload_dnc_list.py). The whole table is loaded into one sorted
+array('q') per list type - 8 bytes a number, so a few million numbers stay in
+the tens of MB - and a lookup is a binary search (about 22 comparisons for 4M
+numbers). check_consent_dnc and the lead import screen numbers against it
+without a database round trip.
+
+A 10-digit bitmap would answer in one probe but needs 10^10 bits (1.25 GB)
+whatever the list size, and a set of ints costs ~70 bytes a number, hence the
+sorted arrays.
+
+Loading goes through the dnc_numbers_export RPC: one row per list type with
+every number packed into a single string of 10-digit runs, so millions of
+numbers arrive in one request instead of thousands of 1000-row pages. Every
+DNC_CACHE_TTL_S seconds (default 300), and after add_dnc_numbers() writes,
+only the rows added since the last load (by id) are fetched and merged in; a
+full reload every DNC_FULL_RELOAD_S seconds (default 86400) picks up deletions
+and any row committed out of id order.
+
+Configuration:
+- DNC_CACHE_TTL_S: how often new numbers are picked up (default 300)
+- DNC_FULL_RELOAD_S: how often the whole table is reloaded (default 86400)
+"""
+import heapq
+import logging
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from equity_connect.services.cache import RefreshingCache
+from equity_connect.services.supabase import get_supabase_client, normalize_phone
+
+logger = logging.getLogger(__name__)
+
+# Checked in this order: a litigator hit is reported even if the number is also on a DNC list
+LIST_TYPES = ("litigator", "dnc")
+WRITE_BATCH_SIZE = 1000
+
+_dnc_cache: Optional[RefreshingCache["DncIndex"]] = None
+_dnc_cache_lock = threading.Lock()
+_dnc_index: Optional["DncIndex"] = None  # last load, the base for the next incremental one
+
+
+def _number(phone: Optional[str]) -> Optional[int]:
+	digits = normalize_phone(phone)
+	return int(digits) if digits and len(digits) == 10 else None
+
+
+def scrub_list_types(scrub: Optional[Iterable[Any]]) -> List[str]:
+	"""
+	List types flagged by a SwarmTrace dnc_litigator_scrub array.
+
+	Entries are strings ("DNC", "Litigator", ...) or objects naming the list;
+	anything mentioning a litigator counts as "litigator", any other entry as "dnc".
+	"""
+	found = set()
+	for entry in scrub or []:
+		if not entry:
+			continue
+		text = str(entry.get("type") or entry.get("list") or entry) if isinstance(entry, dict) else str(entry)
+		found.add("litigator" if "litig" in text.lower() else "dnc")
+	return [list_type for list_type in LIST_TYPES if list_type in found]
+
+
+def _unpack(numbers: str) -> array:
+	"""Sorted numbers from the RPC's packed string (concatenated 10-digit runs)."""
+	return array("q", map(int, (numbers[i:i + 10] for i in range(0, len(numbers), 10))))
+
+
+def _merge(current: array, added: array) -> array:
+	def distinct(values: Iterator[int]) -> Iterator[int]:
+		last = None
+		for value in values:
+			if value != last:
+				yield value
+				last = value
+
+	return array("q", distinct(heapq.merge(current, sorted(added))))
+
+
+class DncIndex:
+	"""Sorted 10-digit numbers per list type (see module docstring)."""
+
+	def __init__(self, numbers: Optional[Dict[str, array]] = None, max_id: int = 0, full_load_at: float = 0.0):
+		self.numbers = {list_type: (numbers or {}).get(list_type) or array("q") for list_type in LIST_TYPES}
+		self.max_id = max_id  # highest dnc_numbers.id included
+		self.full_load_at = full_load_at
+
+	@classmethod
+	def from_export(cls, rows: Iterable[Dict[str, Any]], previous: Optional["DncIndex"] = None) -> "DncIndex":
+		"""Index from dnc_numbers_export rows; with `previous` they are additions merged into a copy of it."""
+		numbers = dict(previous.numbers) if previous else {}
+		max_id = previous.max_id if previous else 0
+		for row in rows:
+			list_type = row.get("list_type")
+			if list_type not in LIST_TYPES:
+				continue
+			added = _unpack(row.get("numbers") or "")
+			numbers[list_type] = _merge(numbers[list_type], added) if previous else added
+			max_id = max(max_id, row.get("max_id") or 0)
+		return cls(numbers, max_id, previous.full_load_at if previous else time.monotonic())
+
+	def __len__(self) -> int:
+		return sum(len(values) for values in self.numbers.values())
+
+	def status(self, phone: Optional[str]) -> Optional[str]:
+		""""litigator" or "dnc" when the number is listed, else None."""
+		number = _number(phone)
+		if number is None:
+			return None
+		for list_type in LIST_TYPES:
+			values = self.numbers[list_type]
+			i = bisect_left(values, number)
+			if i < len(values) and values[i] == number:
+				return list_type
+		return None
+
+
+def load_dnc_index(previous: Optional[DncIndex] = None) -> DncIndex:
+	"""Full load, or only the rows added since `previous` merged into a copy of it."""
+	sb = get_supabase_client("background")  # a full export can outlast the 10 s read timeout
+	rows = sb.rpc("dnc_numbers_export", {"p_after_id": previous.max_id if previous else 0}).execute().data or []
+	index = DncIndex.from_export(rows, previous)
+	counts = ", ".join(f"{len(values)} {list_type}" for list_type, values in index.numbers.items())
+	logger.info(f"✅ DNC index {'updated' if previous else 'loaded'}: {counts}")
+	return index
+
+
+def _refresh_dnc_index() -> DncIndex:
+	global _dnc_index
+	previous = _dnc_index
+	if previous is not None and time.monotonic() - previous.full_load_at >= float(os.getenv("DNC_FULL_RELOAD_S", "86400")):
+		previous = None
+	_dnc_index = load_dnc_index(previous)
+	return _dnc_index
+
+
+def get_dnc_cache() -> RefreshingCache[DncIndex]:
+	"""Get or create the process-wide DNC index cache."""
+	global _dnc_cache
+	if _dnc_cache is None:
+		with _dnc_cache_lock:
+			if _dnc_cache is None:
+				_dnc_cache = RefreshingCache(
+					"dnc",
+					_refresh_dnc_index,
+					ttl=float(os.getenv("DNC_CACHE_TTL_S", "300")),
+				)
+	return _dnc_cache
+
+
+def reload_dnc_index() -> DncIndex:
+	"""Full reload now (e.g. after numbers were deleted, or a different backend was installed)."""
+	global _dnc_index
+	_dnc_index = None
+	return get_dnc_cache().refresh()
+
+
+def get_dnc_index() -> DncIndex:
+	return get_dnc_cache().get()
+
+
+def dnc_status(phone: Optional[str]) -> Optional[str]:
+	""""litigator" / "dnc" for a listed number, None when it may be called."""
+	return get_dnc_index().status(phone)
+
+
+def add_dnc_numbers(numbers: Iterable[Optional[str]], list_type: str = "dnc", source: Optional[str] = None) -> int:
+	"""
+	Record numbers in dnc_numbers (already listed ones are left alone).
+
+	Numbers that don't normalize to 10 digits are dropped. Returns how many
+	distinct numbers were written; the index merges them in on its next
+	(incremental) reload, which this schedules.
+	"""
+	if list_type not in LIST_TYPES:
+		raise ValueError(f"Unknown DNC list type: {list_type}")
+	rows = [
+		{"phone_number": f"{number:010d}", "list_type": list_type, "source": source}
+		for number in sorted({_number(phone) for phone in numbers} - {None})
+	]
+	if not rows:
+		return 0
+	sb = get_supabase_client("background")
+	for start in range(0, len(rows), WRITE_BATCH_SIZE):
+		sb.table("dnc_numbers").upsert(
+			rows[start:start + WRITE_BATCH_SIZE],
+			on_conflict="phone_number,list_type",
+			ignore_duplicates=True,
+			returning="minimal",
+		).execute()
+	get_dnc_cache().invalidate()
+	logger.info(f"✅ Recorded {len(rows)} {list_type} numbers (source: {source or 'unknown'})")
+	return len(rows)
@@ -15,7 +15,7 @@ def search_knowledge_core(
 	raw_data: Optional[Dict[str, Any]] = None,
 ) -> str:
 	"""Return JSON search results for the knowledge base."""
-	sb = get_supabase_client()
+	sb = get_supabase_client("read")
 	
 	try:
 		logger.info(f"Knowledge search (keyword) for: {question!r}")
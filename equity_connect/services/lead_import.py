@@ -0,0 +1,196 @@
+"""Bulk import of SwarmTrace skip-trace results into leads.
+
+The SwarmTrace MCP server (swarmtrace-mcp/server.py) returns one result per
+property; its `successful` rows carry a primary_contact (name, top phone, top
+email) plus the property it was traced for. import_skip_trace_results() turns
+a whole pull into a handful of round trips instead of one insert per row:
+
+1. normalize phones (last 10 digits + E.164) and emails (trimmed, lower case),
+   withhold phones on the DNC / litigator lists and drop rows repeating a
+   phone/email already seen in the same pull
+2. look those phones and emails up in leads, BATCH_SIZE values per query
+   (emails case-insensitively, through the find_leads_by_email RPC)
+3. insert the new leads and fill the blank name/phone/email columns of the
+   matched ones, BATCH_SIZE rows per request
+
+A phone is withheld when SwarmTrace flagged it (primary_contact.dnc_flags,
+which are also recorded in dnc_numbers) or the DNC index already lists it; a
+row left with no phone or email is counted as dnc_blocked. Values already on a
+lead are never overwritten. A batch that fails is logged and counted as
+failed; the rest of the import carries on.
+
+Configuration:
+- LEAD_IMPORT_BATCH_SIZE: rows / lookup values per request (default 500)
+"""
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from equity_connect.services.dnc_index import LIST_TYPES, add_dnc_numbers, get_dnc_index, scrub_list_types
+from equity_connect.services.supabase import get_supabase_client, normalize_phone
+
+logger = logging.getLogger(__name__)
+
+LEAD_COLUMNS = "id, first_name, last_name, primary_email, primary_phone, primary_phone_e164"
+FILLABLE = ("first_name", "last_name", "primary_email", "primary_phone", "primary_phone_e164")
+PROPERTY_FIELDS = ("property_address", "property_city", "property_state", "property_zip")
+
+
+def _batch_size() -> int:
+	return max(1, int(os.getenv("LEAD_IMPORT_BATCH_SIZE", "500")))
+
+
+def _chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+	for start in range(0, len(items), size):
+		yield items[start:start + size]
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+	email = (email or "").strip().lower()
+	return email if "@" in email else None
+
+
+def _phone_columns(phone: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+	"""(primary_phone, primary_phone_e164) as the leads trigger would store them."""
+	digits = normalize_phone(phone)
+	if not digits or len(digits) != 10:
+		return None, None
+	return digits, f"+1{digits}"
+
+
+def lead_from_result(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+	"""Lead columns for one SkipTraceResult, or None when it has no usable phone or email."""
+	contact = result.get("primary_contact") or {}
+	phone, phone_e164 = _phone_columns(contact.get("phone"))
+	email = normalize_email(contact.get("email"))
+	if not phone and not email:
+		return None
+	source = result.get("input") or {}
+	lead = {
+		"first_name": contact.get("first_name") or source.get("firstname"),
+		"last_name": contact.get("last_name") or source.get("lastname"),
+		"primary_email": email,
+		"primary_phone": phone,
+		"primary_phone_e164": phone_e164,
+	}
+	for field in PROPERTY_FIELDS:
+		lead[field] = source.get(field)
+	return lead
+
+
+def _existing_leads(sb, column: str, values: List[str], batch_size: int) -> Dict[str, Dict[str, Any]]:
+	found: Dict[str, Dict[str, Any]] = {}
+	for chunk in _chunks(values, batch_size):
+		if column == "primary_email":
+			# `in` is case-sensitive; the RPC compares lower(btrim(primary_email))
+			query = sb.rpc("find_leads_by_email", {"p_emails": chunk})
+		else:
+			query = sb.table("leads").select(LEAD_COLUMNS).in_(column, chunk)
+		rows = query.execute().data or []
+		for row in rows:
+			key = normalize_email(row.get(column)) if column == "primary_email" else row.get(column)
+			if key:
+				found.setdefault(key, row)
+	return found
+
+
+def import_skip_trace_results(
+	results: List[Dict[str, Any]],
+	broker_id: Optional[str] = None,
+	source: str = "swarmtrace",
+) -> Dict[str, int]:
+	"""
+	Upsert the leads found in SwarmTrace results (the `successful` list).
+
+	New contacts are inserted (with assigned_broker_id when given); contacts
+	matching an existing lead by phone, else by email, only fill that lead's
+	blank columns. Returns inserted / updated / skipped / dnc_blocked / failed counts.
+	"""
+	report = {"inserted": 0, "updated": 0, "skipped": 0, "dnc_blocked": 0, "failed": 0}
+	batch_size = _batch_size()
+	dnc_index = get_dnc_index()
+
+	# 1. normalize, screen against the DNC lists + dedupe within the pull (first occurrence wins)
+	candidates: List[Dict[str, Any]] = []
+	seen_phones, seen_emails = set(), set()
+	flagged: Dict[str, set] = {list_type: set() for list_type in LIST_TYPES}
+	for result in results:
+		lead = lead_from_result(result)
+		if lead and lead["primary_phone"]:
+			flags = scrub_list_types((result.get("primary_contact") or {}).get("dnc_flags"))
+			for list_type in flags:
+				flagged[list_type].add(lead["primary_phone"])
+			if flags or dnc_index.status(lead["primary_phone"]):
+				lead["primary_phone"] = lead["primary_phone_e164"] = None
+				if not lead["primary_email"]:
+					report["dnc_blocked"] += 1
+					continue
+		phone, email = (lead or {}).get("primary_phone"), (lead or {}).get("primary_email")
+		if lead is None or (phone and phone in seen_phones) or (email and email in seen_emails):
+			report["skipped"] += 1
+			continue
+		if phone:
+			seen_phones.add(phone)
+		if email:
+			seen_emails.add(email)
+		candidates.append(lead)
+
+	for list_type, phones in flagged.items():
+		if phones:
+			try:
+				add_dnc_numbers(phones, list_type, source=source)
+			except Exception as e:
+				logger.warning(f"⚠️ Lead import: recording {len(phones)} {list_type} numbers failed: {e}")
+
+	# 2. match against leads already in the table
+	sb = get_supabase_client("background")
+	by_phone = _existing_leads(sb, "primary_phone", sorted(seen_phones), batch_size)
+	by_email = _existing_leads(sb, "primary_email", sorted(seen_emails), batch_size)
+
+	inserts: List[Dict[str, Any]] = []
+	patches: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+	patched_ids = set()
+	for lead in candidates:
+		existing = by_phone.get(lead["primary_phone"]) or by_email.get(lead["primary_email"])
+		if existing is None:
+			row = dict(lead, source=source)
+			if broker_id:
+				row["assigned_broker_id"] = broker_id
+			inserts.append(row)
+			continue
+		patch = {col: lead[col] for col in FILLABLE if lead.get(col) and not existing.get(col)}
+		if not patch or existing["id"] in patched_ids:
+			report["skipped"] += 1
+			continue
+		patched_ids.add(existing["id"])
+		# One request per column set, so no row sends a column it doesn't mean to change
+		patches.setdefault(tuple(sorted(patch)), []).append({"id": existing["id"], **patch})
+
+	# 3. write in batches
+	for chunk in _chunks(inserts, batch_size):
+		try:
+			sb.table("leads").insert(chunk, returning="minimal").execute()
+			report["inserted"] += len(chunk)
+		except Exception as e:
+			logger.error(f"❌ Lead import: insert of {len(chunk)} leads failed: {e}")
+			report["failed"] += len(chunk)
+	for rows in patches.values():
+		for chunk in _chunks(rows, batch_size):
+			try:
+				sb.table("leads").upsert(
+					chunk,
+					on_conflict="id",
+					returning="minimal",
+					default_to_null=False,
+				).execute()
+				report["updated"] += len(chunk)
+			except Exception as e:
+				logger.error(f"❌ Lead import: update of {len(chunk)} leads failed: {e}")
+				report["failed"] += len(chunk)
+
+	logger.info(
+		f"✅ Lead import: {report['inserted']} inserted, {report['updated']} updated, "
+		f"{report['skipped']} skipped, {report['dnc_blocked']} DNC-blocked, {report['failed']} failed "
+		f"(of {len(results)} results)"
+	)
+	return report
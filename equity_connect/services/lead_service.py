@@ -12,17 +12,21 @@ import json
 
 from equity_connect.services.supabase import get_supabase_client
 from equity_connect.services.conversation_state import update_conversation_state
+from equity_connect.services.dnc_index import dnc_status
+from equity_connect.services.territory_index import get_territory_index
 
 logger = logging.getLogger(__name__)
 
 
-def get_lead_context_core(phone: str) -> str:
+def get_lead_context_core(phone: str, purpose: str = "read") -> str:
 	"""Core implementation for get_lead_context.
 	
 	Returns a JSON string matching the previous tool shape so existing
-	prompts and logic continue to work.
+	prompts and logic continue to work. Reads may hit the replica; callers
+	that act on the result (identity checks creating leads) pass
+	purpose="default" to read their own writes.
 	"""
-	sb = get_supabase_client()
+	sb = get_supabase_client(purpose)
 	
 	try:
 		# Guard against None/empty phone
@@ -193,6 +197,21 @@ def check_consent_dnc_core(phone: str) -> str:
 		phone_digits = "".join(filter(str.isdigit, phone or ""))
 		last10 = phone_digits[-10:] if len(phone_digits) >= 10 else phone_digits
 		
+		# DNC / litigator lists are in memory (dnc_index); a listed number never needs the CRM
+		listed = dnc_status(last10)
+		if listed:
+			return json.dumps(
+				{
+					"can_call": False,
+					"is_dnc": True,
+					"is_litigator": listed == "litigator",
+					"has_consent": False,
+					"message": "Number is on the known-litigator list. Do not call."
+					if listed == "litigator"
+					else "Number is on the Do-Not-Call list. Do not call.",
+				}
+			)
+		
 		lead_response = (
 			sb.table("leads")
 			.select(
@@ -214,6 +233,7 @@ def check_consent_dnc_core(phone: str) -> str:
 			return json.dumps(
 				{
 					"can_call": True,
+					"is_dnc": False,
 					"has_consent": False,
 					"message": "Lead not found in CRM; treat as new caller.",
 				}
@@ -361,64 +381,15 @@ def find_broker_by_territory_core(
 	city: Optional[str] = None,
 	state: Optional[str] = None,
 ) -> str:
-	"""Core implementation for broker territory lookup."""
-	sb = get_supabase_client()
-	
+	"""Core implementation for broker territory lookup (served from the in-memory territory index)."""
 	try:
 		logger.info(f"Finding broker territory for zip={zip_code}, city={city}, state={state}")
-		
-		if zip_code:
-			territory_resp = (
-				sb.table("broker_territories")
-				.select("broker_id, market_name, zip_code, priority")
-				.eq("zip_code", zip_code)
-				.eq("active", True)
-				.order("priority", desc=True)
-				.limit(5)
-				.execute()
-			)
-			territories = territory_resp.data or []
-			candidate_ids = [t["broker_id"] for t in territories if t.get("broker_id")]
-		else:
-			candidate_ids = []
-		
-		broker: Optional[Dict[str, Any]] = None
-		if candidate_ids:
-			broker_resp = (
-				sb.table("brokers")
-				.select(
-					"id, contact_name, company_name, phone, email, nmls_number, nylas_grant_id, "
-					"address_city, address_state, address_zip, status, timezone"
-				)
-				.in_("id", candidate_ids)
-				.eq("status", "active")
-				.order("updated_at", desc=True)
-				.limit(1)
-				.execute()
+		if not city and not state and not zip_code:
+			return json.dumps(
+				{"found": False, "error": "Must provide zip_code, city, or state"}
 			)
-			if broker_resp.data:
-				broker = broker_resp.data[0]
 		
-		if not broker:
-			query = (
-				sb.table("brokers")
-				.select(
-					"id, contact_name, company_name, phone, email, nmls_number, nylas_grant_id, "
-					"address_city, address_state, address_zip, status, timezone"
-				)
-				.eq("status", "active")
-			)
-			if city:
-				query = query.ilike("address_city", f"%{city}%")
-			if state:
-				query = query.eq("address_state", state.upper())
-			if not city and not state and not zip_code:
-				return json.dumps(
-					{"found": False, "error": "Must provide zip_code, city, or state"}
-				)
-			response = query.limit(1).execute()
-			if response.data:
-				broker = response.data[0]
+		broker = get_territory_index().lookup(zip_code, city, state)
 		
 		if not broker:
 			return json.dumps({"found": False, "message": "No broker found for that territory."})
@@ -452,7 +423,7 @@ def verify_caller_identity_core(first_name: str, phone: str) -> str:
 	"""Core implementation for verifying caller identity."""
 	logger.info(f"Verifying caller identity: {first_name}, {phone}")
 	
-	lead_info_json = get_lead_context_core(phone)
+	lead_info_json = get_lead_context_core(phone, purpose="default")  # decides whether to insert a lead
 	lead_data = json.loads(lead_info_json)
 	
 	if lead_data.get("found"):
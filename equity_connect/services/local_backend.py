@@ -0,0 +1,522 @@
+"""In-memory stand-in for the Supabase client.
+
+Used for offline benchmarks, load tests and CI where hitting the real
+Supabase project is not an option. Select it with DATA_BACKEND=memory, or
+inject a client directly with `supabase.set_supabase_client()`.
+
+Supported query-builder subset (everything the services call today):
+- select (incl. `alias:fk(cols)` and `child!inner(cols)` embeds), insert, upsert, update, delete
+- eq, neq, ilike, like, in_, is_, gt/gte/lt/lte, or_
+- order, limit, single, maybe_single, execute
+- rpc(name, params) for functions registered with @register_rpc (the SQL
+  functions the services call, re-implemented in Python)
+
+Configuration:
+- LOCAL_BACKEND_FIXTURES: path to a JSON file {"table": [rows, ...], ...}
+- LOCAL_BACKEND_LATENCY_MS: injected latency per query, "base" or "base:jitter"
+"""
+import copy
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+Row = Dict[str, Any]
+
+
+@dataclass
+class LatencyProfile:
+	"""Injected latency (milliseconds) applied to every query."""
+	base_ms: float = 0.0
+	jitter_ms: float = 0.0
+
+	@classmethod
+	def parse(cls, value: Optional[str]) -> "LatencyProfile":
+		"""Parse "40" or "40:10" (base:jitter) into a profile."""
+		if not value:
+			return cls()
+		base, _, jitter = str(value).partition(":")
+		return cls(float(base or 0), float(jitter or 0))
+
+	def sleep(self) -> None:
+		delay_ms = self.base_ms
+		if self.jitter_ms:
+			delay_ms += random.uniform(-self.jitter_ms, self.jitter_ms)
+		if delay_ms > 0:
+			time.sleep(delay_ms / 1000.0)
+
+
+class LocalAPIError(Exception):
+	"""Mirrors postgrest.exceptions.APIError (message + PostgREST code)."""
+
+	def __init__(self, message: str, code: str = "PGRST116"):
+		super().__init__(message)
+		self.message = message
+		self.code = code
+
+
+class LocalResponse:
+	"""Mirrors postgrest APIResponse: `.data` and `.count`."""
+
+	def __init__(self, data: Any, count: Optional[int] = None):
+		self.data = data
+		self.count = count
+
+
+def _now() -> str:
+	return datetime.now(timezone.utc).isoformat()
+
+
+def _as_text(value: Any) -> str:
+	"""Render a value the way PostgREST compares it in filter strings."""
+	if isinstance(value, bool):
+		return "true" if value else "false"
+	if value is None:
+		return "null"
+	return str(value)
+
+
+def _like_regex(pattern: str, case_insensitive: bool) -> "re.Pattern[str]":
+	escaped = re.escape(pattern).replace("%", ".*").replace("_", ".")
+	flags = re.DOTALL | (re.IGNORECASE if case_insensitive else 0)
+	return re.compile(f"^{escaped}$", flags)
+
+
+def _make_predicate(column: str, operator: str, value: Any) -> Callable[[Row], bool]:
+	if operator == "eq":
+		return lambda row: row.get(column) == value or _as_text(row.get(column)) == _as_text(value)
+	if operator == "neq":
+		return lambda row: _as_text(row.get(column)) != _as_text(value)
+	if operator in ("like", "ilike"):
+		regex = _like_regex(str(value), operator == "ilike")
+		return lambda row: row.get(column) is not None and bool(regex.match(str(row.get(column))))
+	if operator == "in":
+		if isinstance(value, str):
+			value = [v.strip() for v in value.strip("()").split(",") if v.strip()]
+		wanted = {_as_text(v) for v in value}
+		return lambda row: _as_text(row.get(column)) in wanted
+	if operator == "is":
+		return lambda row: _as_text(row.get(column)) == _as_text(value)
+	if operator in ("gt", "gte", "lt", "lte"):
+		def compare(row: Row) -> bool:
+			current = row.get(column)
+			if current is None:
+				return False
+			try:
+				left, right = float(current), float(value)
+			except (TypeError, ValueError):
+				left, right = str(current), str(value)
+			if operator == "gt":
+				return left > right
+			if operator == "gte":
+				return left >= right
+			if operator == "lt":
+				return left < right
+			return left <= right
+		return compare
+	raise LocalAPIError(f"Unsupported filter operator: {operator}", code="PGRST100")
+
+
+def _split_top_level(text: str) -> List[str]:
+	"""Split on commas that are not nested inside parentheses."""
+	parts: List[str] = []
+	depth = 0
+	current = ""
+	for char in text:
+		if char == "(":
+			depth += 1
+		elif char == ")":
+			depth -= 1
+		if char == "," and depth == 0:
+			parts.append(current)
+			current = ""
+		else:
+			current += char
+	parts.append(current)
+	return [p.strip() for p in parts if p.strip()]
+
+
+# name -> handler(client, params) returning the function's result rows
+RPC_HANDLERS: Dict[str, Callable[["LocalClient", Dict[str, Any]], Any]] = {}
+
+
+def register_rpc(name: str):
+	"""Register a Python stand-in for a Postgres function called via .rpc()."""
+	def decorator(func):
+		RPC_HANDLERS[name] = func
+		return func
+	return decorator
+
+
+class LocalQuery:
+	"""Chainable query builder mirroring postgrest's SyncRequestBuilder."""
+
+	def __init__(self, client: "LocalClient", table: str):
+		self._client = client
+		self._table = table
+		self._select = "*"
+		self._filters: List[Callable[[Row], bool]] = []
+		self._order: List[tuple] = []
+		self._limit: Optional[int] = None
+		self._offset = 0
+		self._single = False
+		self._maybe_single = False
+		self._action = "select"
+		self._payload: Any = None
+
+	# ---- actions ----
+	def select(self, *columns: str, count: Optional[str] = None) -> "LocalQuery":
+		self._select = ",".join(columns) if columns else "*"
+		return self
+
+	def insert(self, payload: Any, **_: Any) -> "LocalQuery":
+		self._action, self._payload = "insert", payload
+		return self
+
+	def upsert(
+		self,
+		payload: Any,
+		on_conflict: str = "id",
+		ignore_duplicates: bool = False,
+		**_: Any,
+	) -> "LocalQuery":
+		self._action, self._payload = "upsert", payload
+		self._conflict = [c.strip() for c in (on_conflict or "id").split(",")]
+		self._ignore_duplicates = ignore_duplicates
+		return self
+
+	def update(self, payload: Row) -> "LocalQuery":
+		self._action, self._payload = "update", payload
+		return self
+
+	def delete(self) -> "LocalQuery":
+		self._action = "delete"
+		return self
+
+	# ---- filters ----
+	def eq(self, column: str, value: Any) -> "LocalQuery":
+		return self._filter(column, "eq", value)
+
+	def neq(self, column: str, value: Any) -> "LocalQuery":
+		return self._filter(column, "neq", value)
+
+	def gt(self, column: str, value: Any) -> "LocalQuery":
+		return self._filter(column, "gt", value)
+
+	def gte(self, column: str, value: Any) -> "LocalQuery":
+		return self._filter(column, "gte", value)
+
+	def lt(self, column: str, value: Any) -> "LocalQuery":
+		return self._filter(column, "lt", value)
+
+	def lte(self, column: str, value: Any) -> "LocalQuery":
+		return self._filter(column, "lte", value)
+
+	def like(self, column: str, pattern: str) -> "LocalQuery":
+		return self._filter(column, "like", pattern)
+
+	def ilike(self, column: str, pattern: str) -> "LocalQuery":
+		return self._filter(column, "ilike", pattern)
+
+	def in_(self, column: str, values: List[Any]) -> "LocalQuery":
+		return self._filter(column, "in", values)
+
+	def is_(self, column: str, value: Any) -> "LocalQuery":
+		return self._filter(column, "is", value)
+
+	def or_(self, filters: str) -> "LocalQuery":
+		predicates = []
+		for clause in _split_top_level(filters):
+			column, operator, value = clause.split(".", 2)
+			predicates.append(_make_predicate(column, operator, value))
+		self._filters.append(lambda row: any(p(row) for p in predicates))
+		return self
+
+	def _filter(self, column: str, operator: str, value: Any) -> "LocalQuery":
+		self._filters.append(_make_predicate(column, operator, value))
+		return self
+
+	# ---- modifiers ----
+	def order(self, column: str, desc: bool = False) -> "LocalQuery":
+		self._order.append((column, desc))
+		return self
+
+	def limit(self, count: int) -> "LocalQuery":
+		self._limit = count
+		return self
+
+	def range(self, start: int, end: int) -> "LocalQuery":
+		self._offset = start
+		self._limit = end - start + 1
+		return self
+
+	def single(self) -> "LocalQuery":
+		self._single = True
+		return self
+
+	def maybe_single(self) -> "LocalQuery":
+		self._maybe_single = True
+		return self
+
+	# ---- execution ----
+	def _upsert(self) -> List[Row]:
+		rows = self._payload if isinstance(self._payload, list) else [self._payload]
+		table = self._client.tables.setdefault(self._table, [])
+		written: List[Row] = []
+		for row in rows:
+			existing = next(
+				(r for r in table if all(_as_text(r.get(c)) == _as_text(row.get(c)) for c in self._conflict)),
+				None,
+			)
+			if existing is None:
+				written.extend(self._client._insert(self._table, row))
+			elif not self._ignore_duplicates:
+				existing.update(copy.deepcopy(row))
+				existing["updated_at"] = _now()
+				written.append(copy.deepcopy(existing))
+		return written
+
+	def execute(self) -> LocalResponse:
+		self._client.latency.sleep()
+		self._client.query_count += 1
+		with self._client.lock:
+			if self._action == "insert":
+				return LocalResponse(self._client._insert(self._table, self._payload))
+			if self._action == "upsert":
+				return LocalResponse(self._upsert())
+			rows = [r for r in self._client.tables.get(self._table, []) if all(f(r) for f in self._filters)]
+			if self._action == "update":
+				for row in rows:
+					row.update(copy.deepcopy(self._payload))
+					row["updated_at"] = _now()
+				return LocalResponse(copy.deepcopy(rows))
+			if self._action == "delete":
+				doomed = {id(row) for row in rows}
+				self._client.tables[self._table] = [
+					r for r in self._client.tables.get(self._table, []) if id(r) not in doomed
+				]
+				return LocalResponse(copy.deepcopy(rows))
+			for column, desc in reversed(self._order):
+				rows.sort(key=lambda r: (r.get(column) is None, r.get(column)), reverse=desc)
+			if self._limit is not None:
+				rows = rows[self._offset : self._offset + self._limit]
+			projected = [self._client._project(self._table, row, self._select) for row in rows]
+			projected = copy.deepcopy([row for row in projected if row is not None])
+		if self._single or self._maybe_single:
+			if len(projected) == 1:
+				return LocalResponse(projected[0])
+			if self._maybe_single and not projected:
+				return LocalResponse(None)
+			raise LocalAPIError(
+				f"JSON object requested, multiple (or no) rows returned ({len(projected)} rows)"
+			)
+		return LocalResponse(projected)
+
+
+class LocalRPC:
+	"""Result of LocalClient.rpc(); supports select() + execute() like SyncRPCFilterRequestBuilder."""
+
+	def __init__(self, client: "LocalClient", name: str, params: Dict[str, Any]):
+		self._client = client
+		self._name = name
+		self._params = params
+		self._select = "*"
+
+	def select(self, *columns: str) -> "LocalRPC":
+		self._select = ",".join(columns) if columns else "*"
+		return self
+
+	def execute(self) -> LocalResponse:
+		handler = RPC_HANDLERS.get(self._name)
+		if handler is None:
+			raise LocalAPIError(f"Could not find the function public.{self._name}", code="PGRST202")
+		self._client.latency.sleep()
+		self._client.query_count += 1
+		with self._client.lock:
+			data = handler(self._client, copy.deepcopy(self._params))
+			if isinstance(data, list):
+				data = [self._client._project(self._name, row, self._select) for row in data]
+			return LocalResponse(copy.deepcopy(data))
+
+
+class LocalClient:
+	"""In-memory Supabase client seeded from a dict of table name -> rows."""
+
+	def __init__(
+		self,
+		tables: Optional[Dict[str, List[Row]]] = None,
+		latency: Optional[LatencyProfile] = None,
+	):
+		self.tables: Dict[str, List[Row]] = {
+			name: [dict(row) for row in rows] for name, rows in (tables or {}).items()
+		}
+		self.latency = latency or LatencyProfile()
+		self.lock = threading.RLock()
+		self.query_count = 0
+
+	def table(self, name: str) -> LocalQuery:
+		return LocalQuery(self, name)
+
+	def rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> LocalRPC:
+		return LocalRPC(self, name, params or {})
+
+	def load_fixtures(self, path: str) -> "LocalClient":
+		"""Merge rows from a JSON fixture file ({"table": [rows]}) into the store."""
+		with open(path, "r", encoding="utf-8") as handle:
+			fixtures = json.load(handle)
+		with self.lock:
+			for name, rows in fixtures.items():
+				self.tables.setdefault(name, []).extend(dict(row) for row in rows)
+		logger.info(f"✅ Loaded local backend fixtures from {path}: {sorted(fixtures.keys())}")
+		return self
+
+	def _insert(self, table: str, payload: Any) -> List[Row]:
+		rows = payload if isinstance(payload, list) else [payload]
+		inserted = []
+		for row in rows:
+			record = {"id": str(uuid.uuid4()), "created_at": _now(), "updated_at": _now(), **copy.deepcopy(row)}
+			self.tables.setdefault(table, []).append(record)
+			inserted.append(copy.deepcopy(record))
+		return inserted
+
+	def _project(self, table: str, row: Row, select: str) -> Optional[Row]:
+		"""Apply a select string, including embedded resources.
+
+		`alias:fk_column(cols)` embeds the `alias` row whose id == row[fk_column];
+		`child[!inner](cols)` embeds child rows whose `<parent>_id` == row["id"].
+		"""
+		result: Row = {}
+		for token in _split_top_level(" ".join(select.split())):
+			if "(" not in token:
+				if token == "*":
+					result.update(row)
+				else:
+					result[token] = row.get(token)
+				continue
+			head, _, inner = token.partition("(")
+			inner = inner.rsplit(")", 1)[0]
+			head = head.strip()
+			if ":" in head:
+				alias, fk_column = [p.strip() for p in head.split(":", 1)]
+				related = next(
+					(r for r in self.tables.get(alias, []) if r.get("id") == row.get(fk_column)),
+					None,
+				)
+				result[alias] = self._project(alias, related, inner) if related else None
+				continue
+			child, _, hint = head.partition("!")
+			parent_key = f"{table.rstrip('s')}_id"
+			children = [
+				self._project(child, r, inner)
+				for r in self.tables.get(child, [])
+				if r.get(parent_key) == row.get("id")
+			]
+			if hint == "inner" and not children:
+				return None
+			result[child] = children
+		return result
+
+
+@register_rpc("apply_conversation_delta")
+def _rpc_apply_conversation_delta(client: LocalClient, params: Dict[str, Any]) -> List[Row]:
+	"""Mirror of public.apply_conversation_delta (20251201_conversation_state_delta.sql)."""
+	from equity_connect.services.conversation_state import apply_delta
+
+	candidates = set(params.get("p_phone_candidates") or [])
+	rows = [r for r in client.tables.get("conversation_state", []) if r.get("phone_number") in candidates]
+	if not rows:
+		return []
+	fields = params.get("p_fields") or {}
+	if {"id", "conversation_data"} & set(fields):
+		raise LocalAPIError("apply_conversation_delta: p_fields cannot set id or conversation_data", code="P0001")
+	row = max(rows, key=lambda r: r.get("updated_at") or "")
+	row.update(fields)
+	row["conversation_data"] = apply_delta(row.get("conversation_data") or {}, params.get("p_ops") or [])
+	row["updated_at"] = _now()
+	return [row]
+
+
+@register_rpc("find_leads_by_email")
+def _rpc_find_leads_by_email(client: LocalClient, params: Dict[str, Any]) -> List[Row]:
+	"""Mirror of public.find_leads_by_email (20251205_find_leads_by_email.sql)."""
+	wanted = set(params.get("p_emails") or [])
+	columns = ("id", "first_name", "last_name", "primary_email", "primary_phone", "primary_phone_e164")
+	return [
+		{column: row.get(column) for column in columns}
+		for row in client.tables.get("leads", [])
+		if (row.get("primary_email") or "").strip().lower() in wanted
+	]
+
+
+@register_rpc("dnc_numbers_export")
+def _rpc_dnc_numbers_export(client: LocalClient, params: Dict[str, Any]) -> List[Row]:
+	"""Mirror of public.dnc_numbers_export (20251204_dnc_numbers.sql); row position stands in for the identity id."""
+	after = params.get("p_after_id") or 0
+	grouped: Dict[str, List[str]] = {}
+	max_ids: Dict[str, int] = {}
+	for position, row in enumerate(client.tables.get("dnc_numbers", []), start=1):
+		if position > after:
+			grouped.setdefault(row["list_type"], []).append(row["phone_number"])
+			max_ids[row["list_type"]] = position
+	return [
+		{"list_type": list_type, "numbers": "".join(sorted(numbers)), "max_id": max_ids[list_type]}
+		for list_type, numbers in grouped.items()
+	]
+
+
+@register_rpc("record_appointment_booking")
+def _rpc_record_appointment_booking(client: LocalClient, params: Dict[str, Any]) -> str:
+	"""Mirror of public.record_appointment_booking (20251202_record_appointment_booking.sql)."""
+	interaction_id = params["p_interaction_id"]
+	if any(r.get("id") == interaction_id for r in client.tables.get("interactions", [])):
+		return interaction_id
+	client._insert("interactions", {
+		"id": interaction_id,
+		"lead_id": params["p_lead_id"],
+		"broker_id": params["p_broker_id"],
+		"type": "appointment",
+		"direction": "outbound",
+		"content": params.get("p_content"),
+		"outcome": "appointment_booked",
+		"scheduled_for": params.get("p_scheduled_for"),
+		"metadata": params.get("p_metadata") or {},
+	})
+	for lead in client.tables.get("leads", []):
+		if lead.get("id") == params["p_lead_id"]:
+			lead.update({"status": "appointment_set", "last_engagement": _now(), "updated_at": _now()})
+	client._insert("billing_events", {
+		"broker_id": params["p_broker_id"],
+		"lead_id": params["p_lead_id"],
+		"event_type": "appointment_set",
+		"amount": params.get("p_billing_amount", 50),
+		"status": "pending",
+		"metadata": params.get("p_billing_metadata") or {},
+	})
+	if params.get("p_phone_candidates") and params.get("p_conversation_ops"):
+		_rpc_apply_conversation_delta(client, {
+			"p_phone_candidates": params["p_phone_candidates"],
+			"p_ops": params["p_conversation_ops"],
+		})
+	return interaction_id
+
+
+def create_local_client() -> LocalClient:
+	"""Build a LocalClient from LOCAL_BACKEND_FIXTURES / LOCAL_BACKEND_LATENCY_MS."""
+	client = LocalClient(latency=LatencyProfile.parse(os.getenv("LOCAL_BACKEND_LATENCY_MS")))
+	fixtures_path = os.getenv("LOCAL_BACKEND_FIXTURES")
+	if fixtures_path:
+		client.load_fixtures(fixtures_path)
+	logger.warning(
+		f"⚠️ Using in-memory local data backend (latency={client.latency.base_ms}ms"
+		f"±{client.latency.jitter_ms}ms) - NOT connected to Supabase"
+	)
+	return client
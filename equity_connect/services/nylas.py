@@ -10,6 +10,20 @@ logger = logging.getLogger(__name__)
 NYLAS_API_KEY = os.getenv("NYLAS_API_KEY")
 NYLAS_API_URL = os.getenv("NYLAS_API_URL", "https://api.us.nylas.com")
 
+_http_client: Optional[httpx.Client] = None
+
+def get_http_client() -> httpx.Client:
+	"""Shared keep-alive client so calls reuse warm TLS connections"""
+	global _http_client
+	if _http_client is None:
+		_http_client = httpx.Client(timeout=15.0)  # 15 second timeout
+	return _http_client
+
+def warm_up() -> None:
+	"""Open a connection to the Nylas API ahead of the first call"""
+	if NYLAS_API_KEY:
+		get_http_client().get(NYLAS_API_URL, timeout=5.0)
+
 def get_broker_events(grant_id: str, start_time: int, end_time: int) -> List[Dict[str, int]]:
 	"""Get broker's calendar events for availability checking
 	
@@ -26,31 +40,31 @@ def get_broker_events(grant_id: str, start_time: int, end_time: int) -> List[Dic
 	
 	url = f"{NYLAS_API_URL}/v3/grants/{grant_id}/events?calendar_id=primary&start={start_time}&end={end_time}"
 	
-	with httpx.Client(timeout=15.0) as client:  # 15 second timeout
-		response = client.get(
-			url,
-			headers={
-				"Authorization": f"Bearer {NYLAS_API_KEY}",
-				"Content-Type": "application/json"
-			}
-		)
-		
-		if response.status_code != 200:
-			logger.error(f"Nylas events API failed: {response.status_code} {response.text}")
-			raise Exception(f"Nylas events API failed: {response.status_code}")
-		
-		data = response.json()
-		events = []
-		
-		for event in data.get("data", []):
-			when = event.get("when", {})
-			if "start_time" in when and "end_time" in when:
-				events.append({
-					"start": when["start_time"] * 1000,  # Convert to ms
-					"end": when["end_time"] * 1000
-				})
-		
-		return events
+	client = get_http_client()
+	response = client.get(
+		url,
+		headers={
+			"Authorization": f"Bearer {NYLAS_API_KEY}",
+			"Content-Type": "application/json"
+		}
+	)
+	
+	if response.status_code != 200:
+		logger.error(f"Nylas events API failed: {response.status_code} {response.text}")
+		raise Exception(f"Nylas events API failed: {response.status_code}")
+	
+	data = response.json()
+	events = []
+	
+	for event in data.get("data", []):
+		when = event.get("when", {})
+		if "start_time" in when and "end_time" in when:
+			events.append({
+				"start": when["start_time"] * 1000,  # Convert to ms
+				"end": when["end_time"] * 1000
+			})
+	
+	return events
 
 def find_free_slots(
 	start_ms: int,
@@ -215,21 +229,21 @@ def create_calendar_event(grant_id: str, event_data: Dict[str, Any], calendar_id
 		"participants": participants
 	}
 	
-	with httpx.Client(timeout=15.0) as client:  # 15 second timeout
-		response = client.post(
-			url,
-			headers={
-				"Authorization": f"Bearer {NYLAS_API_KEY}",
-				"Content-Type": "application/json"
-			},
-			json=payload
-		)
-		
-		if response.status_code not in [200, 201]:
-			logger.error(f"Nylas create event failed: {response.status_code} {response.text}")
-			raise Exception(f"Nylas create event failed: {response.status_code}")
-		
-		data = response.json()
-		return data.get("data", {}).get("id", "")
+	client = get_http_client()
+	response = client.post(
+		url,
+		headers={
+			"Authorization": f"Bearer {NYLAS_API_KEY}",
+			"Content-Type": "application/json"
+		},
+		json=payload
+	)
+	
+	if response.status_code not in [200, 201]:
+		logger.error(f"Nylas create event failed: {response.status_code} {response.text}")
+		raise Exception(f"Nylas create event failed: {response.status_code}")
+	
+	data = response.json()
+	return data.get("data", {}).get("id", "")
 
 
@@ -0,0 +1,321 @@
+"""Durable local outbox for fire-and-forget database writes.
+
+Call teardown (record_interaction, on_summary) and booking confirmations
+enqueue their writes here instead of waiting on Supabase. Entries are stored
+in a local SQLite file (WAL) and a background worker flushes them in batches:
+- insert: consecutive inserts into the same table go out as one bulk upsert
+- upsert: insert-or-overwrite on a natural key (rows must be safe to rewrite)
+- update: PATCH with an eq-filter per matched column
+- delete: DELETE with an eq-filter per matched column
+- rpc: Postgres function call (the function must be idempotent itself)
+
+Idempotency: every insert row gets a client-generated `id` before it is
+queued and is flushed with upsert(ignore_duplicates) on that id, so a retry
+after a timeout never double-writes. `key` de-duplicates the enqueue itself.
+
+Failed entries retry with exponential backoff (capped) and are marked dead
+after OUTBOX_MAX_ATTEMPTS. A failing batch is retried row by row so one bad
+row cannot block the rest. Pending entries survive process restarts; to keep
+them across machine replacement, point OUTBOX_PATH at a mounted volume.
+
+Configuration:
+- OUTBOX_ENABLED: "false" writes synchronously instead (default true)
+- OUTBOX_PATH: SQLite file (default /tmp/barbara-outbox.sqlite3)
+- OUTBOX_BATCH_SIZE (100), OUTBOX_FLUSH_INTERVAL_MS (250), OUTBOX_MAX_ATTEMPTS (20)
+"""
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from equity_connect.services.supabase import get_supabase_client
+
+logger = logging.getLogger(__name__)
+
+MAX_BACKOFF_SECONDS = 300
+
+_outbox: Optional["Outbox"] = None
+_outbox_lock = threading.Lock()
+
+
+class Outbox:
+	"""SQLite-backed write queue with a background batch worker."""
+
+	def __init__(
+		self,
+		path: str,
+		batch_size: int = 100,
+		flush_interval: float = 0.25,
+		max_attempts: int = 20,
+	):
+		self.path = path
+		self.batch_size = batch_size
+		self.flush_interval = flush_interval
+		self.max_attempts = max_attempts
+		self._lock = threading.Lock()
+		self._wake = threading.Event()
+		self._stop = threading.Event()
+		self._thread: Optional[threading.Thread] = None
+
+		directory = os.path.dirname(path)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+		self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+		self._conn.execute("PRAGMA journal_mode=WAL")
+		self._conn.execute("PRAGMA synchronous=NORMAL")
+		self._conn.execute(
+			"""
+			CREATE TABLE IF NOT EXISTS outbox (
+				seq INTEGER PRIMARY KEY AUTOINCREMENT,
+				key TEXT NOT NULL UNIQUE,
+				op TEXT NOT NULL,
+				target TEXT NOT NULL,
+				payload TEXT NOT NULL,
+				status TEXT NOT NULL DEFAULT 'pending',
+				attempts INTEGER NOT NULL DEFAULT 0,
+				next_attempt_at REAL NOT NULL DEFAULT 0,
+				last_error TEXT,
+				created_at REAL NOT NULL
+			)
+			"""
+		)
+		self._conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox(status, next_attempt_at, seq)")
+
+	# ---- enqueue ----
+	def _enqueue(self, op: str, target: str, payload: Dict[str, Any], key: str) -> str:
+		with self._lock:
+			self._conn.execute(
+				"INSERT OR IGNORE INTO outbox (key, op, target, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+				(key, op, target, json.dumps(payload, default=str), time.time()),
+			)
+		self._wake.set()
+		return key
+
+	def insert(self, table: str, row: Dict[str, Any], key: Optional[str] = None) -> str:
+		"""Queue an insert; returns the row id (assigned here if the row has none)."""
+		row = dict(row)
+		row.setdefault("id", str(uuid.uuid4()))
+		self._enqueue("insert", table, row, key or f"{table}:{row['id']}")
+		return row["id"]
+
+	def upsert(self, table: str, row: Dict[str, Any], on_conflict: str, key: Optional[str] = None) -> str:
+		"""Queue an insert that overwrites the row already holding the `on_conflict` columns."""
+		return self._enqueue("upsert", table, {"row": row, "on_conflict": on_conflict}, key or str(uuid.uuid4()))
+
+	def update(self, table: str, values: Dict[str, Any], match: Dict[str, Any], key: Optional[str] = None) -> str:
+		"""Queue `UPDATE table SET values WHERE match` (plain overwrites are retry-safe)."""
+		return self._enqueue("update", table, {"values": values, "match": match}, key or str(uuid.uuid4()))
+
+	def delete(self, table: str, match: Dict[str, Any], key: Optional[str] = None) -> str:
+		"""Queue `DELETE FROM table WHERE match`."""
+		return self._enqueue("delete", table, {"match": match}, key or str(uuid.uuid4()))
+
+	def rpc(self, function: str, params: Dict[str, Any], key: Optional[str] = None) -> str:
+		"""Queue a Postgres function call. Pass a stable key; the function must be idempotent."""
+		return self._enqueue("rpc", function, params, key or str(uuid.uuid4()))
+
+	# ---- worker ----
+	def start(self) -> "Outbox":
+		if self._thread is None or not self._thread.is_alive():
+			self._stop.clear()
+			self._thread = threading.Thread(target=self._run, name="outbox-worker", daemon=True)
+			self._thread.start()
+		return self
+
+	def stop(self, drain_timeout: float = 5.0) -> None:
+		"""Flush what is due (bounded by drain_timeout) and stop the worker."""
+		self.flush(timeout=drain_timeout)
+		self._stop.set()
+		self._wake.set()
+		if self._thread:
+			self._thread.join(timeout=1.0)
+
+	def pending_count(self) -> int:
+		with self._lock:
+			return self._conn.execute("SELECT COUNT(*) FROM outbox WHERE status = 'pending'").fetchone()[0]
+
+	def flush(self, timeout: float = 5.0) -> int:
+		"""Process due entries until none are left or timeout expires; returns entries written."""
+		deadline = time.monotonic() + timeout
+		written = 0
+		while time.monotonic() < deadline:
+			processed = self.process_batch()
+			if not processed:
+				break
+			written += processed
+		return written
+
+	def _run(self) -> None:
+		while not self._stop.is_set():
+			self._wake.wait(self.flush_interval)
+			self._wake.clear()
+			try:
+				while self.process_batch() == self.batch_size and not self._stop.is_set():
+					pass
+			except Exception as e:
+				logger.error(f"❌ Outbox worker error: {e}", exc_info=True)
+
+	def _due(self) -> List[sqlite3.Row]:
+		with self._lock:
+			cursor = self._conn.execute(
+				"SELECT seq, key, op, target, payload, attempts FROM outbox "
+				"WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY seq LIMIT ?",
+				(time.time(), self.batch_size),
+			)
+			return cursor.fetchall()
+
+	def process_batch(self) -> int:
+		"""Write one batch of due entries; returns how many succeeded."""
+		entries = self._due()
+		if not entries:
+			return 0
+		sb = get_supabase_client("background")
+		done: List[int] = []
+		index = 0
+		while index < len(entries):
+			seq, key, op, target, payload, attempts = entries[index]
+			if op == "insert":
+				# Group the run of consecutive inserts into the same table (keeps ordering)
+				run = [entries[index]]
+				while index + len(run) < len(entries):
+					nxt = entries[index + len(run)]
+					if nxt[2] != "insert" or nxt[3] != target:
+						break
+					run.append(nxt)
+				index += len(run)
+				done.extend(self._write_inserts(sb, target, run))
+				continue
+			index += 1
+			try:
+				self._write_one(sb, op, target, json.loads(payload))
+				done.append(seq)
+			except Exception as e:
+				self._record_failure(seq, key, attempts, e)
+		if done:
+			with self._lock:
+				self._conn.executemany("DELETE FROM outbox WHERE seq = ?", [(s,) for s in done])
+		return len(done)
+
+	def _write_inserts(self, sb, table: str, run: List[sqlite3.Row]) -> List[int]:
+		rows = [json.loads(entry[4]) for entry in run]
+		try:
+			self._upsert(sb, table, rows)
+			return [entry[0] for entry in run]
+		except Exception as batch_error:
+			if len(run) == 1:
+				self._record_failure(run[0][0], run[0][1], run[0][5], batch_error)
+				return []
+			logger.warning(f"⚠️ Outbox batch insert into {table} failed ({batch_error}); retrying row by row")
+		written = []
+		for entry, row in zip(run, rows):
+			try:
+				self._upsert(sb, table, [row])
+				written.append(entry[0])
+			except Exception as e:
+				self._record_failure(entry[0], entry[1], entry[5], e)
+		return written
+
+	@staticmethod
+	def _upsert(sb, table: str, rows: List[Dict[str, Any]]) -> None:
+		sb.table(table).upsert(
+			rows,
+			on_conflict="id",
+			ignore_duplicates=True,
+			returning="minimal",
+			default_to_null=False,
+		).execute()
+
+	@staticmethod
+	def _write_one(sb, op: str, target: str, payload: Dict[str, Any]) -> None:
+		if op in ("update", "delete"):
+			query = sb.table(target)
+			query = query.update(payload["values"]) if op == "update" else query.delete()
+			for column, value in payload["match"].items():
+				query = query.eq(column, value)
+			query.execute()
+		elif op == "upsert":
+			sb.table(target).upsert(
+				payload["row"],
+				on_conflict=payload["on_conflict"],
+				returning="minimal",
+				default_to_null=False,
+			).execute()
+		elif op == "rpc":
+			sb.rpc(target, payload).execute()
+		else:
+			raise ValueError(f"Unknown outbox op: {op}")
+
+	def _record_failure(self, seq: int, key: str, attempts: int, error: Exception) -> None:
+		attempts += 1
+		if attempts >= self.max_attempts:
+			status, next_attempt = "dead", 0.0
+			logger.error(f"❌ Outbox entry {key} dead after {attempts} attempts: {error}")
+		else:
+			status = "pending"
+			next_attempt = time.time() + min(2 ** attempts, MAX_BACKOFF_SECONDS)
+			logger.warning(f"⚠️ Outbox entry {key} failed (attempt {attempts}): {error}")
+		with self._lock:
+			self._conn.execute(
+				"UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ? WHERE seq = ?",
+				(status, attempts, next_attempt, str(error)[:1000], seq),
+			)
+
+
+class _InlineOutbox:
+	"""OUTBOX_ENABLED=false: same interface, writes immediately (errors propagate)."""
+
+	def insert(self, table: str, row: Dict[str, Any], key: Optional[str] = None) -> str:
+		row = dict(row)
+		row.setdefault("id", str(uuid.uuid4()))
+		Outbox._upsert(get_supabase_client(), table, [row])
+		return row["id"]
+
+	def upsert(self, table: str, row: Dict[str, Any], on_conflict: str, key: Optional[str] = None) -> str:
+		Outbox._write_one(get_supabase_client(), "upsert", table, {"row": row, "on_conflict": on_conflict})
+		return key or ""
+
+	def update(self, table: str, values: Dict[str, Any], match: Dict[str, Any], key: Optional[str] = None) -> str:
+		Outbox._write_one(get_supabase_client(), "update", table, {"values": values, "match": match})
+		return key or ""
+
+	def delete(self, table: str, match: Dict[str, Any], key: Optional[str] = None) -> str:
+		Outbox._write_one(get_supabase_client(), "delete", table, {"match": match})
+		return key or ""
+
+	def rpc(self, function: str, params: Dict[str, Any], key: Optional[str] = None) -> str:
+		Outbox._write_one(get_supabase_client(), "rpc", function, params)
+		return key or ""
+
+	def flush(self, timeout: float = 5.0) -> int:
+		return 0
+
+	def pending_count(self) -> int:
+		return 0
+
+	def stop(self, drain_timeout: float = 5.0) -> None:
+		pass
+
+
+def get_outbox():
+	"""Get or create the process-wide outbox (worker started on first use)."""
+	global _outbox
+	if _outbox is None:
+		with _outbox_lock:
+			if _outbox is None:
+				if os.getenv("OUTBOX_ENABLED", "true").lower() in ("0", "false", "no"):
+					_outbox = _InlineOutbox()
+				else:
+					_outbox = Outbox(
+						os.getenv("OUTBOX_PATH", "/tmp/barbara-outbox.sqlite3"),
+						batch_size=int(os.getenv("OUTBOX_BATCH_SIZE", "100")),
+						flush_interval=int(os.getenv("OUTBOX_FLUSH_INTERVAL_MS", "250")) / 1000.0,
+						max_attempts=int(os.getenv("OUTBOX_MAX_ATTEMPTS", "20")),
+					).start()
+					atexit.register(_outbox.stop)
+					logger.info(f"✅ Outbox ready at {_outbox.path} ({_outbox.pending_count()} pending)")
+	return _outbox
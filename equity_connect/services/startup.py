@@ -0,0 +1,169 @@
+"""Agent startup: parallel config fetch, connection warm-up and readiness.
+
+BarbaraAgent needs agent_params, the contexts (theme + node prompts) and the
+voice config before it can render SWML. Those are independent Supabase reads,
+so fetch_parallel() runs them side by side instead of one after another.
+
+warm_up_in_background() then opens the HTTP pools the first call would
+otherwise pay for (Supabase, Nylas, Vertex incl. the OAuth token), loads the
+broker territory and DNC indexes and every routed vertical's profile, and
+flips readiness. /healthz (see install_health_routes) answers 503 until that
+has happened, so Fly only routes calls to a machine once it is warm. The
+report also carries the Supabase connection pool counters.
+
+Configuration:
+- STARTUP_WARMUP_TIMEOUT_S: upper bound for the warm-up phase (default 10)
+- FAST_START: "true" warms only Supabase (+ territories, DNC) before reporting ready;
+  the optional integrations (Nylas, Vertex) and other verticals load on first
+  use instead
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_ready = threading.Event()
+_report: Dict[str, Any] = {"status": "starting", "timings_ms": {}, "errors": {}}
+_started_at = time.monotonic()
+
+
+def fetch_parallel(tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+	"""
+	Run independent startup fetches concurrently.
+
+	Returns name -> result; a task that raised maps to its exception so the
+	caller can apply its own fallback.
+	"""
+	results: Dict[str, Any] = {}
+	started = time.monotonic()
+	with ThreadPoolExecutor(max_workers=max(1, len(tasks)), thread_name_prefix="startup") as executor:
+		futures = {name: executor.submit(_timed, name, task) for name, task in tasks.items()}
+		for name, future in futures.items():
+			try:
+				results[name] = future.result()
+			except Exception as e:
+				logger.error(f"❌ Startup fetch '{name}' failed: {e}")
+				_report["errors"][name] = str(e)
+				results[name] = e
+	_report["timings_ms"]["config_fetch"] = int((time.monotonic() - started) * 1000)
+	logger.info(f"✅ Startup config fetched in {_report['timings_ms']['config_fetch']}ms ({', '.join(tasks)})")
+	return results
+
+
+def _timed(name: str, task: Callable[[], Any]) -> Any:
+	started = time.monotonic()
+	try:
+		return task()
+	finally:
+		_report["timings_ms"][name] = int((time.monotonic() - started) * 1000)
+
+
+def _warm_supabase() -> None:
+	from equity_connect.services.supabase import get_supabase_client
+	primary = get_supabase_client()
+	primary.table("agent_params").select("id").limit(1).execute()
+	replica = get_supabase_client("read")
+	if replica is not primary:
+		replica.table("agent_params").select("id").limit(1).execute()
+
+
+def _warm_territories() -> None:
+	from equity_connect.services.territory_index import get_territory_index
+	get_territory_index()
+
+
+def _warm_dnc() -> None:
+	from equity_connect.services.dnc_index import get_dnc_index
+	get_dnc_index()
+
+
+def _warm_verticals() -> None:
+	from equity_connect.services.verticals import preload_profiles
+	preload_profiles()
+
+
+def _warm_nylas() -> None:
+	from equity_connect.services.nylas import warm_up
+	warm_up()
+
+
+def _warm_vertex() -> None:
+	from equity_connect.services.vertex import warm_up
+	warm_up()
+
+
+WARMUP_TASKS: Dict[str, Callable[[], None]] = {
+	"supabase": _warm_supabase,
+	"territories": _warm_territories,
+	"dnc": _warm_dnc,
+	"verticals": _warm_verticals,
+	"nylas": _warm_nylas,
+	"vertex": _warm_vertex,
+}
+OPTIONAL_WARMUPS = ("verticals", "nylas", "vertex")
+
+
+def fast_start_enabled() -> bool:
+	return os.getenv("FAST_START", "false").lower() in ("1", "true", "yes")
+
+
+def warm_up(timeout: Optional[float] = None) -> None:
+	"""Open connection pools / fetch tokens (best effort) and mark the process ready."""
+	timeout = timeout if timeout is not None else float(os.getenv("STARTUP_WARMUP_TIMEOUT_S", "10"))
+	tasks = dict(WARMUP_TASKS)
+	if fast_start_enabled():
+		for name in OPTIONAL_WARMUPS:
+			tasks.pop(name, None)
+	started = time.monotonic()
+	executor = ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="warmup")
+	futures = {name: executor.submit(_timed, f"warm_{name}", task) for name, task in tasks.items()}
+	for name, future in futures.items():
+		remaining = max(0.0, timeout - (time.monotonic() - started))
+		try:
+			future.result(timeout=remaining)
+		except Exception as e:
+			# A cold pool is slower, not broken: log and carry on
+			logger.warning(f"⚠️ Warm-up '{name}' skipped: {e or type(e).__name__}")
+			_report["errors"][f"warm_{name}"] = str(e) or type(e).__name__
+	executor.shutdown(wait=False)
+	_report["timings_ms"]["warm_up"] = int((time.monotonic() - started) * 1000)
+	mark_ready()
+
+
+def warm_up_in_background(timeout: Optional[float] = None) -> threading.Thread:
+	thread = threading.Thread(target=warm_up, args=(timeout,), name="startup-warmup", daemon=True)
+	thread.start()
+	return thread
+
+
+def mark_ready() -> None:
+	if not _ready.is_set():
+		_report["status"] = "ready"
+		_report["timings_ms"]["total"] = int((time.monotonic() - _started_at) * 1000)
+		_ready.set()
+		logger.info(f"✅ Agent ready in {_report['timings_ms']['total']}ms since import")
+
+
+def is_ready() -> bool:
+	return _ready.is_set()
+
+
+def readiness_report() -> Dict[str, Any]:
+	from equity_connect.services.supabase import supabase_pool_stats
+	return {**_report, "ready": is_ready(), "supabase_pools": supabase_pool_stats()}
+
+
+def install_health_routes(app) -> None:
+	"""Add GET /healthz (readiness) ahead of the SDK's catch-all route."""
+	from fastapi.responses import JSONResponse
+
+	async def healthz():
+		return JSONResponse(readiness_report(), status_code=200 if is_ready() else 503)
+
+	app.add_api_route("/healthz", healthz, methods=["GET"])
+	# Starlette matches in order and the SDK registers "/{full_path:path}" first
+	app.router.routes.insert(0, app.router.routes.pop())
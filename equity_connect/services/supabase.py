@@ -1,23 +1,196 @@
-"""Supabase service for database operations"""
-from typing import Optional, Dict, Any, List
-from supabase import create_client, Client
+"""Supabase service for database operations
+
+All Supabase access in a process goes through one client registry. Each
+purpose gets its own client on its own pooled httpx connection pool, so
+slow background writes never take the sockets hot-path reads are waiting for:
+- "default": hot-path reads/writes while a call is live (short timeout)
+- "background": outbox flushes, chunk loads, scripts (long timeout)
+- "read": read-only lookups that tolerate replica lag (lead context, territory,
+  KB search, prompts/config). Served by SUPABASE_READ_REPLICA_URL when set,
+  otherwise the same client as "default". Writes and read-your-writes lookups
+  (conversation_state, DNC/consent, identity checks) stay on "default".
+
+Configuration (SUPABASE_<PURPOSE>_<NAME> overrides SUPABASE_<NAME>):
+- SUPABASE_MAX_CONNECTIONS: pool size per purpose (default 20)
+- SUPABASE_MAX_KEEPALIVE: idle connections kept open (default 10)
+- SUPABASE_KEEPALIVE_EXPIRY_S: idle connection lifetime (default 30)
+- SUPABASE_TIMEOUT_S: request timeout (default 10; background 60). supabase-py's
+  own default was 120 s: long RPCs on "default"/"read" now fail after 10 s, so
+  run them on "background" or raise SUPABASE_<PURPOSE>_TIMEOUT_S
+- SUPABASE_CONNECT_TIMEOUT_S: connect timeout (default 5)
+- SUPABASE_HTTP2: "false" disables HTTP/2 multiplexing (default true; needs h2)
+- SUPABASE_READ_REPLICA_URL: API URL of a read replica for the "read" purpose
+"""
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 import os
 import logging
+import threading
+
+from equity_connect.services.transcripts import Transcript
+
+if TYPE_CHECKING:
+	import httpx
+	from supabase import Client
 
 logger = logging.getLogger(__name__)
 
-_supabase_client: Optional[Client] = None
+PURPOSES = ("default", "background", "read")
+_DEFAULT_TIMEOUTS = {"default": 10.0, "background": 60.0, "read": 10.0}
+
+_clients: Dict[str, "Client"] = {}
+_pools: Dict[str, "_Pool"] = {}
+_override: Optional["Client"] = None
+_supabase_client_lock = threading.Lock()
+
+
+class _Pool:
+	"""httpx client shared by one purpose's Supabase client, with request counters."""
+
+	def __init__(self, purpose: str):
+		import httpx
+
+		self.purpose = purpose
+		self.max_connections = int(_setting(purpose, "MAX_CONNECTIONS", "20"))
+		self.max_keepalive = int(_setting(purpose, "MAX_KEEPALIVE", "10"))
+		self.timeout = float(_setting(purpose, "TIMEOUT_S", str(_DEFAULT_TIMEOUTS[purpose])))
+		self.http2 = _setting(purpose, "HTTP2", "true").lower() not in ("0", "false", "no")
+		self.requests = 0
+		self.in_flight = 0
+		self.failures = 0
+		self._lock = threading.Lock()
+		self._transport = httpx.HTTPTransport(
+			http2=self.http2,
+			limits=httpx.Limits(
+				max_connections=self.max_connections,
+				max_keepalive_connections=self.max_keepalive,
+				keepalive_expiry=float(_setting(purpose, "KEEPALIVE_EXPIRY_S", "30")),
+			),
+		)
+		self.http = httpx.Client(
+			transport=self,
+			follow_redirects=True,
+			timeout=httpx.Timeout(self.timeout, connect=float(_setting(purpose, "CONNECT_TIMEOUT_S", "5"))),
+		)
+
+	# httpx transport interface: count every request around the pooled transport
+	def handle_request(self, request: "httpx.Request") -> "httpx.Response":
+		with self._lock:
+			self.requests += 1
+			self.in_flight += 1
+		try:
+			response = self._transport.handle_request(request)
+		except Exception:
+			with self._lock:
+				self.failures += 1
+			raise
+		finally:
+			with self._lock:
+				self.in_flight -= 1
+		if response.status_code >= 500:
+			with self._lock:
+				self.failures += 1
+		return response
+
+	def close(self) -> None:
+		self._transport.close()
+
+	def _connections(self) -> Optional[List[Any]]:
+		# httpcore internals (HTTPTransport._pool.connections); None if a release moves them
+		try:
+			return list(getattr(getattr(self._transport, "_pool", None), "connections"))
+		except (AttributeError, TypeError):
+			return None
+
+	def stats(self) -> Dict[str, Any]:
+		connections = self._connections()
+		with self._lock:
+			stats = {
+				"max_connections": self.max_connections,
+				"max_keepalive": self.max_keepalive,
+				"timeout_s": self.timeout,
+				"http2": self.http2,
+				"requests": self.requests,
+				"in_flight": self.in_flight,
+				"failures": self.failures,
+			}
+		if connections is not None:
+			stats["open_connections"] = len(connections)
+			stats["idle_connections"] = sum(1 for conn in connections if getattr(conn, "is_idle", lambda: False)())
+		return stats
+
+
+def _setting(purpose: str, name: str, default: str) -> str:
+	return os.getenv(f"SUPABASE_{purpose.upper()}_{name}") or os.getenv(f"SUPABASE_{name}") or default
 
-def get_supabase_client() -> Client:
-	"""Get or create Supabase client singleton"""
-	global _supabase_client
-	if _supabase_client is None:
-		supabase_url = os.getenv("SUPABASE_URL")
-		supabase_key = os.getenv("SUPABASE_SERVICE_KEY")
-		if not supabase_url or not supabase_key:
-			raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY environment variables required")
-		_supabase_client = create_client(supabase_url, supabase_key)
-	return _supabase_client
+
+def get_supabase_client(purpose: str = "default") -> "Client":
+	"""Get or create the shared Supabase client for `purpose` (see PURPOSES)
+
+	DATA_BACKEND=memory swaps in the in-memory stand-in from local_backend
+	(offline benchmarks / load tests) for every purpose. Default is the real
+	Supabase project. The supabase SDK (~180ms to import) is only loaded when
+	the real client is built.
+	"""
+	if _override is not None:
+		return _override
+	client = _clients.get(purpose)
+	if client is None:
+		if purpose not in PURPOSES:
+			raise ValueError(f"Unknown Supabase client purpose: {purpose}")
+		with _supabase_client_lock:
+			client = _clients.get(purpose)
+			if client is None:
+				client = _clients[purpose] = _create_client(purpose)
+	return client
+
+
+def _create_client(purpose: str) -> "Client":
+	global _override
+	if os.getenv("DATA_BACKEND", "supabase").lower() == "memory":
+		from equity_connect.services.local_backend import create_local_client
+		_override = create_local_client()
+		return _override
+	supabase_url = os.getenv("SUPABASE_URL")
+	if purpose == "read":
+		replica_url = os.getenv("SUPABASE_READ_REPLICA_URL")
+		if not replica_url:
+			# No replica configured: reads share the primary's hot-path client
+			if "default" not in _clients:
+				_clients["default"] = _create_client("default")
+			return _clients["default"]
+		supabase_url = replica_url
+	# SUPABASE_KEY: what the step-criteria scripts and backend_integration examples used
+	supabase_key = (
+		os.getenv("SUPABASE_SERVICE_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
+	)
+	if not supabase_url or not supabase_key:
+		raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY (or SUPABASE_SERVICE_ROLE_KEY / SUPABASE_KEY) environment variables required")
+	from supabase import ClientOptions, create_client
+
+	pool = _pools[purpose] = _Pool(purpose)
+	client = create_client(supabase_url, supabase_key, options=ClientOptions(httpx_client=pool.http))
+	logger.info(
+		f"✅ Supabase client '{purpose}' ready ({supabase_url.split('//')[-1]}, pool {pool.max_connections}, "
+		f"timeout {pool.timeout:g}s, http2={pool.http2})"
+	)
+	return client
+
+
+def set_supabase_client(client: Optional["Client"]) -> None:
+	"""Override the shared client for every purpose (e.g. with a local_backend.LocalClient); None resets it"""
+	global _override
+	with _supabase_client_lock:
+		_override = client
+		if client is None:
+			_clients.clear()
+			for pool in _pools.values():
+				pool.http.close()
+			_pools.clear()
+
+
+def supabase_pool_stats() -> Dict[str, Dict[str, Any]]:
+	"""Connection pool / request counters per purpose (only purposes that were used)"""
+	return {purpose: pool.stats() for purpose, pool in list(_pools.items())}
 
 async def get_phone_config(called_number: str) -> Dict[str, Any]:
 	"""
@@ -29,7 +202,7 @@ async def get_phone_config(called_number: str) -> Dict[str, Any]:
 	Returns:
 	    Dict with provider config: stt_provider, stt_model, tts_provider, etc.
 	"""
-	supabase = get_supabase_client()
+	supabase = get_supabase_client("read")
 	
 	# Normalize phone number for lookup
 	normalized = normalize_phone(called_number)
@@ -83,7 +256,7 @@ async def get_lead_by_phone(phone: str) -> Optional[Dict[str, Any]]:
 	Returns:
 	    Lead dict with broker info, or None if not found
 	"""
-	supabase = get_supabase_client()
+	supabase = get_supabase_client("read")
 	
 	# Generate search patterns
 	import re
@@ -125,49 +298,24 @@ async def get_lead_by_phone(phone: str) -> Optional[Dict[str, Any]]:
 	
 	return None
 
-async def record_interaction(
+def build_interaction_record(
 	session_data: Dict[str, Any],
 	phone_config: Dict[str, Any],
 	cost: float,
 	transcript: List[Dict[str, Any]],
 	prompt_version: Optional[str],
 	recording_meta: Optional[Dict[str, Any]] = None
-) -> str:
-	"""
-	Save interaction record to Supabase
-	
-	Args:
-	    session_data: Session metadata (room name, duration, lead_id, broker_id, etc.)
-	    phone_config: Provider config used
-	    cost: Estimated cost
-	    transcript: Conversation transcript array
-	    prompt_version: Prompt version string (e.g., 'inbound-qualified-v7')
-	    recording_meta: Recording metadata dict (bucket, object_path, etc.)
-	
-	Returns:
-	    Interaction ID
-	"""
-	supabase = get_supabase_client()
-	
-	# Build transcript text
-	transcript_text = '\n'.join([
-		f"{msg.get('role', 'unknown')}: {msg.get('text', msg.get('content', ''))}"
-		for msg in transcript
-	])
-	
-	# Extract tool calls
-	tool_calls_made = []
-	for msg in transcript:
-		if msg.get('tool_calls'):
-			tool_calls_made.extend([tc.get('tool_name') for tc in msg.get('tool_calls', [])])
+) -> Dict[str, Any]:
+	"""Assemble the interactions row (compact transcript, tool calls, metadata) for record_interaction"""
+	# One compact copy of the transcript; text/tool-call views are rebuilt on read
+	compact = Transcript.from_messages(transcript)
+	tool_calls_made = compact.tool_calls
 	
 	# Build metadata
 	metadata = {
 		'ai_agent': 'livekit-agent',
 		'version': '1.0',
-		'conversation_transcript': transcript,
-		'transcript_text': transcript_text,
-		'message_count': len(transcript),
+		'message_count': len(compact),
 		'tool_calls_made': tool_calls_made,
 		'tool_count': len(tool_calls_made),
 		'prompt_version': prompt_version,
@@ -185,8 +333,7 @@ async def record_interaction(
 		'content': f"Call completed - {session_data.get('duration_seconds', 0)}s",
 		'duration_seconds': session_data.get('duration_seconds'),
 		'outcome': session_data.get('outcome', 'neutral'),
-		'transcript_text': transcript_text,
-		'transcript': {'conversation_transcript': transcript},
+		'transcript': compact.document,
 		'metadata': metadata,
 		'stt_provider': phone_config.get('stt_provider'),
 		'tts_provider': phone_config.get('tts_provider'),
@@ -206,17 +353,48 @@ async def record_interaction(
 			'recording_size_bytes': recording_meta.get('size_bytes'),
 		})
 	
-	response = supabase.table('interactions')\
-		.insert(interaction_data)\
-		.select('id')\
-		.execute()
+	return interaction_data
+
+async def record_interaction(
+	session_data: Dict[str, Any],
+	phone_config: Dict[str, Any],
+	cost: float,
+	transcript: List[Dict[str, Any]],
+	prompt_version: Optional[str],
+	recording_meta: Optional[Dict[str, Any]] = None
+) -> str:
+	"""
+	Save interaction record to Supabase (via the local outbox, so call teardown never waits on it)
 	
-	if response.data and len(response.data) > 0:
-		interaction_id = response.data[0]['id']
-		logger.info(f"✅ Saved interaction: {interaction_id}")
-		return interaction_id
+	Args:
+	    session_data: Session metadata (room name, duration, lead_id, broker_id, etc.)
+	    phone_config: Provider config used
+	    cost: Estimated cost
+	    transcript: Conversation transcript array
+	    prompt_version: Prompt version string (e.g., 'inbound-qualified-v7')
+	    recording_meta: Recording metadata dict (bucket, object_path, etc.)
+	
+	Returns:
+	    Interaction ID (assigned client-side; the row is written by the outbox worker)
+	"""
+	from equity_connect.services.outbox import get_outbox
 	
-	raise Exception("Failed to save interaction")
+	interaction_data = build_interaction_record(
+		session_data, phone_config, cost, transcript, prompt_version, recording_meta
+	)
+	
+	interaction_id = get_outbox().insert('interactions', interaction_data)
+	logger.info(f"✅ Queued interaction: {interaction_id}")
+	return interaction_id
+
+def fetch_all(build_query: Callable[[], Any], page_size: int = 1000) -> List[Dict[str, Any]]:
+	"""Page through a query (PostgREST caps a single response at 1000 rows)."""
+	rows: List[Dict[str, Any]] = []
+	while True:
+		page = build_query().range(len(rows), len(rows) + page_size - 1).execute().data or []
+		rows.extend(page)
+		if len(page) < page_size:
+			return rows
 
 def normalize_phone(phone: Optional[str]) -> Optional[str]:
 	"""Normalize phone number to last 10 digits (gracefully handle missing input)."""
@@ -0,0 +1,150 @@
+"""In-memory broker territory index.
+
+broker_territories and the active brokers are small and rarely change, so the
+whole set is loaded once (at startup warm-up) and broker routing becomes a
+dictionary lookup. Tiers, first hit wins:
+1. exact ZIP (broker_territories.zip_code)
+2. ZIP3 prefix - a territory in the same sectional center
+3. city (+ state when given) of the broker's address; an exact city match
+   first, otherwise any broker whose city contains the given text (the old
+   ilike '%city%' query)
+4. state of the broker's address
+
+Within a tier brokers are ordered by territory priority (highest first), then
+by most recently updated. The index is rebuilt in the background every
+TERRITORY_CACHE_TTL_S seconds (default 300).
+"""
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from equity_connect.services.cache import RefreshingCache
+from equity_connect.services.supabase import fetch_all, get_supabase_client
+
+logger = logging.getLogger(__name__)
+
+BROKER_COLUMNS = (
+	"id, contact_name, company_name, phone, email, nmls_number, nylas_grant_id, "
+	"address_city, address_state, address_zip, status, timezone, updated_at"
+)
+
+_territory_cache: Optional[RefreshingCache["TerritoryIndex"]] = None
+_territory_cache_lock = threading.Lock()
+
+
+def _zip5(zip_code: Optional[str]) -> str:
+	digits = "".join(ch for ch in str(zip_code or "") if ch.isdigit())
+	return digits[:5]
+
+
+def _key(text: Optional[str]) -> str:
+	return " ".join(str(text or "").lower().split())
+
+
+class TerritoryIndex:
+	"""Tiered broker lookup built from broker_territories + active brokers."""
+
+	def __init__(self, territories: List[Dict[str, Any]], brokers: List[Dict[str, Any]]):
+		recent_first = sorted(brokers, key=lambda b: b.get("updated_at") or "", reverse=True)
+		self.brokers: Dict[str, Dict[str, Any]] = {str(b["id"]): b for b in recent_first}
+		rank = {broker_id: i for i, broker_id in enumerate(self.brokers)}
+
+		zip_priority: Dict[str, Dict[str, int]] = {}
+		zip3_priority: Dict[str, Dict[str, int]] = {}
+		for territory in territories:
+			broker_id = str(territory.get("broker_id") or "")
+			zip_code = _zip5(territory.get("zip_code"))
+			if broker_id not in self.brokers or not zip_code:
+				continue
+			priority = territory.get("priority") or 0
+			for buckets, key in ((zip_priority, zip_code), (zip3_priority, zip_code[:3])):
+				bucket = buckets.setdefault(key, {})
+				bucket[broker_id] = max(priority, bucket.get(broker_id, priority))
+
+		def ranked(bucket: Dict[str, int]) -> List[Dict[str, Any]]:
+			order = sorted(bucket, key=lambda broker_id: (-bucket[broker_id], rank[broker_id]))
+			return [self.brokers[broker_id] for broker_id in order]
+
+		self.by_zip = {key: ranked(bucket) for key, bucket in zip_priority.items()}
+		self.by_zip3 = {key: ranked(bucket) for key, bucket in zip3_priority.items()}
+
+		self.by_city: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+		self.by_state: Dict[str, List[Dict[str, Any]]] = {}
+		# (city, state, broker), most recently updated first, for substring matches
+		self.cities: List[Tuple[str, str, Dict[str, Any]]] = []
+		for broker in self.brokers.values():
+			city, state = _key(broker.get("address_city")), _key(broker.get("address_state")).upper()
+			if city:
+				self.by_city.setdefault((city, state), []).append(broker)
+				self.by_city.setdefault((city, ""), []).append(broker)
+				self.cities.append((city, state, broker))
+			if state:
+				self.by_state.setdefault(state, []).append(broker)
+
+	def __len__(self) -> int:
+		return len(self.by_zip)
+
+	def _city_lookup(self, city: str, state_key: str) -> Optional[List[Dict[str, Any]]]:
+		city_key = _key(city)
+		exact = self.by_city.get((city_key, state_key))
+		if exact or not city_key:
+			return exact
+		return [
+			broker for broker_city, broker_state, broker in self.cities
+			if city_key in broker_city and (not state_key or broker_state == state_key)
+		] or None
+
+	def lookup(
+		self,
+		zip_code: Optional[str] = None,
+		city: Optional[str] = None,
+		state: Optional[str] = None,
+	) -> Optional[Dict[str, Any]]:
+		"""Best active broker for the location, or None."""
+		zip5 = _zip5(zip_code)
+		state_key = _key(state).upper()
+		candidates = None
+		if zip5:
+			candidates = self.by_zip.get(zip5) or self.by_zip3.get(zip5[:3])
+		if not candidates and city:
+			candidates = self._city_lookup(city, state_key)
+		if not candidates and state_key:
+			candidates = self.by_state.get(state_key)
+		if not candidates and zip5 and not city and not state_key:
+			# ZIP outside every territory: any active broker, as the old query did
+			candidates = list(self.brokers.values())
+		return candidates[0] if candidates else None
+
+
+def load_territory_index() -> TerritoryIndex:
+	sb = get_supabase_client("read")
+	territories = fetch_all(
+		lambda: sb.table("broker_territories")
+		.select("broker_id, market_name, zip_code, priority")
+		.eq("active", True)
+		.order("zip_code")
+		.order("broker_id")
+	)
+	brokers = fetch_all(lambda: sb.table("brokers").select(BROKER_COLUMNS).eq("status", "active").order("id"))
+	index = TerritoryIndex(territories, brokers)
+	logger.info(f"✅ Territory index loaded: {len(index)} ZIPs, {len(index.brokers)} active brokers")
+	return index
+
+
+def get_territory_cache() -> RefreshingCache[TerritoryIndex]:
+	"""Get or create the process-wide territory index cache."""
+	global _territory_cache
+	if _territory_cache is None:
+		with _territory_cache_lock:
+			if _territory_cache is None:
+				_territory_cache = RefreshingCache(
+					"territories",
+					load_territory_index,
+					ttl=float(os.getenv("TERRITORY_CACHE_TTL_S", "300")),
+				)
+	return _territory_cache
+
+
+def get_territory_index() -> TerritoryIndex:
+	return get_territory_cache().get()
@@ -0,0 +1,282 @@
+"""Compact transcript storage for interactions.
+
+A call transcript is stored once, in interactions.transcript, as a columnar
+document instead of a list of message objects:
+
+	{
+		"format": "columnar-v1",
+		"roles": ["assistant", "user"],        # role dictionary
+		"role": [0, 1, 0, ...],                # index into roles, one per message
+		"text": ["Hi, this is Barbara", ...],
+		"timestamp": [...],                    # only when any message has one
+		"tool_calls": [[message_index, [...]]],# sparse
+		"extra": [[message_index, {...}]]      # sparse, any other message keys
+	}
+
+Repeated keys and role names are written once per call instead of once per
+message, and the text / tool-call views are not duplicated into separate
+columns. Transcript rebuilds those views lazily from either this format or
+the legacy {"conversation_transcript": [...]} layout.
+
+While a call is live, TranscriptBuffer checkpoints new messages (taken from
+the call_log SignalWire posts with each SWAIG request) into transcript_chunks
+through the outbox, so a partial transcript survives a crash. A chunk's seq
+is the position of its first message in the call log, and chunks are upserted
+on (call_id, seq): a process that picks up a call it didn't start (e.g. after
+a restart) rewrites from position 0 instead of colliding with stored chunks,
+and overlapping chunks are stitched by position. finalize() stitches the
+chunks back together when the call is summarized; purge() drops them once
+the interaction row holding the transcript is queued.
+
+Configuration:
+- TRANSCRIPT_CHUNK_MESSAGES: messages per chunk (default 10)
+- TRANSCRIPT_CHUNK_SECONDS: flush a smaller chunk after this long (default 30)
+"""
+import logging
+import os
+import threading
+import time
+from functools import cached_property
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+FORMAT = "columnar-v1"
+CHUNKS_TABLE = "transcript_chunks"
+STALE_CALL_SECONDS = 2 * 3600
+
+_transcript_buffer: Optional["TranscriptBuffer"] = None
+_transcript_buffer_lock = threading.Lock()
+
+_CORE_KEYS = ("role", "text", "content", "timestamp", "tool_calls")
+
+
+def encode_transcript(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+	"""Pack a list of transcript messages into the columnar document."""
+	roles: List[str] = []
+	role_index: Dict[str, int] = {}
+	role_column: List[int] = []
+	text_column: List[str] = []
+	timestamps: List[Any] = []
+	tool_calls: List[List[Any]] = []
+	extra: List[List[Any]] = []
+
+	for i, msg in enumerate(messages or []):
+		role = msg.get("role", "unknown")
+		if role not in role_index:
+			role_index[role] = len(roles)
+			roles.append(role)
+		role_column.append(role_index[role])
+		text_column.append(msg.get("text", msg.get("content", "")) or "")
+		timestamps.append(msg.get("timestamp"))
+		if msg.get("tool_calls"):
+			tool_calls.append([i, msg["tool_calls"]])
+		others = {k: v for k, v in msg.items() if k not in _CORE_KEYS}
+		if others:
+			extra.append([i, others])
+
+	doc: Dict[str, Any] = {"format": FORMAT, "roles": roles, "role": role_column, "text": text_column}
+	if any(ts is not None for ts in timestamps):
+		doc["timestamp"] = timestamps
+	if tool_calls:
+		doc["tool_calls"] = tool_calls
+	if extra:
+		doc["extra"] = extra
+	return doc
+
+
+class Transcript:
+	"""Read view over a stored transcript; every derived view is built on first access."""
+
+	def __init__(self, doc: Optional[Dict[str, Any]]):
+		self._doc = doc or {}
+
+	@classmethod
+	def from_messages(cls, messages: List[Dict[str, Any]]) -> "Transcript":
+		return cls(encode_transcript(messages))
+
+	@classmethod
+	def from_interaction(cls, interaction: Dict[str, Any]) -> "Transcript":
+		"""Use interactions.transcript, falling back to rows written before the compact format."""
+		doc = interaction.get("transcript")
+		if not doc or doc.get("format") != FORMAT:
+			legacy = (doc or {}).get("conversation_transcript")
+			if legacy is None:
+				legacy = (interaction.get("metadata") or {}).get("conversation_transcript") or []
+			return cls.from_messages(legacy)
+		return cls(doc)
+
+	@property
+	def document(self) -> Dict[str, Any]:
+		"""The columnar document as stored."""
+		return self._doc
+
+	def __len__(self) -> int:
+		return len(self._doc.get("role", []))
+
+	@cached_property
+	def roles(self) -> List[str]:
+		names = self._doc.get("roles", [])
+		return [names[i] for i in self._doc.get("role", [])]
+
+	@cached_property
+	def messages(self) -> List[Dict[str, Any]]:
+		"""Message objects ({role, text, timestamp?, tool_calls?, ...}) in call order."""
+		timestamps = self._doc.get("timestamp")
+		result = []
+		for i, (role, text) in enumerate(zip(self.roles, self._doc.get("text", []))):
+			msg: Dict[str, Any] = {"role": role, "text": text}
+			if timestamps and timestamps[i] is not None:
+				msg["timestamp"] = timestamps[i]
+			result.append(msg)
+		for i, calls in self._doc.get("tool_calls", []):
+			result[i]["tool_calls"] = calls
+		for i, others in self._doc.get("extra", []):
+			result[i].update(others)
+		return result
+
+	@cached_property
+	def text(self) -> str:
+		"""Plain "role: text" lines."""
+		return "\n".join(f"{role}: {text}" for role, text in zip(self.roles, self._doc.get("text", [])))
+
+	@cached_property
+	def tool_calls(self) -> List[Optional[str]]:
+		"""Tool names in call order."""
+		return [tc.get("tool_name") for _, calls in self._doc.get("tool_calls", []) for tc in calls]
+
+
+def call_log_messages(raw_data: Optional[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+	"""Conversation messages from a SWAIG / post_prompt payload (system prompt dropped)."""
+	if not raw_data:
+		return None
+	log = raw_data.get("raw_call_log") or raw_data.get("call_log")
+	if not isinstance(log, list):
+		return None
+	return [msg for msg in log if isinstance(msg, dict) and msg.get("role") != "system"]
+
+
+class _CallBuffer:
+	__slots__ = ("seen", "pending", "chunks", "flushed", "last_flush")
+
+	def __init__(self) -> None:
+		self.seen = 0
+		self.pending: List[Dict[str, Any]] = []
+		self.chunks: List[List[Dict[str, Any]]] = []
+		self.flushed = 0  # messages in chunks, i.e. the position of the next chunk
+		self.last_flush = time.monotonic()
+
+
+class TranscriptBuffer:
+	"""Per-call transcript checkpoints, keyed by call_id, written as outbox chunks."""
+
+	def __init__(self, chunk_messages: int = 10, chunk_seconds: float = 30.0):
+		self.chunk_messages = chunk_messages
+		self.chunk_seconds = chunk_seconds
+		self._calls: Dict[str, _CallBuffer] = {}
+		self._lock = threading.Lock()
+
+	def observe(self, call_id: str, messages: List[Dict[str, Any]]) -> None:
+		"""Record the conversation so far; queues a chunk once enough new messages piled up."""
+		if not call_id or messages is None:
+			return
+		with self._lock:
+			buf = self._calls.get(call_id)
+			if buf is None:
+				self._evict_stale()
+				buf = self._calls[call_id] = _CallBuffer()
+			# call_log only grows; a shorter log carries nothing new
+			if len(messages) > buf.seen:
+				buf.pending.extend(messages[buf.seen:])
+				buf.seen = len(messages)
+			due = len(buf.pending) >= self.chunk_messages or (
+				buf.pending and time.monotonic() - buf.last_flush >= self.chunk_seconds
+			)
+			if due:
+				self._write_chunk(call_id, buf)
+
+	def finalize(self, call_id: str, messages: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+		"""
+		Stitch the call's chunks (plus any newer messages) into the full message list.
+
+		Chunks come from memory, or from transcript_chunks when this process never
+		saw the call (e.g. it was restarted mid-call). The buffer is kept until
+		purge(), so a summary that is not stored loses nothing.
+		"""
+		stitched: Optional[List[Dict[str, Any]]] = None
+		with self._lock:
+			buf = self._calls.get(call_id) if call_id else None
+			if buf is not None:
+				stitched = [msg for chunk in buf.chunks for msg in chunk] + buf.pending
+		if stitched is None:
+			stitched = load_chunks(call_id) if call_id and not messages else []
+		if messages and len(messages) > len(stitched):
+			stitched = stitched + messages[len(stitched):]
+		return stitched
+
+	def purge(self, call_id: str) -> None:
+		"""Drop a call's buffer and queue deletion of its chunks once its interaction row holds the transcript."""
+		from equity_connect.services.outbox import get_outbox
+		with self._lock:
+			self._calls.pop(call_id, None)
+		get_outbox().delete(CHUNKS_TABLE, {"call_id": call_id}, key=f"{CHUNKS_TABLE}:{call_id}:purge")
+
+	def _write_chunk(self, call_id: str, buf: _CallBuffer) -> None:
+		from equity_connect.services.outbox import get_outbox
+		seq = buf.flushed
+		chunk, buf.pending = buf.pending, []
+		buf.chunks.append(chunk)
+		buf.flushed += len(chunk)
+		buf.last_flush = time.monotonic()
+		try:
+			get_outbox().upsert(
+				CHUNKS_TABLE,
+				{"call_id": call_id, "seq": seq, "messages": encode_transcript(chunk)},
+				on_conflict="call_id,seq",
+				key=f"{CHUNKS_TABLE}:{call_id}:{seq}:{len(chunk)}",
+			)
+		except Exception as e:
+			logger.warning(f"⚠️ Transcript chunk {seq} for call {call_id} not queued: {e}")
+
+	def _evict_stale(self) -> None:
+		cutoff = time.monotonic() - STALE_CALL_SECONDS
+		for call_id in [cid for cid, buf in self._calls.items() if buf.last_flush < cutoff]:
+			del self._calls[call_id]
+
+
+def load_chunks(call_id: str) -> List[Dict[str, Any]]:
+	"""Messages of a call rebuilt from its stored transcript_chunks (by position)."""
+	from equity_connect.services.supabase import get_supabase_client
+	try:
+		resp = (
+			get_supabase_client("background")
+			.table(CHUNKS_TABLE)
+			.select("seq, messages")
+			.eq("call_id", call_id)
+			.order("seq")
+			.execute()
+		)
+	except Exception as e:
+		logger.warning(f"⚠️ Could not load transcript chunks for call {call_id}: {e}")
+		return []
+	messages: List[Dict[str, Any]] = []
+	for row in resp.data or []:
+		# Chunks written before and after a restart overlap; keep each position once
+		if row["seq"] > len(messages):
+			logger.warning(f"⚠️ Transcript chunks for call {call_id} have a gap at message {len(messages)}")
+			break
+		messages.extend(Transcript(row["messages"]).messages[len(messages) - row["seq"]:])
+	return messages
+
+
+def get_transcript_buffer() -> TranscriptBuffer:
+	"""Get or create the process-wide transcript buffer."""
+	global _transcript_buffer
+	if _transcript_buffer is None:
+		with _transcript_buffer_lock:
+			if _transcript_buffer is None:
+				_transcript_buffer = TranscriptBuffer(
+					chunk_messages=int(os.getenv("TRANSCRIPT_CHUNK_MESSAGES", "10")),
+					chunk_seconds=float(os.getenv("TRANSCRIPT_CHUNK_SECONDS", "30")),
+				)
+	return _transcript_buffer
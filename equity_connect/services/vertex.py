@@ -1,14 +1,56 @@
-"""Google Vertex AI service for embeddings generation"""
+"""Google Vertex AI service for embeddings generation
+
+google-auth (and the requests stack it pulls in) costs ~240ms to import, so it
+is loaded on the first token fetch rather than when this module is imported.
+"""
 import os
 import json
 import httpx
 import logging
-from typing import List
-from google.oauth2 import service_account
-from google.auth.transport.requests import Request
+import threading
+from typing import Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+LOCATION = "us-central1"
+MODEL = "text-embedding-005"
+
+_http_client: Optional[httpx.Client] = None
+_credentials: Optional[Any] = None  # google.oauth2.service_account.Credentials
+_credentials_lock = threading.Lock()
+
+def get_http_client() -> httpx.Client:
+	"""Shared keep-alive client so calls reuse warm TLS connections"""
+	global _http_client
+	if _http_client is None:
+		_http_client = httpx.Client()
+	return _http_client
+
+def _get_access_token() -> str:
+	"""Service-account token, refreshed only when missing or expired (~1h lifetime)"""
+	global _credentials
+	with _credentials_lock:
+		if _credentials is None:
+			from google.oauth2 import service_account
+			credentials_json = os.getenv("GOOGLE_APPLICATION_CREDENTIALS_JSON")
+			if not credentials_json:
+				raise ValueError("GOOGLE_APPLICATION_CREDENTIALS_JSON environment variable not set")
+			_credentials = service_account.Credentials.from_service_account_info(
+				json.loads(credentials_json),
+				scopes=["https://www.googleapis.com/auth/cloud-platform"]
+			)
+		if not _credentials.valid:
+			from google.auth.transport.requests import Request
+			_credentials.refresh(Request())
+		return _credentials.token
+
+def warm_up() -> None:
+	"""Fetch the OAuth token and open a connection to Vertex ahead of the first call"""
+	if not os.getenv("GOOGLE_APPLICATION_CREDENTIALS_JSON"):
+		return
+	_get_access_token()
+	get_http_client().get(f"https://{LOCATION}-aiplatform.googleapis.com/", timeout=5.0)
+
 def generate_embedding(question: str) -> List[float]:
 	"""Generate embedding vector for a text query using Vertex AI text-embedding-005
 	
@@ -18,47 +60,28 @@ def generate_embedding(question: str) -> List[float]:
 	Returns:
 	    List of 768 floating point numbers
 	"""
-	credentials_json = os.getenv("GOOGLE_APPLICATION_CREDENTIALS_JSON")
 	project_id = os.getenv("GOOGLE_PROJECT_ID", "barbara-475319")
+	token = _get_access_token()
 	
-	if not credentials_json:
-		raise ValueError("GOOGLE_APPLICATION_CREDENTIALS_JSON environment variable not set")
+	url = f"https://{LOCATION}-aiplatform.googleapis.com/v1/projects/{project_id}/locations/{LOCATION}/publishers/google/models/{MODEL}:predict"
 	
-	credentials_dict = json.loads(credentials_json)
-	credentials = service_account.Credentials.from_service_account_info(
-		credentials_dict,
-		scopes=["https://www.googleapis.com/auth/cloud-platform"]
+	response = get_http_client().post(
+		url,
+		headers={
+			"Authorization": f"Bearer {token}",
+			"Content-Type": "application/json"
+		},
+		json={
+			"instances": [{"content": question}]
+		}
 	)
 	
-	# Get access token
-	credentials.refresh(Request())
-	token = credentials.token
+	if response.status_code != 200:
+		logger.error(f"Vertex AI embeddings failed: {response.status_code} {response.text}")
+		raise Exception(f"Vertex AI embeddings failed: {response.status_code}")
 	
-	location = "us-central1"
-	model = "text-embedding-005"
-	url = f"https://{location}-aiplatform.googleapis.com/v1/projects/{project_id}/locations/{location}/publishers/google/models/{model}:predict"
+	data = response.json()
+	embedding = data["predictions"][0]["embeddings"]["values"]
 	
-	with httpx.Client() as client:
-		response = client.post(
-			url,
-			headers={
-				"Authorization": f"Bearer {token}",
-				"Content-Type": "application/json"
-			},
-			json={
-				"instances": [{"content": question}]
-			}
-		)
-		
-		if response.status_code != 200:
-			logger.error(f"Vertex AI embeddings failed: {response.status_code} {response.text}")
-			raise Exception(f"Vertex AI embeddings failed: {response.status_code}")
-		
-		data = response.json()
-		embedding = data["predictions"][0]["embeddings"]["values"]
-		
-		logger.debug(f"✅ Generated embedding ({len(embedding)} dimensions)")
-		return embedding
-
-
-
+	logger.debug(f"✅ Generated embedding ({len(embedding)} dimensions)")
+	return embedding
@@ -0,0 +1,154 @@
+"""Per-call vertical routing for one agent process serving many verticals.
+
+The called number picks the vertical (phone_numbers.vertical; numbers without
+one use DEFAULT_VERTICAL). Everything a vertical needs to render SWML - agent
+params and the compiled contexts - is built once into a VerticalProfile and
+kept in a keyed cache, so routing a call is two dictionary reads. The
+global_data defaults and speech hints have no table; they live in
+VERTICAL_DETAILS below.
+
+Configuration:
+- DEFAULT_VERTICAL: vertical applied at startup and for unrouted numbers (default reverse_mortgage)
+- VERTICAL_CACHE_TTL_S: background refresh interval for routes and profiles (default 300)
+"""
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from equity_connect.services.agent_config import get_agent_params
+from equity_connect.services.cache import RefreshingCache
+from equity_connect.services.contexts_builder import build_contexts_object
+from equity_connect.services.supabase import get_supabase_client, normalize_phone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERTICAL = os.getenv("DEFAULT_VERTICAL", "reverse_mortgage")
+DEFAULT_LANGUAGE = "en-US"
+INITIAL_CONTEXT = "greet"
+
+# global_data defaults and speech hints shared by every vertical
+BASE_GLOBAL_DATA: Dict[str, Any] = {
+	"company_name": "Barbara AI",
+	"business_hours": "9 AM - 5 PM Pacific Time",
+	"conversation_system": "BarbGraph 8-node routing",
+}
+BASE_HINTS: List[str] = ["Barbara", "EquityConnect"]
+
+# Per-vertical additions; a vertical missing here only gets its name as service_vertical
+VERTICAL_DETAILS: Dict[str, Dict[str, Any]] = {
+	"reverse_mortgage": {
+		"global_data": {
+			"service_type": "Reverse Mortgage Assistance",
+			"service_vertical": "Reverse Mortgage / HECM",
+			"coverage_area": "California",
+		},
+		"hints": [
+			"reverse mortgage",
+			"HECM",
+			"home equity conversion",
+			"FHA",
+			"equity",
+			"lien",
+			"borrower",
+			"non-borrowing spouse",
+		],
+	},
+}
+
+_route_cache: Optional[RefreshingCache[Dict[str, str]]] = None
+_profile_caches: Dict[Tuple[str, str], RefreshingCache[Optional["VerticalProfile"]]] = {}
+_cache_lock = threading.Lock()
+
+
+class VerticalProfile:
+	"""Agent params + contexts for one (vertical, language)."""
+
+	__slots__ = ("vertical", "language", "params", "contexts")
+
+	def __init__(self, vertical: str, language: str, params: Dict[str, Any], contexts: Dict[str, Any]):
+		self.vertical = vertical
+		self.language = language
+		self.params = params
+		self.contexts = contexts
+
+
+def vertical_global_data(vertical: str) -> Dict[str, Any]:
+	"""Default global_data for a vertical (per-call caller data is added on top)."""
+	details = VERTICAL_DETAILS.get(vertical, {})
+	return {
+		**BASE_GLOBAL_DATA,
+		**details.get("global_data", {"service_vertical": vertical.replace("_", " ").title()}),
+	}
+
+
+def vertical_hints(vertical: str) -> List[str]:
+	"""Speech recognition hints for a vertical."""
+	return VERTICAL_DETAILS.get(vertical, {}).get("hints", []) + BASE_HINTS
+
+
+def _ttl() -> float:
+	return float(os.getenv("VERTICAL_CACHE_TTL_S", "300"))
+
+
+def load_number_routes() -> Dict[str, str]:
+	"""Active numbers with a vertical, keyed by their last 10 digits."""
+	rows = get_supabase_client("read").table("phone_numbers")\
+		.select("phone_number, vertical")\
+		.eq("is_active", True)\
+		.execute().data or []
+	routes = {normalize_phone(row["phone_number"]): row["vertical"] for row in rows if row.get("vertical")}
+	logger.info(f"✅ Number routing loaded: {len(routes)} numbers across {len(set(routes.values()))} verticals")
+	return routes
+
+
+def get_route_cache() -> RefreshingCache[Dict[str, str]]:
+	global _route_cache
+	if _route_cache is None:
+		with _cache_lock:
+			if _route_cache is None:
+				_route_cache = RefreshingCache("number_routes", load_number_routes, ttl=_ttl())
+	return _route_cache
+
+
+def vertical_for_number(called_number: Optional[str]) -> str:
+	"""Vertical for the dialed number; DEFAULT_VERTICAL when unknown or routing is unavailable."""
+	if not called_number:
+		return DEFAULT_VERTICAL
+	try:
+		return get_route_cache().get().get(normalize_phone(called_number), DEFAULT_VERTICAL)
+	except Exception as e:
+		logger.warning(f"⚠️ Number routing unavailable ({e}), using {DEFAULT_VERTICAL}")
+		return DEFAULT_VERTICAL
+
+
+def _load_profile(vertical: str, language: str) -> Optional[VerticalProfile]:
+	try:
+		contexts = build_contexts_object(vertical=vertical, initial_context=INITIAL_CONTEXT)
+	except Exception as e:
+		# Cached as None until the next refresh so a misconfigured vertical isn't rebuilt per call
+		logger.error(f"❌ Could not build contexts for {vertical}/{language}: {e}")
+		return None
+	return VerticalProfile(vertical, language, get_agent_params(vertical=vertical, language=language), contexts)
+
+
+def get_vertical_profile(vertical: str, language: str = DEFAULT_LANGUAGE) -> Optional[VerticalProfile]:
+	"""Cached profile for (vertical, language), or None if its contexts can't be built."""
+	key = (vertical, language)
+	cache = _profile_caches.get(key)
+	if cache is None:
+		with _cache_lock:
+			cache = _profile_caches.get(key)
+			if cache is None:
+				cache = _profile_caches[key] = RefreshingCache(
+					f"vertical-{vertical}-{language}",
+					lambda: _load_profile(vertical, language),
+					ttl=_ttl(),
+				)
+	return cache.get()
+
+
+def preload_profiles() -> None:
+	"""Warm-up: build the profile of every routed vertical."""
+	for vertical in sorted(set(get_route_cache().get().values()) - {DEFAULT_VERTICAL}):
+		get_vertical_profile(vertical)
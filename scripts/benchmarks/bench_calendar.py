@@ -0,0 +1,26 @@
+"""find_free_slots + format_available_slots: the CPU half of check_broker_availability."""
+
+import pytest
+
+from data import busy_calendar
+from equity_connect.services.nylas import find_free_slots, format_available_slots
+
+
+@pytest.mark.benchmark(group="calendar")
+@pytest.mark.parametrize("events_per_day", [4, 12, 40])
+def bench_find_free_slots(benchmark, events_per_day):
+    calendar = busy_calendar(days=14, events_per_day=events_per_day)
+    benchmark(find_free_slots, calendar["start_ms"], calendar["end_ms"], calendar["busy"])
+
+
+@pytest.mark.benchmark(group="calendar")
+@pytest.mark.parametrize("preferred_time", [None, "afternoon"])
+def bench_find_and_format_slots(benchmark, preferred_time):
+    calendar = busy_calendar(days=14, events_per_day=12)
+
+    def run():
+        slots = find_free_slots(calendar["start_ms"], calendar["end_ms"], calendar["busy"])
+        return format_available_slots(slots, preferred_time=preferred_time)
+
+    formatted = benchmark(run)
+    assert len(formatted) <= 5
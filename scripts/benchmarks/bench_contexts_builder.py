@@ -0,0 +1,19 @@
+"""build_contexts_object: prompt/theme load + context assembly done at startup and per vertical."""
+
+import pytest
+
+from equity_connect.services.contexts_builder import build_contexts_object
+
+
+@pytest.mark.benchmark(group="contexts_builder")
+def bench_build_contexts_object(benchmark, local_backend):
+    contexts = benchmark(build_contexts_object, "reverse_mortgage")
+    assert "greet" in contexts
+
+
+@pytest.mark.benchmark(group="contexts_builder")
+def bench_build_contexts_object_with_lead(benchmark, local_backend):
+    lead_context = {"first_name": "Caller1", "last_name": "Loadtest", "property_city": "Los Angeles",
+                    "property_value": 650000, "estimated_equity": 400000}
+    contexts = benchmark(build_contexts_object, "reverse_mortgage", "greet", lead_context)
+    assert "book" in contexts
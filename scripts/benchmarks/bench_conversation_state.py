@@ -0,0 +1,93 @@
+"""deep_merge_json / _append_unique: run on every tool call that touches conversation_state."""
+
+import json
+
+import pytest
+
+from data import conversation_state as state_fixture, conversation_update
+from equity_connect.services import conversation_state
+from equity_connect.services.conversation_state import _append_unique, deep_merge_json
+from equity_connect.services.local_backend import LocalClient
+from equity_connect.services.supabase import set_supabase_client
+
+
+@pytest.mark.benchmark(group="conversation_state")
+@pytest.mark.parametrize("list_items", [10, 100, 1000])
+def bench_deep_merge_json(benchmark, list_items):
+    base = state_fixture(list_items)
+    updates = conversation_update(list_items // 2)
+    merged = benchmark(deep_merge_json, base, updates)
+    assert merged["conversation_data"]["appointment_requested"] is True
+
+
+@pytest.mark.benchmark(group="conversation_state")
+@pytest.mark.parametrize("size", [10, 100, 1000])
+def bench_append_unique_dicts(benchmark, size):
+    existing = [{"type": f"objection-{i}", "handled": bool(i % 2)} for i in range(size)]
+    incoming = existing[: size // 2] + [{"type": "new", "handled": False}]
+    result = benchmark(_append_unique, existing, incoming)
+    assert len(result) == size + 1
+
+
+def _grown_document(size: int):
+    """conversation_data after many repeat calls: `size` topics/questions plus per-topic notes."""
+    doc = {}
+    for call in range(size // 10):
+        doc = deep_merge_json(doc, {
+            "topics_discussed": [f"topic {call}-{i}" for i in range(10)],
+            "questions_asked": [{"q": f"question {call}-{i}", "answered": True} for i in range(10)],
+            "notes": {f"call_{call}": {"summary": "x" * 200, "objections": ["cost", "heirs"]}},
+        })
+    return doc
+
+
+@pytest.mark.benchmark(group="conversation_state_growth")
+@pytest.mark.parametrize("size", [100, 1000, 10000])
+def bench_deep_merge_growing_document(benchmark, size):
+    """Per-update cost as the document accumulates; should stay flat as `size` grows.
+
+    Each round merges a new topic/question into the previous result, the way
+    conversation_data evolves over a call.
+    """
+    state = {"doc": _grown_document(size), "round": 0}
+
+    def merge_next():
+        state["round"] += 1
+        state["doc"] = deep_merge_json(state["doc"], {
+            "verified": True,
+            "topics_discussed": ["topic 0-0", f"new topic {state['round']}"],
+            "questions_asked": [{"q": f"new question {state['round']}", "answered": False}],
+        })
+
+    benchmark(merge_next)
+    assert len(state["doc"]["topics_discussed"]) == size + state["round"]
+
+
+@pytest.mark.benchmark(group="conversation_state_write")
+@pytest.mark.parametrize("size", [100, 1000, 10000])
+@pytest.mark.parametrize("mode", ["delta", "full"])
+def bench_update_conversation_state(benchmark, monkeypatch, mode, size):
+    """update_conversation_state against the local backend: delta RPC vs fetch + full-blob write.
+
+    extra_info.request_bytes is what goes over the wire for the write.
+    """
+    client = LocalClient({"conversation_state": [{
+        "id": "state-1", "phone_number": "+15550000001", "call_status": "active",
+        "conversation_data": _grown_document(size), "updated_at": "2025-01-01T00:00:00+00:00",
+    }]})
+    set_supabase_client(client)
+    monkeypatch.setattr(conversation_state, "_delta_rpc_available", mode == "delta")
+    update = {"conversation_data": {"verified": True, "topics_discussed": ["spouse"]}}
+
+    delta = conversation_state.updates_to_delta(update["conversation_data"])
+    if mode == "delta":
+        body = {"p_phone_candidates": ["+15550000001"], "p_ops": delta, "p_fields": {}}
+    else:
+        body = {"conversation_data": conversation_state.apply_delta(
+            client.tables["conversation_state"][0]["conversation_data"], delta)}
+    benchmark.extra_info["request_bytes"] = len(json.dumps(body))
+
+    try:
+        assert benchmark(conversation_state.update_conversation_state, "+15550000001", update)
+    finally:
+        set_supabase_client(None)
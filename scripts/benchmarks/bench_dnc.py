@@ -0,0 +1,74 @@
+"""check_consent_dnc_core against the in-memory DNC index (listed / unlisted numbers) and the index load."""
+
+import json
+
+import pytest
+
+from equity_connect.services.dnc_index import DncIndex, reload_dnc_index
+from equity_connect.services.lead_service import check_consent_dnc_core
+from stubs import synthetic_caller
+
+LIST_SIZE = 200_000  # numbers per list type
+ADDED = 1_000  # numbers per list type picked up by an incremental load
+
+
+def _dnc_rows(size, offset=0):
+    rows = []
+    for idx in range(offset, offset + size):
+        rows.append({"phone_number": f"666{idx * 37:07d}", "list_type": "dnc"})
+        rows.append({"phone_number": f"777{idx * 41:07d}", "list_type": "litigator"})
+    return rows
+
+
+def _export(rows, max_id=0):
+    """dnc_numbers_export rows for `rows` (what the RPC returns)."""
+    grouped = {}
+    for row in rows:
+        grouped.setdefault(row["list_type"], []).append(row["phone_number"])
+    return [
+        {"list_type": list_type, "numbers": "".join(sorted(numbers)), "max_id": max_id + len(rows)}
+        for list_type, numbers in grouped.items()
+    ]
+
+
+@pytest.fixture
+def dnc_backend(local_backend):
+    rows = _dnc_rows(LIST_SIZE)
+    rows.append({"phone_number": synthetic_caller(3)["last10"], "list_type": "litigator"})
+    local_backend.tables["dnc_numbers"] = rows
+    reload_dnc_index()
+    yield local_backend
+    local_backend.tables.pop("dnc_numbers")
+    reload_dnc_index()
+
+
+@pytest.mark.benchmark(group="dnc")
+def bench_check_consent_listed(benchmark, dnc_backend):
+    queries = dnc_backend.query_count
+    result = json.loads(benchmark(check_consent_dnc_core, synthetic_caller(3)["phone"]))
+    assert result["is_dnc"] and result["is_litigator"] and not result["can_call"]
+    assert dnc_backend.query_count == queries
+
+
+@pytest.mark.benchmark(group="dnc")
+def bench_check_consent_unlisted(benchmark, dnc_backend):
+    result = json.loads(benchmark(check_consent_dnc_core, synthetic_caller(4)["phone"]))
+    assert result["is_dnc"] is False
+
+
+@pytest.mark.benchmark(group="dnc")
+def bench_build_dnc_index(benchmark):
+    export = _export(_dnc_rows(LIST_SIZE))
+    index = benchmark(DncIndex.from_export, export)
+    assert len(index) == 2 * LIST_SIZE
+    assert index.status("(666) 000-0037") == "dnc"
+
+
+@pytest.mark.benchmark(group="dnc")
+def bench_merge_dnc_additions(benchmark):
+    base = DncIndex.from_export(_export(_dnc_rows(LIST_SIZE)))
+    added = _export(_dnc_rows(ADDED, offset=LIST_SIZE - ADDED // 2), max_id=base.max_id)
+    index = benchmark(DncIndex.from_export, added, base)
+    assert len(index) == 2 * (LIST_SIZE + ADDED // 2)
+    assert index.max_id == base.max_id + 2 * ADDED
+    assert index.status(f"777{(LIST_SIZE + 1) * 41:07d}") == "litigator"
@@ -0,0 +1,45 @@
+"""record_interaction transcript assembly (compact transcript, tool calls, metadata) and read-back."""
+
+import json
+
+import pytest
+
+from data import long_transcript
+from equity_connect.services.supabase import build_interaction_record
+from equity_connect.services.transcripts import Transcript
+
+SESSION = {"lead_id": "lead-1", "broker_id": "broker-1", "duration_seconds": 1800, "outcome": "booked"}
+PHONE_CONFIG = {"stt_provider": "deepgram", "tts_provider": "elevenlabs", "llm_provider": "openai"}
+
+
+@pytest.mark.benchmark(group="interactions")
+@pytest.mark.parametrize("messages", [50, 400, 2000])
+def bench_build_interaction_record(benchmark, messages):
+    transcript = long_transcript(messages)
+    record = benchmark(build_interaction_record, SESSION, PHONE_CONFIG, 0.42, transcript, "inbound-v7")
+    assert record["metadata"]["message_count"] == messages
+
+
+@pytest.mark.benchmark(group="interactions")
+@pytest.mark.parametrize("messages", [400])
+def bench_build_interaction_record_serialized(benchmark, messages):
+    """Includes the JSON encode PostgREST does on insert - the payload size is what hurts."""
+    transcript = long_transcript(messages)
+
+    def run():
+        return json.dumps(build_interaction_record(SESSION, PHONE_CONFIG, 0.42, transcript, "inbound-v7"))
+
+    payload = benchmark(run)
+    benchmark.extra_info["payload_bytes"] = len(payload)
+
+
+@pytest.mark.benchmark(group="interactions")
+@pytest.mark.parametrize("messages", [400])
+def bench_transcript_text_view(benchmark, messages):
+    """Portal/eval read path: stored columnar document -> plain text."""
+    record = json.loads(json.dumps(build_interaction_record(SESSION, PHONE_CONFIG, 0.42, long_transcript(messages), "v7")))
+
+    def run():
+        return Transcript.from_interaction(record).text
+
+    assert benchmark(run).count("\n") == messages - 1
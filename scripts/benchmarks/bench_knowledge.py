@@ -0,0 +1,22 @@
+"""_keyword_search: tokenization + keyword pick + the vector_embeddings ilike query."""
+
+import json
+
+import pytest
+
+from equity_connect.services.knowledge_service import _keyword_search
+
+QUESTIONS = {
+    "short": "What happens if my spouse dies?",
+    "long": ("So I was wondering, if we take out one of these reverse mortgage loans on the house and "
+             "then later on my husband and I want to rent out part of the property on airbnb, would that "
+             "affect the loan, and what would happen to the equity if one of us passes away? ") * 4,
+    "no_priority_term": "Can you explain the appraisal process and closing timeline?",
+}
+
+
+@pytest.mark.benchmark(group="knowledge")
+@pytest.mark.parametrize("kind", sorted(QUESTIONS))
+def bench_keyword_search(benchmark, local_backend, kind):
+    result = json.loads(benchmark(_keyword_search, local_backend, QUESTIONS[kind]))
+    assert "found" in result
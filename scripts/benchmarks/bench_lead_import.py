@@ -0,0 +1,86 @@
+"""import_skip_trace_results: a 10k-row SwarmTrace pull into leads (batched lookups + writes, DNC screening)."""
+
+import copy
+
+import pytest
+
+from equity_connect.services.dnc_index import reload_dnc_index
+from equity_connect.services.lead_import import import_skip_trace_results
+from equity_connect.services.local_backend import LocalClient
+from equity_connect.services.supabase import normalize_phone, set_supabase_client
+from stubs import synthetic_caller
+
+PULL_SIZE = 10_000
+KNOWN = 500  # results whose phone already belongs to a seeded lead
+SCRUBBED = range(9000, 9100)  # phones SwarmTrace flagged as litigators
+LISTED = range(9100, 9200)  # phones already in dnc_numbers
+EMAIL_ONLY = [idx for idx in range(8000, 8030) if idx % 3]  # leads stored with the email in another case
+
+
+def _phone(idx):
+    return synthetic_caller(idx)["phone"] if idx < KNOWN else f"+1 (444) {idx // 10000:03d}-{idx % 10000:04d}"
+
+
+def _results():
+    results = []
+    for idx in range(PULL_SIZE):
+        phone = _phone(idx)
+        results.append({
+            "index": idx,
+            "input": {
+                "property_address": f"{idx} Oak Ave",
+                "property_city": "Austin",
+                "property_state": "TX",
+                "property_zip": "78701",
+            },
+            "primary_contact": {
+                "first_name": f"Owner{idx}",
+                "last_name": "Import",
+                "email": f"Owner{idx}@Example.com " if idx % 3 else None,
+                "phone": phone,
+                "dnc_flags": ["Litigator"] if idx in SCRUBBED else None,
+            },
+            "status_code": 200,
+        })
+    # Same contact twice in one pull
+    results.extend(copy.deepcopy(results[KNOWN:KNOWN + 100]))
+    return results
+
+
+@pytest.mark.benchmark(group="lead_import")
+def bench_import_skip_trace_results(benchmark, seed_tables):
+    results = _results()
+
+    def setup():
+        tables = copy.deepcopy(seed_tables)
+        for lead in tables["leads"][:KNOWN]:
+            lead["primary_email"] = None  # matched leads get their email filled in
+        tables["leads"].extend(
+            {"id": f"email-{idx}", "first_name": f"Owner{idx}", "primary_email": f" OWNER{idx}@EXAMPLE.COM"}
+            for idx in EMAIL_ONLY
+        )
+        tables["dnc_numbers"] = [
+            {"phone_number": normalize_phone(_phone(idx)), "list_type": "dnc"} for idx in LISTED
+        ]
+        client = LocalClient(tables)
+        set_supabase_client(client)
+        reload_dnc_index()
+        client.query_count = 0
+        return (client,), {}
+
+    def run(client):
+        report = import_skip_trace_results(results)
+        benchmark.extra_info.update(report, queries=client.query_count)
+
+    try:
+        benchmark.pedantic(run, setup=setup, rounds=3)
+    finally:
+        set_supabase_client(None)
+    info = benchmark.extra_info
+    # Screened rows without an email are dropped, the rest come in without a phone
+    blocked = sum(1 for idx in (*SCRUBBED, *LISTED) if idx % 3 == 0)
+    assert info["dnc_blocked"] == blocked
+    assert info["inserted"] == PULL_SIZE - KNOWN - blocked - len(EMAIL_ONLY)
+    assert info["updated"] >= len(EMAIL_ONLY)
+    assert info["skipped"] == 100 + KNOWN // 3 + 1
+    assert info["queries"] < 100
@@ -0,0 +1,24 @@
+"""Cold-start import cost of the agent entrypoint (fresh interpreter per round)."""
+
+import pytest
+
+from importtime import profile_import, top_packages
+
+
+@pytest.mark.benchmark(group="startup")
+@pytest.mark.parametrize("module", [
+    "equity_connect.agent.barbara_agent",
+    "equity_connect.services.calendar_service",
+])
+def bench_cold_import(benchmark, module):
+    """Wall time includes interpreter start-up; extra_info.import_ms is the -X importtime figure."""
+    profiles = []
+
+    def run():
+        profiles.append(profile_import(module))
+
+    benchmark.pedantic(run, rounds=5, iterations=1, warmup_rounds=1)
+    best = min(profiles, key=lambda p: p["total_ms"])
+    benchmark.extra_info["import_ms"] = round(best["total_ms"], 1)
+    benchmark.extra_info["top_packages"] = top_packages(best, 8)
+    assert best["total_ms"] > 0
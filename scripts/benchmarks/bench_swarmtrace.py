@@ -0,0 +1,137 @@
+"""SwarmTrace MCP call concurrency against the rate-limited mock API.
+
+The mock (swarmtrace-mcp/server.py, USE_MOCK_API) answers 429 + Retry-After
+once more than CAPACITY calls are in flight and slows down as load approaches
+it. A batch is pushed through `_call_swarmtrace` once with the old fixed
+semaphore only and once with the AdaptiveLimiter on top; compare
+`extra_info.throughput_rps` (rows that came back 200 per second) and
+`extra_info.rate_limited` (429 responses seen).
+
+The stream benchmarks push STREAM_ROWS through `_stream_skip_trace` and either
+write each result out as an NDJSON line (the /skip-trace/stream route) or
+collect them all for one response (what batch_skip_trace does); compare
+`extra_info.peak_kb` (tracemalloc peak while the batch ran).
+"""
+
+import asyncio
+import io
+import os
+import sys
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("fastmcp")
+
+os.environ.setdefault("USE_MOCK_API", "true")
+os.environ.setdefault("SWARMTRACE_API_KEY", "bench")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "swarmtrace-mcp")))
+
+import server  # noqa: E402
+
+ROWS = 400
+CAPACITY = 16
+LATENCY_MS = 20
+MAX_CONCURRENT = 75
+PAYLOAD = {
+    "property_address": "123 Main St",
+    "property_city": "Austin",
+    "property_state": "TX",
+    "property_zip": "78701",
+}
+
+
+class FixedLimiter:
+    """No adaptive limit: concurrency is whatever the semaphore allows (the old behaviour)."""
+
+    async def acquire(self) -> int:
+        return 0
+
+    async def release(self, *_args) -> None:
+        return None
+
+
+async def _run_batch(limiter) -> dict:
+    client = server.SwarmTraceClient("bench", use_mock_api=True, mock_capacity=CAPACITY, mock_latency_ms=LATENCY_MS)
+    rate_limited = 0
+    skip_trace = client.skip_trace
+
+    async def counting_skip_trace(payload):
+        nonlocal rate_limited
+        result = await skip_trace(payload)
+        rate_limited += result[0] == 429
+        return result
+
+    client.skip_trace = counting_skip_trace
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await asyncio.gather(
+        *(server._call_swarmtrace(client, PAYLOAD, semaphore, 3, limiter) for _ in range(ROWS))
+    )
+    elapsed = loop.time() - started
+    ok = sum(1 for status, _, _ in results if status == 200)
+    return {"ok": ok, "rate_limited": rate_limited, "throughput_rps": round(ok / elapsed, 1)}
+
+
+def _bench(benchmark, make_limiter):
+    outcome = {}
+
+    def run():
+        outcome.update(asyncio.run(_run_batch(make_limiter())))
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info.update(outcome)
+    return outcome
+
+
+@pytest.mark.benchmark(group="swarmtrace")
+def bench_swarmtrace_fixed_semaphore(benchmark):
+    _bench(benchmark, FixedLimiter)
+
+
+@pytest.mark.benchmark(group="swarmtrace")
+def bench_swarmtrace_adaptive_limiter(benchmark):
+    outcome = _bench(benchmark, lambda: server.AdaptiveLimiter(max_limit=100, initial=8))
+    assert outcome["ok"] == ROWS
+
+
+STREAM_ROWS = 2000
+
+
+async def _run_stream(mode: str) -> dict:
+    properties = [dict(PAYLOAD, property_address=f"{idx} Main St") for idx in range(STREAM_ROWS)]
+    server._result_cache = server.ResultCache(":memory:", 0)  # every row goes to the mock
+    server._limiter = server.AdaptiveLimiter(max_limit=100, initial=MAX_CONCURRENT)  # bound to this loop
+    tally = server.StatsTally()
+    out, collected = io.StringIO(), []
+    tracemalloc.start()
+    async for result in server._stream_skip_trace(properties, MAX_CONCURRENT, tally):
+        if mode == "ndjson":
+            out.write(result.model_dump_json(exclude_none=True) + "\n")
+            out.seek(0)
+            out.truncate()  # stands in for the socket: written lines are gone
+        else:
+            collected.append(result)
+    if mode == "collect":
+        successful, failed = server._filter_results(collected)
+        server.BatchSkipTraceResponse(successful=successful, failed=failed, stats=tally.stats()).model_dump()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"rows": tally.total, "peak_kb": round(peak / 1024)}
+
+
+@pytest.mark.benchmark(group="swarmtrace_stream")
+@pytest.mark.parametrize("mode", ["ndjson", "collect"])
+def bench_swarmtrace_stream(benchmark, monkeypatch, mode):
+    monkeypatch.setitem(server.config, "mock_api_latency_ms", 1)
+    monkeypatch.setattr(server, "_limiter", None)
+    monkeypatch.setattr(server, "_result_cache", None)
+    outcome = {}
+
+    def run():
+        outcome.update(asyncio.run(_run_stream(mode)))
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info.update(outcome)
+    assert outcome["rows"] == STREAM_ROWS
@@ -0,0 +1,29 @@
+"""BarbaraAgent.on_swml_request personalization (lead lookup + prompt/global data injection)."""
+
+import os
+
+import pytest
+
+pytest.importorskip("signalwire_agents")
+
+from stubs import synthetic_caller  # noqa: E402
+
+
+@pytest.fixture
+def agent(local_backend, monkeypatch):
+    monkeypatch.setenv("AGENT_USERNAME", os.getenv("AGENT_USERNAME", "bench"))
+    monkeypatch.setenv("AGENT_PASSWORD", os.getenv("AGENT_PASSWORD", "bench"))
+    from equity_connect.agent.barbara_agent import BarbaraAgent
+    return BarbaraAgent()
+
+
+@pytest.mark.benchmark(group="swml")
+def bench_on_swml_request_known_caller(benchmark, agent):
+    body = {"call": {"from": synthetic_caller(1)["phone"], "to": "+14244851544", "call_id": "bench"}}
+    benchmark(agent.on_swml_request, None, body, {})
+
+
+@pytest.mark.benchmark(group="swml")
+def bench_on_swml_request_new_caller(benchmark, agent):
+    body = {"call": {"from": "+19998887777", "to": "+14244851544", "call_id": "bench"}}
+    benchmark(agent.on_swml_request, None, body, {})
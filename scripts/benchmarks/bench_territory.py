@@ -0,0 +1,31 @@
+"""find_broker_by_territory_core against the in-memory territory index (per tier) and the index build."""
+
+import json
+
+import pytest
+
+from equity_connect.services.lead_service import find_broker_by_territory_core
+from equity_connect.services.territory_index import get_territory_cache, load_territory_index
+
+LOOKUPS = {
+    "exact_zip": ("90005", None, None),
+    "zip3": ("90099", None, None),
+    "city": (None, "Los Angeles", "CA"),
+    "state": (None, None, "CA"),
+}
+
+
+@pytest.mark.benchmark(group="territory")
+@pytest.mark.parametrize("tier", sorted(LOOKUPS))
+def bench_find_broker(benchmark, local_backend, tier):
+    get_territory_cache().refresh()
+    queries = local_backend.query_count
+    result = json.loads(benchmark(find_broker_by_territory_core, *LOOKUPS[tier]))
+    assert result["found"]
+    assert local_backend.query_count == queries
+
+
+@pytest.mark.benchmark(group="territory")
+def bench_load_territory_index(benchmark, local_backend):
+    index = benchmark(load_territory_index)
+    assert len(index) == len({t["zip_code"] for t in local_backend.tables["broker_territories"]})
@@ -0,0 +1,55 @@
+"""Shared fixtures for the benchmark suite (scripts/benchmarks)."""
+
+import logging
+import os
+import sys
+
+import pytest
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(BENCH_DIR, "..", ".."))
+for path in (ROOT, BENCH_DIR, os.path.join(ROOT, "scripts", "loadtest")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from equity_connect.services.local_backend import LocalClient  # noqa: E402
+from equity_connect.services.supabase import set_supabase_client  # noqa: E402
+from stubs import build_seed_tables  # noqa: E402
+
+# Extra verticals seeded next to reverse_mortgage so prompt queries have to
+# filter a realistically sized prompts table instead of returning everything.
+NOISE_VERTICALS = ("solar", "hvac", "roofing", "windows", "insurance")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_logging():
+    """The services log at INFO/WARNING on every call; keep that out of timings."""
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope="session")
+def seed_tables():
+    tables = build_seed_tables(lead_count=2000)
+    for vertical in NOISE_VERTICALS:
+        extra = build_seed_tables(lead_count=0, vertical=vertical)
+        tables["prompts"].extend(extra["prompts"])
+        tables["prompt_versions"].extend(extra["prompt_versions"])
+        tables["theme_prompts"].extend(extra["theme_prompts"])
+    knowledge = tables["vector_embeddings"]
+    tables["vector_embeddings"] = [
+        dict(row, content=f"{row['content']} (variant {idx})")
+        for idx in range(50)
+        for row in knowledge
+    ]
+    return tables
+
+
+@pytest.fixture
+def local_backend(seed_tables):
+    """Fresh zero-latency LocalClient installed as the shared Supabase client."""
+    client = LocalClient(seed_tables)
+    set_supabase_client(client)
+    yield client
+    set_supabase_client(None)
@@ -0,0 +1,83 @@
+"""
+Realistic, deterministic inputs for the hot-path benchmarks.
+
+Sizes are chosen from what production calls actually look like at the high
+end: a busy broker's two-week calendar, a 30+ minute transcript, a
+conversation_state blob after a full qualify/quote/book flow.
+"""
+
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+HOUR_MS = 60 * 60 * 1000
+
+
+def busy_calendar(days: int = 14, events_per_day: int = 12, seed: int = 7) -> Dict[str, Any]:
+    """Busy events for a search window starting tomorrow 00:00 local time."""
+    rng = random.Random(seed)
+    start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    start_ms = int(start.timestamp() * 1000)
+    events = []
+    for day in range(days):
+        day_start = start_ms + day * 24 * HOUR_MS
+        for _ in range(events_per_day):
+            begin = day_start + rng.randint(8 * 4, 18 * 4) * 15 * 60 * 1000
+            events.append({"start": begin, "end": begin + rng.choice((15, 30, 45, 60)) * 60 * 1000})
+    rng.shuffle(events)
+    return {"start_ms": start_ms, "end_ms": start_ms + days * 24 * HOUR_MS, "busy": events}
+
+
+def long_transcript(messages: int = 400, seed: int = 11) -> List[Dict[str, Any]]:
+    """Alternating user/assistant turns with the occasional tool call."""
+    rng = random.Random(seed)
+    tools = ["verify_caller_identity", "search_knowledge", "check_broker_availability", "book_appointment"]
+    words = ("reverse mortgage equity home spouse payments taxes insurance appraisal "
+             "broker tuesday afternoon property value loan balance").split()
+    transcript = []
+    for idx in range(messages):
+        role = "user" if idx % 2 == 0 else "assistant"
+        msg: Dict[str, Any] = {
+            "role": role,
+            "content": " ".join(rng.choice(words) for _ in range(rng.randint(8, 40))),
+            "timestamp": 1_700_000_000 + idx * 4,
+        }
+        if role == "assistant" and idx % 9 == 1:
+            msg["tool_calls"] = [{"tool_name": rng.choice(tools), "arguments": {"phone": "+15550000001"}}]
+        transcript.append(msg)
+    return transcript
+
+
+def conversation_state(list_items: int = 50) -> Dict[str, Any]:
+    """A conversation_state row late in a call (qualified, quoted, mid-booking)."""
+    return {
+        "phone_number": "5550000001",
+        "lead_id": str(uuid.UUID(int=10_001)),
+        "current_node": "book",
+        "conversation_data": {
+            "verified": True,
+            "qualified": True,
+            "quote_presented": True,
+            "questions_asked": [f"question {i}" for i in range(list_items)],
+            "objections": [{"type": f"objection-{i}", "handled": i % 2 == 0} for i in range(list_items // 5)],
+            "qualification": {"age": 68, "owner_occupied": True, "mortgage_balance": 120000},
+            "quote": {"low": 180000, "high": 240000, "property_value": 650000},
+            "nodes_visited": ["greet", "verify", "qualify", "quote", "answer", "objections"],
+        },
+        "metadata": {"call_id": "bench-call", "direction": "inbound", "tags": [f"t{i}" for i in range(list_items)]},
+    }
+
+
+def conversation_update(list_items: int = 10) -> Dict[str, Any]:
+    """A typical tool-side update: a couple of flags plus list appends with overlap."""
+    return {
+        "current_node": "book",
+        "conversation_data": {
+            "appointment_requested": True,
+            "questions_asked": [f"question {i}" for i in range(list_items)] + ["new question"],
+            "objections": [{"type": "objection-0", "handled": True}, {"type": "cost", "handled": False}],
+            "quote": {"presented_at": "2025-01-01T18:00:00Z"},
+        },
+        "metadata": {"tags": ["t1", "booking"]},
+    }
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Import-time profile of the agent entrypoint (`python -X importtime`).
+
+Usage:
+    # Top packages by cumulative import time, best of 5 fresh interpreters
+    python scripts/benchmarks/importtime.py --runs 5 --top 15
+
+    # Another entrypoint
+    python scripts/benchmarks/importtime.py --module equity_connect.services.calendar_service
+
+bench_startup.py runs the same measurement inside the benchmark suite, so the
+cold-import cost is saved and compared with the other baselines.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(BENCH_DIR, "..", ".."))
+DEFAULT_MODULE = "equity_connect.agent.barbara_agent"
+
+# Loaded by the interpreter before `-c` runs
+STARTUP_PACKAGES = {"site", "sitecustomize", "encodings", "codecs", "io", "abc", "_distutils_hack"}
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def profile_import(module: str = DEFAULT_MODULE) -> Dict[str, Any]:
+    """Import `module` in a fresh interpreter; returns total and per-module times in ms."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.getenv("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            modules[name] = {"self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000}
+    # The module's own entry plus its parent packages (imported first, listed separately);
+    # interpreter startup (site, encodings) is not part of it
+    parts = module.split(".")
+    chain = [".".join(parts[:i]) for i in range(1, len(parts) + 1)]
+    total_ms = sum(modules[name]["cumulative_ms"] for name in chain if name in modules)
+    return {"module": module, "total_ms": total_ms, "modules": modules}
+
+
+def top_packages(profile: Dict[str, Any], count: int = 10) -> List[Dict[str, Any]]:
+    """Packages (first dotted component) ranked by cumulative time of their top-level import."""
+    packages: Dict[str, float] = {}
+    for name, stats in profile["modules"].items():
+        package = name.split(".")[0]
+        if package in STARTUP_PACKAGES:
+            continue
+        # A package's own root import already includes its submodules
+        if name == package or package not in packages:
+            packages[package] = max(packages.get(package, 0.0), stats["cumulative_ms"])
+    ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:count]
+    return [{"package": name, "cumulative_ms": round(ms, 1)} for name, ms in ranked]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import-time profile of the agent entrypoint")
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters; the fastest is reported")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    profiles = [profile_import(args.module) for _ in range(args.runs)]
+    best = min(profiles, key=lambda p: p["total_ms"])
+    totals = sorted(p["total_ms"] for p in profiles)
+    print(f"import {args.module}: best {best['total_ms']:.1f}ms, median {totals[len(totals) // 2]:.1f}ms "
+          f"({args.runs} runs)\n")
+    print(f"{'package':<32}{'cumulative':>12}")
+    for row in top_packages(best, args.top):
+        print(f"{row['package']:<32}{row['cumulative_ms']:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
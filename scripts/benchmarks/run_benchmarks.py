@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Run the hot-path benchmarks, save JSON baselines and flag regressions.
+
+Usage:
+    # Record a baseline (writes scripts/benchmarks/baselines/<name>.json)
+    python scripts/benchmarks/run_benchmarks.py save --name main
+
+    # Re-run and compare against it; exits 1 if anything got >10% slower
+    python scripts/benchmarks/run_benchmarks.py compare --baseline main --threshold 10
+
+    # Compare two existing result files without re-running
+    python scripts/benchmarks/run_benchmarks.py compare --baseline main --current /tmp/branch.json
+
+Extra pytest arguments go after "--", e.g. `save --name main -- -k calendar`.
+Baselines are only comparable on the same machine (see machine_info in the JSON).
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_DIR = os.path.join(BENCH_DIR, "baselines")
+STATS = ("min", "median", "mean")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Hot-path benchmarks with JSON baselines")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    save = sub.add_parser("save", help="Run the suite and store the results as a baseline")
+    save.add_argument("--name", default="local", help="Baseline name (file in baselines/)")
+
+    compare = sub.add_parser("compare", help="Run the suite (or load --current) and diff against a baseline")
+    compare.add_argument("--baseline", default="local", help="Baseline name or path to a JSON file")
+    compare.add_argument("--current", help="Existing results JSON instead of re-running the suite")
+    compare.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent")
+    compare.add_argument("--stat", choices=STATS, default="min",
+                         help="Statistic to compare (min is the least noisy on shared machines)")
+    compare.add_argument("--output", help="Also write the fresh results to this path")
+
+    args, extra = parser.parse_known_args()
+    args.pytest_args = [a for a in extra if a != "--"]
+    return args
+
+
+def baseline_path(name: str) -> str:
+    if name.endswith(".json") or os.sep in name:
+        return name
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+def run_suite(json_path: str, pytest_args: List[str]) -> None:
+    """Run pytest-benchmark from the suite directory so its pytest.ini applies."""
+    command = [sys.executable, "-m", "pytest", "-q", f"--benchmark-json={json_path}", *pytest_args]
+    result = subprocess.run(command, cwd=BENCH_DIR)
+    if result.returncode != 0:
+        sys.exit(result.returncode)
+    strip_raw_samples(json_path)
+
+
+def strip_raw_samples(json_path: str) -> None:
+    """Drop the per-round timings; the summary stats are all a baseline needs."""
+    with open(json_path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    for bench in data.get("benchmarks", []):
+        bench["stats"].pop("data", None)
+    with open(json_path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    return {bench["fullname"]: bench["stats"] for bench in data.get("benchmarks", [])}
+
+
+def compare(baseline: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]],
+            stat: str, threshold: float) -> List[Dict[str, Any]]:
+    rows = []
+    # Benchmarks deselected in this run (e.g. `-- -k calendar`) are not compared.
+    for name in sorted(current):
+        before = baseline.get(name, {}).get(stat)
+        after = current.get(name, {}).get(stat)
+        change: Optional[float] = None
+        if before and after is not None:
+            change = (after - before) / before * 100.0
+        if before is None:
+            status = "new"
+        elif change is None:
+            # A zero baseline (or a missing current value) has no relative change
+            status = "n/a"
+        elif change > threshold:
+            status = "REGRESSION"
+        elif change < -threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append({"name": name, "before": before, "after": after, "change_pct": change, "status": status})
+    return rows
+
+
+def format_us(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 1e6:,.1f}us"
+
+
+def print_report(rows: List[Dict[str, Any]], stat: str, threshold: float) -> None:
+    width = max([len(r["name"]) for r in rows] + [9])
+    print(f"\n{'benchmark':<{width}}  {'baseline':>14}  {'current':>14}  {'change':>9}  status  ({stat}, ±{threshold:g}%)")
+    for row in rows:
+        change = "-" if row["change_pct"] is None else f"{row['change_pct']:+.1f}%"
+        print(f"{row['name']:<{width}}  {format_us(row['before']):>14}  {format_us(row['after']):>14}  "
+              f"{change:>9}  {row['status']}")
+
+
+def main() -> None:
+    args = parse_args()
+
+    if args.command == "save":
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        path = baseline_path(args.name)
+        run_suite(path, args.pytest_args)
+        print(f"\nBaseline written to {path}")
+        return
+
+    base_file = baseline_path(args.baseline)
+    if not os.path.exists(base_file):
+        sys.exit(f"Baseline not found: {base_file} (record one with `save --name {args.baseline}`)")
+
+    current_file = args.current
+    if not current_file:
+        current_file = args.output or os.path.join(tempfile.mkdtemp(prefix="bench-"), "current.json")
+        run_suite(current_file, args.pytest_args)
+
+    rows = compare(load_results(base_file), load_results(current_file), args.stat, args.threshold)
+    print_report(rows, args.stat, args.threshold)
+
+    regressions = [r for r in rows if r["status"] == "REGRESSION"]
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) regressed more than {args.threshold:g}%")
+        sys.exit(1)
+    print(f"\n✅ No regressions above {args.threshold:g}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,27 +28,14 @@ except ImportError:
 	pass
 
 from openai import OpenAI
-from supabase import create_client, Client
+from supabase import Client
 
 from database.scripts.backend_integration import StepCriteriaGenerator
+from equity_connect.services.supabase import get_supabase_client
 
 VERTICAL = os.getenv("STEP_CRITERIA_VERTICAL", "reverse_mortgage")
 
 
-def get_supabase_client() -> Client:
-	url = os.getenv("SUPABASE_URL")
-	key = (
-		os.getenv("SUPABASE_SERVICE_KEY")
-		or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-		or os.getenv("SUPABASE_KEY")
-	)
-
-	if not url or not key:
-		raise RuntimeError("Missing SUPABASE_URL or service role key in environment")
-
-	return create_client(url, key)
-
-
 def fetch_active_nodes(supabase: Client) -> List[Dict[str, Any]]:
 	response = (
 		supabase.table("prompts")
@@ -93,7 +80,7 @@ def fetch_active_nodes(supabase: Client) -> List[Dict[str, Any]]:
 
 
 async def main():
-	supabase = get_supabase_client()
+	supabase = get_supabase_client("background")
 
 	nodes = fetch_active_nodes(supabase)
 	if not nodes:
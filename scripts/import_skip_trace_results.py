@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Import SwarmTrace skip-trace results into leads in bulk.
+
+Usage:
+    python scripts/import_skip_trace_results.py results.json [more.json ...] \
+        --broker-id <uuid>
+
+Each file is a batch_skip_trace / get_skip_trace_job response (its
+`successful` list is used) or a plain JSON list of results; NDJSON (one result
+per line, e.g. saved from POST /skip-trace/stream) works too. Prints the
+inserted / updated / skipped / dnc_blocked / failed counts.
+See equity_connect/services/lead_import.py for the matching rules.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+try:
+    from dotenv import load_dotenv  # type: ignore[reportMissingImports]
+    load_dotenv()
+except ImportError:
+    pass
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from equity_connect.services.lead_import import import_skip_trace_results  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="SwarmTrace result files (JSON or NDJSON)")
+    parser.add_argument("--broker-id", default=None, help="assigned_broker_id for newly inserted leads")
+    parser.add_argument("--source", default="swarmtrace", help="leads.source for newly inserted leads")
+    return parser.parse_args()
+
+
+def load_results(path: str) -> List[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        rows = [json.loads(line) for line in text.splitlines() if line.strip()]
+        return [row for row in rows if "index" in row]  # drops the trailing {"stats": ...} line
+    if isinstance(data, dict):
+        return data.get("successful") or []
+    return data
+
+
+def main() -> None:
+    args = parse_args()
+    results: List[Dict[str, Any]] = []
+    for path in args.paths:
+        results.extend(load_results(path))
+    started = time.monotonic()
+    report = import_skip_trace_results(results, broker_id=args.broker_id, source=args.source)
+    report["results"] = len(results)
+    report["seconds"] = round(time.monotonic() - started, 2)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
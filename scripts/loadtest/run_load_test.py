@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Load generator for BarbaraAgent's /agent (SWML) and /agent/swaig endpoints.
+
+Replays a recorded call scenario (fixtures/*.json) as many simultaneous
+"virtual calls" and steps the concurrency up until the agent saturates.
+
+Usage:
+    # Terminal 1 - agent wired to local stand-ins (see stub_agent.py)
+    python scripts/loadtest/stub_agent.py --leads 500
+
+    # Terminal 2 - drive it
+    python scripts/loadtest/run_load_test.py --concurrency 1,2,4,8,16,32,64 \
+        --duration 30 --output loadtest-report.json
+
+Reports, per concurrency level: throughput, error rate and p50/p95/p99 per
+tool (plus the SWML fetch and post_prompt). The saturation point is the first
+level where errors exceed --max-error-rate, any operation's p95 exceeds
+--p95-slo-ms, or throughput stops growing by at least --min-throughput-gain.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from string import Template
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stubs import synthetic_caller  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay synthetic SignalWire traffic against BarbaraAgent")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8080")
+    parser.add_argument("--username", default=os.getenv("AGENT_USERNAME", "loadtest"))
+    parser.add_argument("--password", default=os.getenv("AGENT_PASSWORD", "loadtest"))
+    parser.add_argument("--scenario", default=os.path.join(FIXTURES_DIR, "inbound_booking.json"))
+    parser.add_argument("--concurrency", default="1,2,4,8,16,32",
+                        help="Comma-separated simultaneous-call levels to step through")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to hold each level")
+    parser.add_argument("--leads", type=int, default=500, help="Seeded lead pool size (match stub_agent --leads)")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Pause between steps of a call")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--p95-slo-ms", type=float, default=2500.0)
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--min-throughput-gain", type=float, default=0.10)
+    parser.add_argument("--output", help="Write the full JSON report here")
+    return parser.parse_args()
+
+
+def load_scenario(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def render_body(body: Dict[str, Any], variables: Dict[str, str]) -> Dict[str, Any]:
+    """Fill $placeholders in a recorded body."""
+    return json.loads(Template(json.dumps(body)).safe_substitute(variables))
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile over an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class LevelRecorder:
+    """Collects latencies and errors for one concurrency level."""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.calls_completed = 0
+
+    def record(self, operation: str, duration_ms: float, ok: bool) -> None:
+        self.latencies[operation].append(duration_ms)
+        if not ok:
+            self.errors[operation] += 1
+
+    def summary(self, concurrency: int, elapsed: float) -> Dict[str, Any]:
+        operations = {}
+        total_requests = 0
+        total_errors = 0
+        for operation, values in self.latencies.items():
+            ordered = sorted(values)
+            total_requests += len(ordered)
+            total_errors += self.errors.get(operation, 0)
+            operations[operation] = {
+                "count": len(ordered),
+                "errors": self.errors.get(operation, 0),
+                "p50_ms": percentile(ordered, 50),
+                "p95_ms": percentile(ordered, 95),
+                "p99_ms": percentile(ordered, 99),
+                "max_ms": ordered[-1] if ordered else None,
+            }
+        return {
+            "concurrency": concurrency,
+            "elapsed_s": round(elapsed, 2),
+            "requests": total_requests,
+            "calls_completed": self.calls_completed,
+            "throughput_rps": round(total_requests / elapsed, 2) if elapsed else 0.0,
+            "calls_per_s": round(self.calls_completed / elapsed, 2) if elapsed else 0.0,
+            "error_rate": round(total_errors / total_requests, 4) if total_requests else 0.0,
+            "operations": operations,
+        }
+
+
+async def run_call(client: httpx.AsyncClient, scenario: Dict[str, Any], caller_index: int,
+                   recorder: LevelRecorder, think_ms: float) -> None:
+    """Replay every step of the scenario as one virtual call."""
+    variables = dict(synthetic_caller(caller_index))
+    variables["call_id"] = str(uuid.uuid4())
+    variables["scheduled_for"] = (datetime.now(timezone.utc) + timedelta(days=3)).replace(
+        hour=18, minute=0, second=0, microsecond=0
+    ).isoformat()
+
+    for step in scenario["steps"]:
+        body = render_body(step["body"], variables)
+        start = time.perf_counter()
+        ok = True
+        try:
+            response = await client.post(step["path"], json=body)
+            ok = response.status_code < 400
+            if ok and step["path"].endswith("/swaig"):
+                ok = "error" not in response.json()
+        except (httpx.HTTPError, ValueError):
+            ok = False
+        recorder.record(step["name"], (time.perf_counter() - start) * 1000, ok)
+        if think_ms:
+            await asyncio.sleep(think_ms / 1000.0)
+    recorder.calls_completed += 1
+
+
+async def run_level(args: argparse.Namespace, scenario: Dict[str, Any], concurrency: int,
+                    caller_ids: "itertools.cycle[int]") -> Dict[str, Any]:
+    recorder = LevelRecorder()
+    limits = httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency * 2)
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        auth=(args.username, args.password),
+        timeout=args.timeout,
+        limits=limits,
+    ) as client:
+        deadline = time.perf_counter() + args.duration
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                await run_call(client, scenario, next(caller_ids), recorder, args.think_ms)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return recorder.summary(concurrency, elapsed)
+
+
+def find_saturation(levels: List[Dict[str, Any]], args: argparse.Namespace) -> Dict[str, Any]:
+    """Return the first level that breaks an SLO and the last one that did not."""
+    previous = None
+    for level in levels:
+        reasons = []
+        if level["error_rate"] > args.max_error_rate:
+            reasons.append(f"error rate {level['error_rate']:.2%} > {args.max_error_rate:.2%}")
+        slow = [
+            f"{name} p95 {stats['p95_ms']:.0f}ms"
+            for name, stats in level["operations"].items()
+            if stats["p95_ms"] is not None and stats["p95_ms"] > args.p95_slo_ms
+        ]
+        if slow:
+            reasons.append(f"p95 over {args.p95_slo_ms:.0f}ms SLO ({', '.join(slow)})")
+        if previous and level["throughput_rps"] < previous["throughput_rps"] * (1 + args.min_throughput_gain):
+            reasons.append(
+                f"throughput plateau ({previous['throughput_rps']} -> {level['throughput_rps']} req/s)"
+            )
+        if reasons:
+            return {
+                "saturated_at": level["concurrency"],
+                "max_sustainable_concurrency": previous["concurrency"] if previous else None,
+                "reasons": reasons,
+            }
+        previous = level
+    return {
+        "saturated_at": None,
+        "max_sustainable_concurrency": previous["concurrency"] if previous else None,
+        "reasons": ["no saturation within tested levels"],
+    }
+
+
+def print_level(level: Dict[str, Any]) -> None:
+    print(
+        f"\n=== concurrency {level['concurrency']}: {level['throughput_rps']} req/s, "
+        f"{level['calls_per_s']} calls/s, errors {level['error_rate']:.2%} ==="
+    )
+    print(f"{'operation':<28}{'count':>7}{'err':>6}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for name, stats in level["operations"].items():
+        print(
+            f"{name:<28}{stats['count']:>7}{stats['errors']:>6}"
+            f"{stats['p50_ms']:>9.0f}{stats['p95_ms']:>9.0f}{stats['p99_ms']:>9.0f}"
+        )
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    scenario = load_scenario(args.scenario)
+    caller_ids = itertools.cycle(range(args.leads))
+    levels = []
+    for concurrency in [int(c) for c in args.concurrency.split(",") if c.strip()]:
+        level = await run_level(args, scenario, concurrency, caller_ids)
+        print_level(level)
+        levels.append(level)
+    saturation = find_saturation(levels, args)
+    return {
+        "scenario": scenario.get("name"),
+        "base_url": args.base_url,
+        "duration_per_level_s": args.duration,
+        "levels": levels,
+        "saturation": saturation,
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    report = asyncio.run(main_async(args))
+    saturation = report["saturation"]
+    print("\n=== SATURATION ===")
+    print(f"Max sustainable concurrency: {saturation['max_sustainable_concurrency']}")
+    print(f"Saturated at: {saturation['saturated_at']}")
+    for reason in saturation["reasons"]:
+        print(f"  - {reason}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
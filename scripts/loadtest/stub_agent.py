@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Run BarbaraAgent against local stand-ins instead of Supabase and Nylas.
+
+Usage:
+    python scripts/loadtest/stub_agent.py --leads 500 --supabase-latency 25:10 \
+        --nylas-latency 150:50
+
+Latency flags take "base_ms" or "base_ms:jitter_ms". Vertex needs no
+stand-in: knowledge search is keyword-only and never requests an embedding. The agent listens on
+--port (default 8080) with AGENT_USERNAME/AGENT_PASSWORD (defaulting to
+loadtest/loadtest) so run_load_test.py can drive /agent and /agent/swaig.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stubs import (  # noqa: E402
+    LatencyProfile,
+    NylasStubServer,
+    StubSupabaseClient,
+    build_seed_tables,
+)
+
+logger = logging.getLogger("loadtest.stub_agent")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run BarbaraAgent with local service stand-ins")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--leads", type=int, default=500, help="Number of synthetic leads to seed")
+    parser.add_argument("--busy-events", type=int, default=60, help="Busy calendar events per broker")
+    parser.add_argument("--supabase-latency", default=os.getenv("STUB_SUPABASE_LATENCY_MS", "20:5"))
+    parser.add_argument("--nylas-latency", default=os.getenv("STUB_NYLAS_LATENCY_MS", "120:40"))
+    parser.add_argument("--fixtures", help="Extra JSON fixtures ({table: [rows]}) loaded on top of the seed data")
+    parser.add_argument("--dump-fixtures", help="Write the synthetic seed tables to this JSON file and exit "
+                                                "(usable as LOCAL_BACKEND_FIXTURES with DATA_BACKEND=memory)")
+    return parser.parse_args()
+
+
+def install_stubs(args: argparse.Namespace) -> NylasStubServer:
+    """Point every service module at the stand-ins. Must run before the agent is built."""
+    nylas_server = NylasStubServer(
+        latency=LatencyProfile.parse(args.nylas_latency),
+        busy_events=args.busy_events,
+    ).start()
+    os.environ["NYLAS_API_URL"] = nylas_server.url
+    os.environ.setdefault("NYLAS_API_KEY", "loadtest")
+    os.environ.setdefault("AGENT_USERNAME", "loadtest")
+    os.environ.setdefault("AGENT_PASSWORD", "loadtest")
+    # Keep queued writes from a previous run out of this one
+    os.environ.setdefault("OUTBOX_PATH", os.path.join(tempfile.mkdtemp(prefix="loadtest-"), "outbox.sqlite3"))
+
+    from equity_connect.services.supabase import set_supabase_client
+
+    client = StubSupabaseClient(
+        build_seed_tables(lead_count=args.leads),
+        latency=LatencyProfile.parse(args.supabase_latency),
+    )
+    if args.fixtures:
+        client.load_fixtures(args.fixtures)
+    set_supabase_client(client)
+
+    logger.info(
+        f"Stand-ins ready: supabase={args.supabase_latency}ms nylas={args.nylas_latency}ms "
+        f"({nylas_server.url}) leads={args.leads}"
+    )
+    return nylas_server
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "WARNING"),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    args = parse_args()
+    if args.dump_fixtures:
+        with open(args.dump_fixtures, "w", encoding="utf-8") as handle:
+            json.dump(build_seed_tables(lead_count=args.leads), handle, indent=2)
+        print(f"Seed tables written to {args.dump_fixtures}")
+        return
+    install_stubs(args)
+
+    from equity_connect.agent.barbara_agent import BarbaraAgent
+
+    agent = BarbaraAgent()
+    agent.run(host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Local stand-ins for the services Barbara talks to during a call.
+
+- StubSupabaseClient: alias for equity_connect.services.local_backend.LocalClient
+- NylasStubServer: tiny HTTP server answering the Nylas v3 events endpoints
+
+Every stand-in takes a LatencyProfile so we can simulate slow upstreams and
+find out where the agent saturates without touching production services.
+"""
+
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from equity_connect.services.local_backend import LatencyProfile, LocalClient  # noqa: E402
+
+# The in-memory Supabase stand-in lives in equity_connect.services.local_backend
+# so benchmarks and DATA_BACKEND=memory share it; kept under the old name here.
+StubSupabaseClient = LocalClient
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# ==================== SEED DATA ====================
+
+BROKER_COUNT = 10
+
+
+def synthetic_caller(index: int) -> Dict[str, str]:
+    """Identity of seeded lead #index; shared by the seed data and the load generator."""
+    last10 = f"555{index:07d}"
+    return {
+        "phone": f"+1{last10}",
+        "last10": last10,
+        "lead_id": str(uuid.UUID(int=10_000 + index)),
+        "broker_id": str(uuid.UUID(int=index % BROKER_COUNT + 1)),
+        "first_name": f"Caller{index}",
+        "zip_code": f"9{index % BROKER_COUNT:02d}{index % 20:02d}",
+    }
+
+
+def build_seed_tables(lead_count: int = 500, vertical: str = "reverse_mortgage") -> Dict[str, List[Dict[str, Any]]]:
+    """Generate a deterministic dataset large enough to exercise every hot path."""
+    from equity_connect.services.agent_config import _get_default_params
+    from equity_connect.services.default_contexts import DEFAULT_CONTEXTS
+
+    rng = random.Random(42)
+    brokers = []
+    territories = []
+    for idx in range(BROKER_COUNT):
+        broker_id = str(uuid.UUID(int=idx + 1))
+        brokers.append({
+            "id": broker_id,
+            "contact_name": f"Broker {idx}",
+            "company_name": f"Lending Co {idx}",
+            "phone": f"+1555000{idx:04d}",
+            "email": f"broker{idx}@example.com",
+            "nmls_number": f"{100000 + idx}",
+            "nylas_grant_id": f"grant-{idx}",
+            "address_city": "Los Angeles",
+            "address_state": "CA",
+            "address_zip": f"900{idx:02d}",
+            "status": "active",
+            "timezone": "America/Los_Angeles",
+            "updated_at": _now(),
+        })
+        for zip_offset in range(20):
+            territories.append({
+                "broker_id": broker_id,
+                "market_name": f"Market {idx}",
+                "zip_code": f"9{idx:02d}{zip_offset:02d}",
+                "priority": rng.randint(1, 10),
+                "active": True,
+            })
+
+    leads = []
+    for idx in range(lead_count):
+        caller = synthetic_caller(idx)
+        leads.append({
+            "id": caller["lead_id"],
+            "first_name": caller["first_name"],
+            "last_name": "Loadtest",
+            "primary_email": f"caller{idx}@example.com",
+            "primary_phone": caller["last10"],
+            "primary_phone_e164": caller["phone"],
+            "property_address": f"{idx} Main St",
+            "property_city": "Los Angeles",
+            "property_state": "CA",
+            "property_zip": "90001",
+            "property_value": 650000,
+            "estimated_equity": 400000,
+            "age": 68,
+            "status": "qualified",
+            "qualified": True,
+            "owner_occupied": True,
+            "assigned_broker_id": caller["broker_id"],
+            "consent": True,
+        })
+
+    prompts = []
+    prompt_versions = []
+    for node_name, context in DEFAULT_CONTEXTS.items():
+        prompt_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"prompt/{vertical}/{node_name}"))
+        step = context["steps"][0]
+        prompts.append({"id": prompt_id, "vertical": vertical, "node_name": node_name, "step_name": step["name"]})
+        prompt_versions.append({
+            "id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"version/{prompt_id}")),
+            "prompt_id": prompt_id,
+            "is_active": True,
+            "is_draft": False,
+            "content": {
+                "instructions": step["text"] + " " + ("Keep it warm and concise. " * 40),
+                "tools": step.get("functions", []),
+                "step_criteria": step.get("step_criteria"),
+                "valid_contexts": context.get("valid_contexts", []),
+            },
+        })
+
+    knowledge = [
+        {
+            "content_type": "reverse_mortgage_kb",
+            "content": f"Reverse mortgage {topic}: " + ("HECM borrowers keep title to the home. " * 20),
+            "metadata": {"topic": topic},
+        }
+        for topic in ("spouse", "equity", "lien", "payoff", "property", "income", "death", "foreclosure")
+    ]
+
+    agent_params = dict(_get_default_params(), vertical=vertical, language="en-US")
+
+    return {
+        "brokers": brokers,
+        "broker_territories": territories,
+        "leads": leads,
+        "prompts": prompts,
+        "prompt_versions": prompt_versions,
+        "theme_prompts": [{
+            "vertical": vertical,
+            "is_active": True,
+            "is_draft": False,
+            "content_structured": {
+                "identity": "You are Barbara, a warm reverse mortgage specialist.",
+                "output_rules": "Speak in short sentences. " * 30,
+                "conversational_flow": "Listen first, then guide. " * 30,
+                "guardrails": "Never give legal advice. " * 20,
+            },
+            "updated_at": _now(),
+        }],
+        "agent_params": [agent_params],
+        "agent_voice_config": [{
+            "vertical": vertical,
+            "language_code": "en-US",
+            "tts_engine": "elevenlabs",
+            "voice_name": "rachel",
+            "model": None,
+            "is_active": True,
+        }],
+        "vector_embeddings": knowledge,
+        "conversation_state": [],
+        "interactions": [],
+        "billing_events": [],
+    }
+
+
+# ==================== NYLAS ====================
+
+class NylasStubServer:
+    """Serves GET/POST /v3/grants/{grant}/events on a background thread."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency: Optional[LatencyProfile] = None, busy_events: int = 60):
+        self.latency = latency or LatencyProfile()
+        self.busy_events = busy_events
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:  # keep load-test output readable
+                pass
+
+            def _send(self, status: int, payload: Dict[str, Any]) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                stub.latency.sleep()
+                if "/events" not in self.path:
+                    self._send(404, {"error": "not found"})
+                    return
+                self._send(200, {"data": stub._busy_events()})
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                stub.latency.sleep()
+                self._send(200, {"data": {"id": f"evt_{uuid.uuid4().hex[:16]}"}})
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "NylasStubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+
+    def _busy_events(self) -> List[Dict[str, Any]]:
+        now = int(time.time())
+        events = []
+        for idx in range(self.busy_events):
+            start = now + idx * 5 * 60 * 60
+            events.append({"when": {"start_time": start, "end_time": start + 45 * 60}})
+        return events
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Upload a Do-Not-Call or litigator list into dnc_numbers.
+
+Usage:
+    python scripts/upload_dnc_list.py numbers.txt [more.csv ...] \
+        --list-type litigator --source federal_dnc
+
+Each file holds one number per line (any formatting; the last 10 digits are
+used) or a CSV whose first column is the number; lines without 10 digits, such
+as a header row, are skipped. Already listed numbers are left alone. Running
+agents pick the new numbers up on their next DNC index reload (DNC_CACHE_TTL_S).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List
+
+try:
+    from dotenv import load_dotenv  # type: ignore[reportMissingImports]
+    load_dotenv()
+except ImportError:
+    pass
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from equity_connect.services.dnc_index import LIST_TYPES, add_dnc_numbers  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="number lists (one per line, or CSV with the number first)")
+    parser.add_argument("--list-type", choices=LIST_TYPES, default="dnc", help="list the numbers belong to")
+    parser.add_argument("--source", default="upload", help="dnc_numbers.source for the uploaded numbers")
+    return parser.parse_args()
+
+
+def load_numbers(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as f:
+        return [line.split(",", 1)[0].strip().strip('"') for line in f if line.strip()]
+
+
+def main() -> None:
+    args = parse_args()
+    numbers: List[str] = []
+    for path in args.paths:
+        numbers.extend(load_numbers(path))
+    started = time.monotonic()
+    written = add_dnc_numbers(numbers, args.list_type, source=args.source)
+    print(json.dumps({
+        "lines": len(numbers),
+        "numbers": written,
+        "list_type": args.list_type,
+        "seconds": round(time.monotonic() - started, 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
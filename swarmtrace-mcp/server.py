@@ -4,18 +4,40 @@ This implementation uses FastMCP with SSE transport so that n8n's MCP client
 can call the server. It supports adaptive concurrency, retries with
 exponential backoff, optional mock mode for testing, and bearer token
 authentication to protect the endpoint.
+
+Batches larger than the 200-property cap of batch_skip_trace run as jobs
+(submit_skip_trace_job). Rows are checkpointed to a local SQLite file as they
+finish, partial results are streamed as MCP progress notifications, and an
+interrupted job (crash, redeploy, insufficient credits) is picked up again with
+resume_skip_trace_job, which only sends the rows that have no result yet.
+
+Both paths send each distinct property once: duplicates within a batch share
+one request, and successful responses are kept in a SQLite result cache
+(RESULT_CACHE_TTL_S) so re-running an enrichment does not bill the same
+address twice.
+
+For large batches POST /skip-trace/stream returns NDJSON instead: each result
+is written as soon as it finishes and only running stats are kept, so memory
+stays flat and the consumer can start on the first rows right away.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
+import math
 import os
+import random
+import sqlite3
 import time
+import uuid
 from collections import defaultdict
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 import httpx
 import uvicorn
@@ -23,7 +45,8 @@ from fastmcp import Context, FastMCP
 from fastmcp.server.http import create_sse_app
 from pydantic import BaseModel, Field, ValidationError, model_validator
 from starlette.middleware import Middleware
-from starlette.responses import PlainTextResponse
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from starlette.routing import Route
 
 
@@ -34,6 +57,7 @@ SWARMTRACE_BASE_URL = "https://skiptracepublicapi.swarmalytics.com"
 SKIPTRACE_ENDPOINT = "/skiptrace"
 MESSAGE_PATH = "/mcp/messages/"
 SSE_PATH = "/mcp/sse"
+STREAM_PATH = "/skip-trace/stream"
 
 
 class PropertyInput(BaseModel):
@@ -122,6 +146,7 @@ class PrimaryContact(BaseModel):
     last_name: str | None = None
     email: str | None = None
     phone: str | None = None
+    dnc_flags: list[str] | None = None  # dnc_litigator_scrub of `phone` when every phone is flagged
 
 
 class SkipTraceResult(BaseModel):
@@ -132,6 +157,7 @@ class SkipTraceResult(BaseModel):
     error: str | None = None
     status_code: int | None = None
     duration_ms: float | None = None
+    cached: bool = False  # served from the result cache or a duplicate in the same batch (not billed)
 
 
 class Stats(BaseModel):
@@ -144,6 +170,12 @@ class Stats(BaseModel):
     min_response_time_ms: float | None
     max_response_time_ms: float | None
     p95_response_time_ms: float | None
+    p50_response_time_ms: float | None = None
+    p90_response_time_ms: float | None = None
+    p99_response_time_ms: float | None = None
+    cache_hits: int = 0
+    cache_misses: int = 0
+    network_failures: int = 0
 
 
 class BatchSkipTraceResponse(BaseModel):
@@ -176,7 +208,7 @@ class BearerAuthMiddleware:
     async def __call__(self, scope, receive, send):
         if scope.get("type") == "http":
             path = scope.get("path", "")
-            if path.startswith(SSE_PATH.rstrip("/")) or path.startswith(MESSAGE_PATH.rstrip("/")):
+            if path.startswith((SSE_PATH.rstrip("/"), MESSAGE_PATH.rstrip("/"), STREAM_PATH)):
                 headers = dict(scope.get("headers", []))
                 auth_header = headers.get(b"authorization")
                 if not auth_header or auth_header.decode("latin1").lower() != self._token:
@@ -204,6 +236,17 @@ def _env_int(key: str, default: int) -> int:
         return default
 
 
+def _env_float(key: str, default: float) -> float:
+    value = os.getenv(key)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Invalid number for %s=%s; using default %s", key, value, default)
+        return default
+
+
 def _normalize_property(raw: dict[str, Any]) -> dict[str, Any]:
     return {
         "property_address": raw.get("property_address") or raw.get("address"),
@@ -215,12 +258,37 @@ def _normalize_property(raw: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
 class SwarmTraceClient:
-    def __init__(self, api_key: str, use_mock_api: bool = False) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        use_mock_api: bool = False,
+        mock_capacity: int = 0,
+        mock_latency_ms: float = 100.0,
+    ) -> None:
         self.api_key = api_key
         self.use_mock_api = use_mock_api
         self.base_url = SWARMTRACE_BASE_URL
         self._client: httpx.AsyncClient | None = None
+        # Mock rate limit: more than mock_capacity concurrent calls get a 429,
+        # and latency climbs as load approaches it (0 = unlimited)
+        self.mock_capacity = mock_capacity
+        self.mock_latency_ms = mock_latency_ms
+        self._mock_in_flight = 0
 
     async def __aenter__(self) -> "SwarmTraceClient":
         if self._client is None:
@@ -238,9 +306,25 @@ class SwarmTraceClient:
             await self._client.aclose()
             self._client = None
 
-    async def skip_trace(self, payload: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+    async def _mock_latency(self) -> bool:
+        """Sleep like the API would under the current load; False when it would rate limit."""
+        self._mock_in_flight += 1
+        try:
+            load = self._mock_in_flight / self.mock_capacity if self.mock_capacity else 0.0
+            if load > 1.0:
+                await asyncio.sleep(self.mock_latency_ms / 10000)
+                return False
+            # Queueing: flat until ~70% of capacity, then climbing steeply
+            await asyncio.sleep(self.mock_latency_ms / 1000 * max(1.0, (load / 0.7) ** 3))
+            return True
+        finally:
+            self._mock_in_flight -= 1
+
+    async def skip_trace(self, payload: dict[str, Any]) -> tuple[int, dict[str, Any], float | None]:
+        """POST one property; returns (status code, body, Retry-After seconds or None)."""
         if self.use_mock_api:
-            await asyncio.sleep(0.1)
+            if not await self._mock_latency():
+                return 429, {"status": {"error": "Too many requests"}}, 1.0
             mock = {
                 "status": {"error": ""},
                 "input": payload,
@@ -271,79 +355,409 @@ class SwarmTraceClient:
                     }
                 ],
             }
-            return 200, mock
+            return 200, mock, None
 
         if self._client is None:
             raise RuntimeError("Client not initialized")
 
         response = await self._client.post(SKIPTRACE_ENDPOINT, json=payload)
-        data = response.json()
-        return response.status_code, data
-
-
-def _compute_stats(results: list[SkipTraceResult]) -> Stats:
-    total = len(results)
-    successful_calls = sum(1 for r in results if r.status_code == 200)
-    billable_hits = sum(1 for r in results if r.primary_contact)
-    api_failures = sum(1 for r in results if r.status_code and r.status_code >= 400)
-    validation_failures = sum(1 for r in results if r.status_code == 0)
-
-    durations = [r.duration_ms for r in results if r.duration_ms is not None]
-    if durations:
-        avg = sum(durations) / len(durations)
-        min_d = min(durations)
-        max_d = max(durations)
-        sorted_d = sorted(durations)
-        p95_index = int(len(sorted_d) * 0.95) - 1
-        p95 = sorted_d[max(p95_index, 0)]
-    else:
-        avg = min_d = max_d = p95 = None
-
-    return Stats(
-        total_properties=total,
-        successful_calls=successful_calls,
-        billable_hits=billable_hits,
-        api_failures=api_failures,
-        validation_failures=validation_failures,
-        avg_response_time_ms=avg,
-        min_response_time_ms=min_d,
-        max_response_time_ms=max_d,
-        p95_response_time_ms=p95,
+        try:
+            data = response.json()
+        except ValueError:
+            # Gateways answer 502/504 with HTML
+            data = {"error": response.text[:200] or response.reason_phrase}
+        return response.status_code, data, _parse_retry_after(response.headers.get("Retry-After"))
+
+
+def _nearest_rank(q: float, count: int) -> int:
+    """1-based rank of quantile `q` among `count` sorted values (nearest-rank definition)."""
+    return max(1, math.ceil(q * count))
+
+
+class LatencyHistogram:
+    """Mergeable streaming quantile sketch for response times (DDSketch-style).
+
+    Values fall into logarithmic buckets `gamma` apart, so every quantile is
+    within `relative_accuracy` of the true value while memory stays at a few
+    hundred counters however many values are recorded. Two sketches merge by
+    adding bucket counts. Quantiles use the nearest-rank definition, so p95 of
+    ten values is the largest one rather than the ninth.
+    """
+
+    QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def record(self, value: float) -> None:
+        key = math.ceil(math.log(max(value, 1e-3)) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        rank = _nearest_rank(q, self.count)
+        seen = 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= rank:
+                estimate = 2 * self.gamma**key / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def summary(self) -> dict[str, Any]:
+        """Count plus p50/p90/p95/p99 in ms, for progress updates."""
+        summary: dict[str, Any] = {"count": self.count}
+        for q in self.QUANTILES:
+            value = self.quantile(q)
+            summary[f"p{int(q * 100)}"] = round(value, 1) if value is not None else None
+        return summary
+
+
+class StatsTally:
+    """Running Stats counters, so a streamed batch keeps no result once it is sent."""
+
+    __slots__ = (
+        "total",
+        "successful_calls",
+        "billable_hits",
+        "api_failures",
+        "validation_failures",
+        "cache_hits",
+        "cache_misses",
+        "network_failures",
+        "latency",
     )
 
+    def __init__(self) -> None:
+        self.total = self.successful_calls = self.billable_hits = 0
+        self.api_failures = self.validation_failures = 0
+        self.cache_hits = self.cache_misses = self.network_failures = 0
+        self.latency = LatencyHistogram()
+
+    def add(self, r: SkipTraceResult) -> None:
+        self.total += 1
+        self.successful_calls += r.status_code == 200 and not r.cached
+        self.billable_hits += bool(r.primary_contact) and not r.cached
+        self.cache_hits += r.cached
+        self.cache_misses += bool(r.status_code) and not r.cached
+        self.network_failures += r.status_code is None and bool(r.error)
+        self.api_failures += bool(r.status_code) and r.status_code >= 400
+        self.validation_failures += r.status_code == 0
+        if r.duration_ms is not None:
+            self.latency.record(r.duration_ms)
+
+    def stats(self, latency: LatencyHistogram | None = None) -> Stats:
+        latency = latency or self.latency
+        return Stats(
+            total_properties=self.total,
+            successful_calls=self.successful_calls,
+            billable_hits=self.billable_hits,
+            api_failures=self.api_failures,
+            validation_failures=self.validation_failures,
+            avg_response_time_ms=latency.mean,
+            min_response_time_ms=latency.min,
+            max_response_time_ms=latency.max,
+            p95_response_time_ms=latency.quantile(0.95),
+            p50_response_time_ms=latency.quantile(0.5),
+            p90_response_time_ms=latency.quantile(0.9),
+            p99_response_time_ms=latency.quantile(0.99),
+            cache_hits=self.cache_hits,
+            cache_misses=self.cache_misses,
+            network_failures=self.network_failures,
+        )
+
+
+def _compute_stats(results: list[SkipTraceResult], latency: LatencyHistogram | None = None) -> Stats:
+    """Stats for a batch or job; `latency` is the sketch kept while it ran, else built from the results."""
+    tally = StatsTally()
+    for r in results:
+        tally.add(r)
+    return tally.stats(latency)
+
 
 @asynccontextmanager
 async def _swarmtrace_client(api_key: str, use_mock: bool) -> AsyncIterator[SwarmTraceClient]:
-    async with SwarmTraceClient(api_key=api_key, use_mock_api=use_mock) as client:
+    async with SwarmTraceClient(
+        api_key=api_key,
+        use_mock_api=use_mock,
+        mock_capacity=config["mock_api_capacity"],
+        mock_latency_ms=config["mock_api_latency_ms"],
+    ) as client:
         yield client
 
 
+class AdaptiveLimiter:
+    """AIMD concurrency limit shared by every SwarmTrace call in the process.
+
+    The per-invocation semaphore caps what a caller asked for; this limit is
+    what the API can take right now. A round is `limit` successful responses;
+    while a round's p95 latency stays within `latency_tolerance` x the best p95
+    seen, the limit doubles (until the first congestion signal) and then grows
+    by one per round. A 429 or a 5xx cuts it by `backoff` and a latency spike
+    by the gentler `latency_backoff`, at most once per round, so a burst of
+    429s from requests sent at the old limit counts as one signal. A
+    Retry-After holds back every new request until it has passed.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        initial: int | None = None,
+        min_limit: int = 1,
+        latency_tolerance: float = 1.5,
+        backoff: float = 0.5,
+        latency_backoff: float = 0.8,
+    ) -> None:
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = float(min(max_limit, max(min_limit, initial or max_limit)))
+        self.slow_start = True
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.latency_backoff = latency_backoff
+        self.in_flight = 0
+        self.decreases = 0
+        self._round = 0
+        self._round_latencies: list[float] = []
+        self._baseline_p95: float | None = None
+        self._paused_until = 0.0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> int:
+        """Wait for a slot; returns the round the request was sent in."""
+        async with self._cond:
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), pause)
+                    except asyncio.TimeoutError:
+                        pass
+                elif self.in_flight < int(self.limit):
+                    break
+                else:
+                    await self._cond.wait()
+            self.in_flight += 1
+            return self._round
+
+    async def release(
+        self,
+        sent_in_round: int,
+        status_code: int,
+        duration_ms: float,
+        retry_after: float | None = None,
+    ) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            if status_code == 429 or status_code >= 500 or status_code == 0:
+                self._decrease(sent_in_round, self.backoff)
+            elif status_code < 400:
+                self._record_latency(sent_in_round, duration_ms)
+            self._cond.notify_all()
+
+    def _record_latency(self, sent_in_round: int, duration_ms: float) -> None:
+        if sent_in_round != self._round:
+            return
+        self._round_latencies.append(duration_ms)
+        if len(self._round_latencies) < max(int(self.limit), 5):
+            return
+        ordered = sorted(self._round_latencies)
+        # Same p95 definition as the reported stats (LatencyHistogram.quantile)
+        p95 = ordered[_nearest_rank(0.95, len(ordered)) - 1]
+        if self._baseline_p95 is None or p95 < self._baseline_p95:
+            self._baseline_p95 = p95
+        else:
+            # Drift up slowly so a lasting change in API latency becomes the new normal
+            self._baseline_p95 += (p95 - self._baseline_p95) * 0.05
+        if p95 > self._baseline_p95 * self.latency_tolerance:
+            self._decrease(sent_in_round, self.latency_backoff)
+            return
+        step = self.limit if self.slow_start else 1
+        self.limit = min(float(self.max_limit), self.limit + step)
+        self._next_round()
+
+    def _decrease(self, sent_in_round: int, factor: float) -> None:
+        if sent_in_round != self._round:
+            return
+        self.limit = max(float(self.min_limit), self.limit * factor)
+        self.slow_start = False
+        self.decreases += 1
+        self._next_round()
+
+    def _next_round(self) -> None:
+        self._round += 1
+        self._round_latencies = []
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "decreases": self.decreases,
+            "baseline_p95_ms": self._baseline_p95,
+        }
+
+
+_limiter: AdaptiveLimiter | None = None
+
+
+def _get_limiter() -> AdaptiveLimiter:
+    global _limiter
+    if _limiter is None:
+        _limiter = AdaptiveLimiter(
+            max_limit=config["adaptive_max_concurrent"],
+            initial=config["adaptive_initial_concurrent"],
+        )
+    return _limiter
+
+
+class Metrics:
+    """Process-wide SwarmTrace counters, served in Prometheus text format on /metrics."""
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.responses: defaultdict[str, int] = defaultdict(int)
+        self.retries = 0
+        self.cache_hits = 0
+
+    def observe(self, status: str, duration_ms: float) -> None:
+        self.latency.record(duration_ms)
+        self.responses[status] += 1
+
+    def render(self) -> str:
+        lines = [
+            "# HELP swarmtrace_request_duration_ms SwarmTrace /skiptrace response time, every attempt",
+            "# TYPE swarmtrace_request_duration_ms summary",
+        ]
+        for q in LatencyHistogram.QUANTILES:
+            value = self.latency.quantile(q)
+            lines.append(f'swarmtrace_request_duration_ms{{quantile="{q}"}} {"NaN" if value is None else round(value, 3)}')
+        lines += [
+            f"swarmtrace_request_duration_ms_sum {round(self.latency.total, 3)}",
+            f"swarmtrace_request_duration_ms_count {self.latency.count}",
+            "# TYPE swarmtrace_responses_total counter",
+            *(f'swarmtrace_responses_total{{status="{status}"}} {count}' for status, count in sorted(self.responses.items())),
+            "# TYPE swarmtrace_retries_total counter",
+            f"swarmtrace_retries_total {self.retries}",
+            "# TYPE swarmtrace_cache_hits_total counter",
+            f"swarmtrace_cache_hits_total {self.cache_hits}",
+            "# TYPE swarmtrace_jobs_running gauge",
+            f"swarmtrace_jobs_running {sum(1 for task in _job_tasks.values() if not task.done())}",
+        ]
+        if _limiter is not None:
+            snapshot = _limiter.snapshot()
+            lines += [
+                "# TYPE swarmtrace_concurrency_limit gauge",
+                f"swarmtrace_concurrency_limit {snapshot['limit']}",
+                "# TYPE swarmtrace_in_flight gauge",
+                f"swarmtrace_in_flight {snapshot['in_flight']}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+_metrics = Metrics()
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class RetryBudget:
+    """Retries one batch or job may spend in total.
+
+    Each row still gets at most RETRY_MAX_ATTEMPTS retries, but when the API is
+    degraded for everyone the budget runs out and rows fail fast instead of
+    multiplying the load.
+    """
+
+    def __init__(self, total: int) -> None:
+        self.remaining = total
+        self.spent = 0
+
+    @classmethod
+    def for_rows(cls, rows: int) -> "RetryBudget":
+        return cls(max(config["retry_budget_min"], int(rows * config["retry_budget_ratio"])))
+
+    def spend(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        self.spent += 1
+        return True
+
+
 async def _call_swarmtrace(
     client: SwarmTraceClient,
     payload: dict[str, Any],
     semaphore: asyncio.Semaphore,
     retries: int,
+    limiter: AdaptiveLimiter | None = None,
+    budget: RetryBudget | None = None,
 ) -> tuple[int, dict[str, Any], float]:
+    """Send one property, retrying 429s, 5xx, timeouts and connection errors.
+
+    Raises the last httpx.TransportError when the row's retries or the batch
+    budget are used up; callers turn that into a failed row.
+    """
+    limiter = limiter or _get_limiter()
     attempt = 0
     delay = 1.0
     async with semaphore:
         while True:
             attempt += 1
+            sent_in_round = await limiter.acquire()
+            status_code, retry_after, transport_error = 0, None, None
             start = time.perf_counter()
-            status_code, data = await client.skip_trace(payload)
-            duration_ms = (time.perf_counter() - start) * 1000
-
-            if status_code == 429 and attempt <= retries:
-                jitter = delay * 0.1
-                sleep_for = delay + jitter
-                await asyncio.sleep(sleep_for)
+            try:
+                status_code, data, retry_after = await client.skip_trace(payload)
+            except httpx.TransportError as exc:  # timeouts, resets, DNS, protocol errors
+                transport_error = exc
+            finally:
+                duration_ms = (time.perf_counter() - start) * 1000
+                await limiter.release(sent_in_round, status_code, duration_ms, retry_after)
+                _metrics.observe(str(status_code) if status_code else "error", duration_ms)
+
+            retryable = transport_error is not None or status_code in RETRYABLE_STATUS_CODES
+            if retryable and attempt <= retries and (budget is None or budget.spend()):
+                _metrics.retries += 1
+                # Capped, fully jittered backoff so retries from one burst don't land
+                # together; the limiter already holds new requests back for any Retry-After
+                await asyncio.sleep(random.uniform(0, min(delay, config["retry_max_delay_s"])))
                 delay *= 2
                 continue
+            if transport_error is not None:
+                raise transport_error
             return status_code, data, duration_ms
 
 
 def _extract_primary_contact(contacts: list[dict[str, Any]]) -> PrimaryContact | None:
-    """Extract lean primary contact data: first name, last name, top email, top phone."""
+    """Extract lean primary contact data: first name, last name, top email, top callable phone."""
     if not contacts:
         return None
     
@@ -364,11 +778,20 @@ def _extract_primary_contact(contacts: list[dict[str, Any]]) -> PrimaryContact |
     if emails and len(emails) > 0:
         email = emails[0].get("email")
     
-    # Extract top-ranked phone (first phone in the list)
+    # Extract top-ranked phone that passed the DNC/litigator scrub; when every
+    # phone is flagged keep the first one with its flags so callers can record it
     phone = None
-    phones = primary.get("phones", [])
-    if phones and len(phones) > 0:
-        phone = phones[0].get("phonenumber")
+    dnc_flags = None
+    phones = [p for p in primary.get("phones") or [] if p.get("phonenumber")]
+    clean = [p for p in phones if not p.get("dnc_litigator_scrub")]
+    if clean:
+        phone = clean[0]["phonenumber"]
+    elif phones:
+        phone = phones[0]["phonenumber"]
+        dnc_flags = [
+            str(flag.get("type") or flag.get("list") or flag) if isinstance(flag, dict) else str(flag)
+            for flag in phones[0]["dnc_litigator_scrub"]
+        ]
     
     # Only return if we have at least some data
     if first_name or last_name or email or phone:
@@ -377,12 +800,20 @@ def _extract_primary_contact(contacts: list[dict[str, Any]]) -> PrimaryContact |
             last_name=last_name,
             email=email,
             phone=phone,
+            dnc_flags=dnc_flags,
         )
     
     return None
 
 
-def _serialize_result(index: int, payload: dict[str, Any], status: int, data: dict[str, Any], duration_ms: float) -> SkipTraceResult:
+def _serialize_result(
+    index: int,
+    payload: dict[str, Any],
+    status: int,
+    data: dict[str, Any],
+    duration_ms: float | None,
+    cached: bool = False,
+) -> SkipTraceResult:
     error_message = None
     contacts = None
     primary_contact = None
@@ -404,6 +835,7 @@ def _serialize_result(index: int, payload: dict[str, Any], status: int, data: di
         error=error_message,
         status_code=status,
         duration_ms=duration_ms,
+        cached=cached,
     )
 
 
@@ -419,6 +851,30 @@ def _serialize_validation_error(index: int, payload: dict[str, Any], error: str)
     )
 
 
+def _network_error_result(index: int, payload: dict[str, Any], exc: Exception) -> SkipTraceResult:
+    return SkipTraceResult(
+        index=index,
+        input=payload,
+        primary_contact=None,
+        contacts=None,
+        error=f"Network error: {type(exc).__name__}: {exc}",
+        status_code=None,
+        duration_ms=None,
+    )
+
+
+def _cancelled_result(index: int, payload: dict[str, Any]) -> SkipTraceResult:
+    return SkipTraceResult(
+        index=index,
+        input=payload,
+        primary_contact=None,
+        contacts=None,
+        error="Cancelled due to upstream error",
+        status_code=0,
+        duration_ms=None,
+    )
+
+
 def _filter_results(results: list[SkipTraceResult]) -> tuple[list[SkipTraceResult], list[SkipTraceResult]]:
     successful: list[SkipTraceResult] = []
     failed: list[SkipTraceResult] = []
@@ -430,6 +886,167 @@ def _filter_results(results: list[SkipTraceResult]) -> tuple[list[SkipTraceResul
     return successful, failed
 
 
+JOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    max_concurrent INTEGER,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_rows (
+    job_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    result TEXT,
+    PRIMARY KEY (job_id, idx)
+);
+"""
+
+
+RESULT_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS result_cache (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+def _connect(path: str, schema: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(schema)
+    return conn
+
+
+class ResultCache:
+    """Successful SwarmTrace responses keyed by the normalized property.
+
+    A property traced within the last `ttl` seconds is answered from here
+    instead of being sent (and billed) again; ttl <= 0 disables the cache.
+    """
+
+    def __init__(self, path: str, ttl: float) -> None:
+        self.ttl = ttl
+        self._conn = _connect(path, RESULT_CACHE_SCHEMA)
+        with self._conn:
+            self._conn.execute("DELETE FROM result_cache WHERE created_at < ?", (time.time() - max(ttl, 0),))
+
+    @staticmethod
+    def key(payload: dict[str, Any]) -> str:
+        """Content address of a _normalize_property() payload (case, spacing and ZIP+4 ignored)."""
+        canonical = {
+            field: " ".join(str(value).lower().split())
+            for field, value in payload.items()
+            if value
+        }
+        if "property_zip" in canonical:
+            canonical["property_zip"] = canonical["property_zip"][:5]
+        return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        if self.ttl <= 0:
+            return None
+        row = self._conn.execute(
+            "SELECT data FROM result_cache WHERE key = ? AND created_at >= ?",
+            (key, time.time() - self.ttl),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, data: dict[str, Any]) -> None:
+        if self.ttl <= 0:
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO result_cache (key, data, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(data), time.time()),
+            )
+
+
+class JobStore:
+    """SQLite checkpoint of skip trace jobs; a row with a result is never sent again."""
+
+    def __init__(self, path: str) -> None:
+        self._conn = _connect(path, JOB_SCHEMA)
+        # Anything still "running" was cut off by a crash or restart
+        self._conn.execute(
+            "UPDATE jobs SET status = 'interrupted', updated_at = ? WHERE status = 'running'",
+            (time.time(),),
+        )
+        self._conn.commit()
+
+    def create(self, properties: list[dict[str, Any]], max_concurrent: int | None) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        rows = []
+        for index, raw in enumerate(properties):
+            try:
+                payload = _normalize_property(PropertyInput.model_validate(raw).model_dump())
+                result = None
+            except ValidationError as exc:
+                payload = _normalize_property(raw if isinstance(raw, dict) else {})
+                message = "; ".join(err["msg"] for err in exc.errors())
+                result = _serialize_validation_error(index, payload, message).model_dump_json()
+            rows.append((job_id, index, json.dumps(payload), result))
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, total, max_concurrent, created_at, updated_at)"
+                " VALUES (?, 'queued', ?, ?, ?, ?)",
+                (job_id, len(rows), max_concurrent, now, now),
+            )
+            self._conn.executemany(
+                "INSERT INTO job_rows (job_id, idx, payload, result) VALUES (?, ?, ?, ?)", rows
+            )
+        return job_id
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        row = self._conn.execute(
+            "SELECT id, status, total, max_concurrent, error, created_at, updated_at FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        keys = ("job_id", "status", "total", "max_concurrent", "error", "created_at", "updated_at")
+        return dict(zip(keys, row))
+
+    def set_status(self, job_id: str, status: str, error: str | None = None) -> None:
+        with self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                (status, error, time.time(), job_id),
+            )
+
+    def pending(self, job_id: str) -> list[tuple[int, dict[str, Any]]]:
+        rows = self._conn.execute(
+            "SELECT idx, payload FROM job_rows WHERE job_id = ? AND result IS NULL ORDER BY idx",
+            (job_id,),
+        )
+        return [(index, json.loads(payload)) for index, payload in rows]
+
+    def completed(self, job_id: str) -> int:
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM job_rows WHERE job_id = ? AND result IS NOT NULL", (job_id,)
+        ).fetchone()[0]
+
+    def record(self, job_id: str, result: SkipTraceResult) -> None:
+        with self._conn:
+            self._conn.execute(
+                "UPDATE job_rows SET result = ? WHERE job_id = ? AND idx = ?",
+                (result.model_dump_json(), job_id, result.index),
+            )
+
+    def results(self, job_id: str, offset: int = 0, limit: int | None = None) -> list[SkipTraceResult]:
+        rows = self._conn.execute(
+            "SELECT result FROM job_rows WHERE job_id = ? AND result IS NOT NULL ORDER BY idx LIMIT ? OFFSET ?",
+            (job_id, -1 if limit is None else limit, offset),
+        )
+        return [SkipTraceResult.model_validate_json(result) for (result,) in rows]
+
+
 def _load_env() -> dict[str, Any]:
     from dotenv import load_dotenv
 
@@ -437,9 +1054,21 @@ def _load_env() -> dict[str, Any]:
     return {
         "api_key": os.environ.get("SWARMTRACE_API_KEY"),
         "max_concurrent_default": _env_int("MAX_CONCURRENT_REQUESTS", 30),
+        "adaptive_initial_concurrent": _env_int("ADAPTIVE_INITIAL_CONCURRENT", 8),
+        "adaptive_max_concurrent": _env_int("ADAPTIVE_MAX_CONCURRENT", 100),
         "retry_max_attempts": _env_int("RETRY_MAX_ATTEMPTS", 3),
+        "retry_max_delay_s": _env_float("RETRY_MAX_DELAY_S", 10.0),
+        "retry_budget_ratio": _env_float("RETRY_BUDGET_RATIO", 0.2),
+        "retry_budget_min": _env_int("RETRY_BUDGET_MIN", 10),
         "enable_debug": _env_bool("ENABLE_DEBUG_LOGGING", False),
         "use_mock_api": _env_bool("USE_MOCK_API", False),
+        "mock_api_capacity": _env_int("MOCK_API_CAPACITY", 0),
+        "mock_api_latency_ms": _env_int("MOCK_API_LATENCY_MS", 100),
+        "job_db_path": os.environ.get("JOB_DB_PATH", "swarmtrace_jobs.sqlite3"),
+        "job_max_properties": _env_int("JOB_MAX_PROPERTIES", 50000),
+        "result_cache_path": os.environ.get("RESULT_CACHE_PATH")
+        or os.environ.get("JOB_DB_PATH", "swarmtrace_jobs.sqlite3"),
+        "result_cache_ttl_s": _env_int("RESULT_CACHE_TTL_S", 30 * 24 * 3600),
         "bearer_token": os.environ.get("MCP_BEARER_TOKEN"),
         "host": os.environ.get("HOST", "0.0.0.0"),
         "port": int(os.environ.get("PORT", "8080")),
@@ -459,6 +1088,16 @@ if not config["api_key"] and not config["use_mock_api"]:
 mcp = FastMCP("SwarmTrace Skip Trace Server")
 
 
+_result_cache: ResultCache | None = None
+
+
+def _get_result_cache() -> ResultCache:
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache(config["result_cache_path"], config["result_cache_ttl_s"])
+    return _result_cache
+
+
 @mcp.tool()
 async def batch_skip_trace(
     properties: list[dict[str, Any]],
@@ -491,26 +1130,39 @@ async def batch_skip_trace(
             max_response_time_ms=None,
             p95_response_time_ms=None,
         )
-        return BatchSkipTraceResponse(successful=[], failed=errors, stats=stats).dict()
+        return BatchSkipTraceResponse(successful=[], failed=errors, stats=stats).model_dump()
 
     effective_max_concurrent = (
         parsed_args.max_concurrent if parsed_args.max_concurrent else config["max_concurrent_default"]
     )
 
     semaphore = asyncio.Semaphore(effective_max_concurrent)
-    tasks = []
     retry_attempts = config["retry_max_attempts"]
+    cache = _get_result_cache()
+
+    # One request per distinct property: duplicates in the batch share it
+    groups: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+    for index, prop in enumerate(parsed_args.properties):
+        payload = _normalize_property(prop.model_dump())
+        groups.setdefault(cache.key(payload), []).append((index, payload))
 
+    budget = RetryBudget.for_rows(len(groups))
+    latency = LatencyHistogram()
+    results: list[SkipTraceResult] = []
     async with _swarmtrace_client(config["api_key"], config["use_mock_api"]) as client:
-        task_map: dict[asyncio.Task[tuple[int, dict[str, Any], float]], tuple[int, dict[str, Any]]] = {}
-        for index, prop in enumerate(parsed_args.properties):
-            payload = _normalize_property(prop.dict())
+        task_map: dict[asyncio.Task[tuple[int, dict[str, Any], float]], str] = {}
+        for key, rows in groups.items():
+            cached = cache.get(key)
+            if cached is not None:
+                results.extend(
+                    _serialize_result(index, payload, 200, cached, None, cached=True) for index, payload in rows
+                )
+                continue
             task = asyncio.create_task(
-                _call_swarmtrace(client, payload, semaphore, retry_attempts)
+                _call_swarmtrace(client, rows[0][1], semaphore, retry_attempts, budget=budget)
             )
-            task_map[task] = (index, payload)
+            task_map[task] = key
 
-        results: list[SkipTraceResult] = []
         api_errors: defaultdict[int, str] = defaultdict(str)
         early_abort = False
 
@@ -518,21 +1170,16 @@ async def batch_skip_trace(
         while pending:
             done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
             for task in done:
-                index, payload = task_map.pop(task)
+                key = task_map.pop(task)
+                rows = groups[key]
                 try:
                     status, data, duration_ms = task.result()
                 except asyncio.CancelledError:
-                    results.append(
-                        SkipTraceResult(
-                            index=index,
-                            input=payload,
-                            primary_contact=None,
-                            contacts=None,
-                            error="Cancelled due to upstream error",
-                            status_code=0,
-                            duration_ms=None,
-                        )
-                    )
+                    results.extend(_cancelled_result(index, payload) for index, payload in rows)
+                    continue
+                except httpx.HTTPError as exc:
+                    # Only this property failed; the rest of the batch carries on
+                    results.extend(_network_error_result(index, payload, exc) for index, payload in rows)
                     continue
 
                 if status == 402:
@@ -542,43 +1189,45 @@ async def batch_skip_trace(
                     for pending_task in pending:
                         pending_task.cancel()
                     pending.clear()
-                    results.append(
-                        _serialize_result(index, payload, status, data, duration_ms)
+                    results.extend(
+                        _serialize_result(index, payload, status, data, duration_ms) for index, payload in rows
                     )
+                    latency.record(duration_ms)
                     break
 
                 if status >= 400:
                     api_errors[status] = data.get("status", {}).get("error") or "API error"
+                elif status == 200:
+                    cache.put(key, data)
 
-                results.append(
-                    _serialize_result(index, payload, status, data, duration_ms)
+                (first_index, first_payload), duplicates = rows[0], rows[1:]
+                results.append(_serialize_result(first_index, first_payload, status, data, duration_ms))
+                results.extend(
+                    _serialize_result(index, payload, status, data, None, cached=True) for index, payload in duplicates
                 )
+                latency.record(duration_ms)
+                if ctx:
+                    await ctx.report_progress(
+                        len(results), len(properties), json.dumps({"latency_ms": latency.summary()})
+                    )
 
             if early_abort:
                 break
 
-        # Collect any remaining cancelled tasks
-        for task, (index, payload) in task_map.items():
-            if task.cancelled():
-                results.append(
-                    SkipTraceResult(
-                        index=index,
-                        input=payload,
-                        primary_contact=None,
-                        contacts=None,
-                        error="Cancelled due to upstream error",
-                        status_code=0,
-                        duration_ms=None,
-                    )
-                )
+        # Everything still mapped was cancelled by the early abort
+        for key in task_map.values():
+            results.extend(_cancelled_result(index, payload) for index, payload in groups[key])
 
         successful, failed = _filter_results(results)
-        stats = _compute_stats(results)
+        stats = _compute_stats(results, latency)
+        _metrics.cache_hits += stats.cache_hits
 
         if ctx:
             meta = {
                 "billable_hits": stats.billable_hits,
                 "successful_calls": stats.successful_calls,
+                "cache_hits": stats.cache_hits,
+                "retries": budget.spent,
                 "failed": len(failed),
             }
             await ctx.info(f"Batch complete: {meta}")
@@ -586,13 +1235,375 @@ async def batch_skip_trace(
         if api_errors and ctx:
             await ctx.warn("Encountered API errors: " + ", ".join(f"{k}:{v}" for k, v in api_errors.items()))
 
-        return BatchSkipTraceResponse(successful=successful, failed=failed, stats=stats).dict()
+        if budget.remaining == 0 and ctx:
+            await ctx.warn(f"Retry budget used up ({budget.spent} retries); later transient failures were not retried")
+
+        return BatchSkipTraceResponse(successful=successful, failed=failed, stats=stats).model_dump()
+
+
+_job_store: JobStore | None = None
+_job_tasks: dict[str, asyncio.Task[None]] = {}
+_job_listeners: defaultdict[
+    str, set[Callable[[SkipTraceResult, LatencyHistogram], Awaitable[None]]]
+] = defaultdict(set)
+
+
+def _get_job_store() -> JobStore:
+    global _job_store
+    if _job_store is None:
+        _job_store = JobStore(config["job_db_path"])
+    return _job_store
+
+
+def _job_summary(job_id: str, include_stats: bool = True) -> dict[str, Any]:
+    store = _get_job_store()
+    job = store.get(job_id)
+    if job is None:
+        raise ValueError(f"Unknown job_id {job_id}")
+    completed = store.completed(job_id)
+    summary = {**job, "completed": completed, "pending": job["total"] - completed}
+    if include_stats:
+        summary["stats"] = _compute_stats(store.results(job_id)).model_dump()
+    return summary
+
+
+async def _notify_job_listeners(job_id: str, result: SkipTraceResult, latency: LatencyHistogram) -> None:
+    for listener in list(_job_listeners.get(job_id, ())):
+        try:
+            await listener(result, latency)
+        except Exception as exc:  # a gone client must not stop the job
+            logger.debug("Dropping progress listener for job %s: %s", job_id, exc)
+            _job_listeners[job_id].discard(listener)
+
+
+async def _run_job(job_id: str) -> None:
+    store = _get_job_store()
+    job = store.get(job_id)
+    pending = store.pending(job_id)
+    max_concurrent = job["max_concurrent"] or config["max_concurrent_default"]
+    semaphore = asyncio.Semaphore(max_concurrent)
+    retry_attempts = config["retry_max_attempts"]
+    cache = _get_result_cache()
+    budget = RetryBudget.for_rows(len(pending))
+    network_failures, network_error = 0, None
+    status, error = "completed", None
+    store.set_status(job_id, "running")
+    logger.info("Job %s: %s of %s rows to skip trace", job_id, len(pending), job["total"])
+
+    # Seeded with the rows finished before a resume, then updated as tasks finish
+    latency = LatencyHistogram()
+    for done_result in store.results(job_id):
+        if done_result.duration_ms is not None:
+            latency.record(done_result.duration_ms)
+
+    async def record(result: SkipTraceResult) -> None:
+        store.record(job_id, result)
+        if result.duration_ms is not None:
+            latency.record(result.duration_ms)
+        if result.cached:
+            _metrics.cache_hits += 1
+        await _notify_job_listeners(job_id, result, latency)
+
+    try:
+        async with _swarmtrace_client(config["api_key"], config["use_mock_api"]) as client:
+            rows = iter(pending)
+            # key -> rows waiting on the one request for that property
+            waiting: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+            in_flight: dict[asyncio.Task[tuple[int, dict[str, Any], float]], str] = {}
+            while True:
+                # Only a window of rows is turned into tasks; the semaphore still caps live requests
+                while status == "completed" and len(in_flight) < max_concurrent * 2:
+                    row = next(rows, None)
+                    if row is None:
+                        break
+                    index, payload = row
+                    key = cache.key(payload)
+                    if key in waiting:
+                        waiting[key].append(row)
+                        continue
+                    cached = cache.get(key)
+                    if cached is not None:
+                        await record(_serialize_result(index, payload, 200, cached, None, cached=True))
+                        continue
+                    waiting[key] = [row]
+                    task = asyncio.create_task(
+                        _call_swarmtrace(client, payload, semaphore, retry_attempts, budget=budget)
+                    )
+                    in_flight[task] = key
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    key = in_flight.pop(task)
+                    group = waiting.pop(key)
+                    if task.cancelled():
+                        continue
+                    try:
+                        status_code, data, duration_ms = task.result()
+                    except httpx.HTTPError as exc:
+                        # Left without a result (so resume_skip_trace_job retries it); the rest carries on
+                        network_failures += len(group)
+                        network_error = f"{network_failures} rows hit network errors, last: {type(exc).__name__}: {exc}"
+                        continue
+                    if status_code == 402:
+                        status = "paused"
+                        error = data.get("status", {}).get("error") or "Insufficient credits"
+                        # Out of credits: the rest would fail too, so stop instead of draining
+                        for pending_task in in_flight:
+                            pending_task.cancel()
+                        continue
+                    if status_code == 200:
+                        cache.put(key, data)
+                    (index, payload), duplicates = group[0], group[1:]
+                    await record(_serialize_result(index, payload, status_code, data, duration_ms))
+                    for index, payload in duplicates:
+                        await record(_serialize_result(index, payload, status_code, data, None, cached=True))
+    except asyncio.CancelledError:
+        store.set_status(job_id, "interrupted", "Server shutting down")
+        raise
+    except Exception as exc:
+        logger.exception("Job %s failed", job_id)
+        status, error = "failed", str(exc)
+
+    if status == "completed" and network_failures:
+        status, error = "paused", network_error
+    store.set_status(job_id, status, error)
+    logger.info("Job %s %s (%s)", job_id, status, error or "all rows traced")
+
+
+def _start_job(job_id: str) -> asyncio.Task[None]:
+    task = _job_tasks.get(job_id)
+    if task is None or task.done():
+        task = asyncio.create_task(_run_job(job_id))
+        _job_tasks[job_id] = task
+    return task
+
+
+async def _watch_job(job_id: str, ctx: Context | None) -> dict[str, Any]:
+    """Stream each finished row as a progress notification until the job stops."""
+    task = _start_job(job_id)
+    listener = None
+    if ctx:
+        store = _get_job_store()
+        completed, total = store.completed(job_id), store.get(job_id)["total"]
+
+        async def listener(result: SkipTraceResult, latency: LatencyHistogram) -> None:
+            nonlocal completed
+            completed += 1
+            message = {"result": result.model_dump(exclude_none=True), "latency_ms": latency.summary()}
+            await ctx.report_progress(completed, total, json.dumps(message))
+
+        _job_listeners[job_id].add(listener)
+    try:
+        # Shielded: a client that disconnects stops watching, not the job
+        await asyncio.shield(task)
+    finally:
+        if listener is not None:
+            _job_listeners[job_id].discard(listener)
+    return _job_summary(job_id)
+
+
+@mcp.tool()
+async def submit_skip_trace_job(
+    properties: list[dict[str, Any]],
+    max_concurrent: int | None = None,
+    wait: bool = True,
+    ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Skip trace a batch of any size as a resumable job.
+
+    With wait=true each finished row is sent as a progress notification (with
+    the job's running p50/p90/p95/p99) and the job summary is returned at the end; with wait=false the job_id comes back
+    right away. Page through results with get_skip_trace_job.
+    """
+    if len(properties) > config["job_max_properties"]:
+        raise ValueError(f"Maximum job size is {config['job_max_properties']} properties")
+    if max_concurrent is not None and not 1 <= max_concurrent <= 100:
+        raise ValueError("max_concurrent must be between 1 and 100")
+
+    job_id = _get_job_store().create(properties, max_concurrent)
+    if ctx:
+        await ctx.info(f"Job {job_id}: {len(properties)} properties queued")
+    _start_job(job_id)
+    if wait:
+        return await _watch_job(job_id, ctx)
+    return _job_summary(job_id, include_stats=False)
+
+
+@mcp.tool()
+async def resume_skip_trace_job(
+    job_id: str,
+    wait: bool = True,
+    ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Continue a paused or interrupted job; rows that already have a result are not sent again."""
+    job = _get_job_store().get(job_id)
+    if job is None:
+        raise ValueError(f"Unknown job_id {job_id}")
+    if ctx:
+        await ctx.info(f"Resuming job {job_id} ({job['status']})")
+    _start_job(job_id)
+    if wait:
+        return await _watch_job(job_id, ctx)
+    return _job_summary(job_id, include_stats=False)
+
+
+@mcp.tool()
+async def get_skip_trace_job(
+    job_id: str,
+    offset: int = 0,
+    limit: int = 200,
+) -> dict[str, Any]:
+    """Job status and stats plus one page of results (by row index)."""
+    summary = _job_summary(job_id)
+    successful, failed = _filter_results(_get_job_store().results(job_id, offset, limit))
+    return {
+        **summary,
+        "offset": offset,
+        "limit": limit,
+        "successful": [r.model_dump() for r in successful],
+        "failed": [r.model_dump() for r in failed],
+    }
+
+
+async def _stream_skip_trace(
+    properties: list[Any],
+    max_concurrent: int,
+    tally: StatsTally,
+) -> AsyncIterator[SkipTraceResult]:
+    """Yield each row's result as soon as it is known (not in input order).
+
+    Rows are validated and sent through a window of max_concurrent * 2 tasks,
+    as in _run_job, so only the rows in that window are held; every yielded
+    result is counted in `tally` and then dropped. Duplicates of a property in
+    flight share its request; later ones hit the result cache. On a 402 the
+    rows not yet sent come back cancelled.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    retry_attempts = config["retry_max_attempts"]
+    cache = _get_result_cache()
+    budget = RetryBudget.for_rows(len(properties))
+    rows = iter(enumerate(properties))
+    # key -> rows waiting on the one request for that property
+    waiting: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+    in_flight: dict[asyncio.Task[tuple[int, dict[str, Any], float]], str] = {}
+    out_of_credits = False
+
+    def counted(result: SkipTraceResult) -> SkipTraceResult:
+        tally.add(result)
+        return result
+
+    async with _swarmtrace_client(config["api_key"], config["use_mock_api"]) as client:
+        try:
+            while True:
+                while not out_of_credits and len(in_flight) < max_concurrent * 2:
+                    row = next(rows, None)
+                    if row is None:
+                        break
+                    index, raw = row
+                    try:
+                        payload = _normalize_property(PropertyInput.model_validate(raw).model_dump())
+                    except ValidationError as exc:
+                        message = "; ".join(err["msg"] for err in exc.errors())
+                        payload = _normalize_property(raw if isinstance(raw, dict) else {})
+                        yield counted(_serialize_validation_error(index, payload, message))
+                        continue
+                    key = cache.key(payload)
+                    if key in waiting:
+                        waiting[key].append((index, payload))
+                        continue
+                    cached = cache.get(key)
+                    if cached is not None:
+                        yield counted(_serialize_result(index, payload, 200, cached, None, cached=True))
+                        continue
+                    waiting[key] = [(index, payload)]
+                    task = asyncio.create_task(
+                        _call_swarmtrace(client, payload, semaphore, retry_attempts, budget=budget)
+                    )
+                    in_flight[task] = key
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    key = in_flight.pop(task)
+                    group = waiting.pop(key)
+                    if task.cancelled():
+                        for index, payload in group:
+                            yield counted(_cancelled_result(index, payload))
+                        continue
+                    try:
+                        status, data, duration_ms = task.result()
+                    except httpx.HTTPError as exc:
+                        for index, payload in group:
+                            yield counted(_network_error_result(index, payload, exc))
+                        continue
+                    if status == 402:
+                        # Out of credits: the rest would fail too
+                        out_of_credits = True
+                        for pending_task in in_flight:
+                            pending_task.cancel()
+                    elif status == 200:
+                        cache.put(key, data)
+                    (index, payload), duplicates = group[0], group[1:]
+                    yield counted(_serialize_result(index, payload, status, data, duration_ms))
+                    for index, payload in duplicates:
+                        yield counted(_serialize_result(index, payload, status, data, None, cached=True))
+
+            for index, raw in rows:
+                yield counted(_cancelled_result(index, _normalize_property(raw if isinstance(raw, dict) else {})))
+        finally:
+            # The consumer went away (or we are done): nothing left in flight may keep billing
+            for task in in_flight:
+                task.cancel()
+            # Counted here so a stream the client dropped midway still reports its hits
+            _metrics.cache_hits += tally.cache_hits
+
+
+async def stream_skip_trace(request: Request):
+    """POST {"properties": [...], "max_concurrent": n} -> NDJSON results as they finish.
+
+    One SkipTraceResult per line (None fields left out), then a final
+    {"stats": ...} line. Unlike batch_skip_trace there is no 200-row cap (up to
+    JOB_MAX_PROPERTIES) and results are not collected, so memory stays flat and
+    a consumer can start writing rows right away. Not resumable: use
+    submit_skip_trace_job when that matters.
+    """
+    try:
+        body = await request.json()
+    except ValueError:
+        return JSONResponse({"error": "Body must be JSON"}, status_code=400)
+    properties = body.get("properties") if isinstance(body, dict) else None
+    if not isinstance(properties, list):
+        return JSONResponse({"error": "properties must be a list"}, status_code=400)
+    if len(properties) > config["job_max_properties"]:
+        return JSONResponse(
+            {"error": f"Maximum stream size is {config['job_max_properties']} properties"}, status_code=400
+        )
+    max_concurrent = body.get("max_concurrent")
+    if max_concurrent is None:
+        max_concurrent = config["max_concurrent_default"]
+    if type(max_concurrent) is not int or not 1 <= max_concurrent <= 100:
+        return JSONResponse({"error": "max_concurrent must be between 1 and 100"}, status_code=400)
+
+    async def lines() -> AsyncIterator[str]:
+        tally = StatsTally()
+        async for result in _stream_skip_trace(properties, max_concurrent, tally):
+            yield result.model_dump_json(exclude_none=True) + "\n"
+        yield json.dumps({"stats": tally.stats().model_dump()}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 def healthcheck(_request):
     return PlainTextResponse("ok")
 
 
+def metrics_endpoint(_request):
+    return PlainTextResponse(_metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 MESSAGE_PATH = "/mcp/messages/"
 SSE_PATH = "/mcp/sse"
 
@@ -608,7 +1619,11 @@ app = create_sse_app(
     sse_path=SSE_PATH,
     auth=None,
     debug=config["enable_debug"],
-    routes=[Route("/health", endpoint=healthcheck, methods=["GET"])],
+    routes=[
+        Route("/health", endpoint=healthcheck, methods=["GET"]),
+        Route("/metrics", endpoint=metrics_endpoint, methods=["GET"]),
+        Route(STREAM_PATH, endpoint=stream_skip_trace, methods=["POST"]),
+    ],
     middleware=middleware_config,
 )
 